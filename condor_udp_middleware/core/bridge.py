@@ -8,26 +8,100 @@ Part of the Condor UDP Middleware project.
 """
 
 import asyncio
+import collections
+import concurrent.futures
 import logging
 import time
 import socket
-import threading
-from typing import Dict, Any, Optional
+from typing import Callable, Dict, Any, List, Optional, Sequence, Tuple, Union
 
 # Import our components (avoiding conflict with Python's io module)
 from condor_udp_middleware.core.settings import MiddlewareSettings
 from condor_udp_middleware.core.converter import UnitConverter
+from condor_udp_middleware.core.mmsg import (
+    HAVE_RECVMMSG, HAVE_SENDMMSG, MSG_DONTWAIT, RecvMmsgBatch, SendMmsgBatch
+)
 
 # Configure logging
 logger = logging.getLogger('bridge')
 
-# Network and threading constants
+# Network constants
 # These values are tuned for optimal performance and stability
 UDP_BUFFER_SIZE = 65535  # Maximum UDP packet size (64KB)
-SOCKET_TIMEOUT = 0.5  # Socket read timeout in seconds (allows periodic checks)
-THREAD_JOIN_TIMEOUT = 2.0  # Maximum time to wait for thread termination in seconds
 MAIN_LOOP_INTERVAL = 1.0  # Main monitoring loop check interval in seconds
 STATUS_LOG_INTERVAL = 30  # Status logging interval in seconds
+RECV_BATCH_SIZE = 32  # Datagrams pulled per recvmmsg() call on Linux
+RECV_BATCH_BUFFER_SIZE = 65507  # Per-datagram buffer for batched receive: the largest IPv4 UDP payload, as the fallback path accepts
+SEND_BATCH_SIZE = 64  # Messages drained from the ring and flushed per sendmmsg() call on Linux
+RING_SIZE = 1024  # Messages buffered between receive and forward (oldest dropped on overflow)
+CONVERT_WORKERS = 1  # Conversion worker threads (a single worker keeps message order)
+INLINE_CONVERT_MAX = 1  # Batches up to this size are converted on the event loop (0 = always use the worker)
+SOCKET_BUFFER_SIZE = 4 * 1024 * 1024  # Requested kernel SO_RCVBUF/SO_SNDBUF to absorb bursts
+HAVE_SENDMSG = hasattr(socket.socket, 'sendmsg')  # Gathered sends; not available on Windows
+DRAIN_STOP_TIMEOUT = 1.0  # Seconds stop() waits for the batch being converted to be forwarded
+SETTINGS_RELOAD_TIMEOUT = 10.0  # Seconds update_settings() waits for a restart on the bridge loop
+VERSIONED_STATUS_SECTIONS = ('input_udp', 'output_udp', 'conversion_stats', 'conversion_settings')  # Listed in status['_versions']
+VOLATILE_STATUS_FIELDS = ('uptime_seconds', 'data_rate_mps', 'send_rate_mps')  # Change every tick; don't bump versions
+DATA_AGE_FIELDS = ('last_received_ago', 'last_sent_ago')  # Only their data-active state bumps versions
+DATA_ACTIVE_TIMEOUT = 5.0  # Seconds after the last message that data still counts as flowing
+
+
+def _version_key(section: Any) -> Any:
+    """
+    Reduce a status section to the fields that should bump its version.
+
+    Fields in VOLATILE_STATUS_FIELDS change on every get_status() call and
+    are left out; DATA_AGE_FIELDS are reduced to whether data is still
+    flowing. The rates are recomputed whenever the counters move anyway.
+
+    Args:
+        section: Status section (non-dict sections are returned as-is)
+
+    Returns:
+        The section's comparable content
+    """
+    if not isinstance(section, dict):
+        return section
+
+    key = {name: value for name, value in section.items() if name not in VOLATILE_STATUS_FIELDS}
+    for name in DATA_AGE_FIELDS:
+        if name in key:
+            ago = key[name]
+            key[name] = ago is not None and ago < DATA_ACTIVE_TIMEOUT
+    return key
+
+
+def _set_socket_buffer(sock: socket.socket, option: int, name: str) -> None:
+    """
+    Request a SOCKET_BUFFER_SIZE kernel buffer and log what was granted.
+
+    Args:
+        sock: Socket to configure
+        option: socket.SO_RCVBUF or socket.SO_SNDBUF
+        name: Option name for log messages
+    """
+    try:
+        sock.setsockopt(socket.SOL_SOCKET, option, SOCKET_BUFFER_SIZE)
+        granted = sock.getsockopt(socket.SOL_SOCKET, option)
+    except OSError as e:
+        logger.warning(f"Could not set {name}: {e}")
+        return
+
+    # The kernel caps the request (net.core.rmem_max / wmem_max on Linux)
+    logger.info(f"{name} requested {SOCKET_BUFFER_SIZE} bytes, granted {granted} bytes")
+
+
+class _ReceiverProtocol(asyncio.DatagramProtocol):
+    """asyncio datagram protocol feeding a MiddlewareUDPReceiver."""
+
+    def __init__(self, receiver: 'MiddlewareUDPReceiver'):
+        self.receiver = receiver
+
+    def datagram_received(self, data: bytes, addr) -> None:
+        self.receiver._on_datagram(data)
+
+    def error_received(self, exc: Exception) -> None:
+        self.receiver._on_error(exc)
 
 
 class MiddlewareUDPReceiver:
@@ -39,7 +113,12 @@ class MiddlewareUDPReceiver:
         self.data_callback = data_callback
         self.socket = None
         self.running = False
-        self.receive_thread = None
+
+        # Event loop integration (set by start_receiving)
+        self._loop = None
+        self._transport = None
+        self._batch = None
+        self._fd = -1  # Socket descriptor, cached for the recvmmsg() reader
 
         # Statistics
         self.messages_received = 0
@@ -48,66 +127,114 @@ class MiddlewareUDPReceiver:
         self.error_count = 0
         self.last_received_time = 0
 
-    def start_receiving(self) -> bool:
-        """Start receiving UDP messages."""
+    async def start_receiving(self) -> bool:
+        """Start receiving UDP messages on the running event loop."""
         try:
             self.socket = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
             self.socket.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
-            self.socket.settimeout(SOCKET_TIMEOUT)
+            self.socket.setblocking(False)
             self.socket.bind((self.host, self.port))
+            _set_socket_buffer(self.socket, socket.SO_RCVBUF, 'SO_RCVBUF')
 
+            self._loop = asyncio.get_running_loop()
             self.running = True
-            self.start_time = time.time()
+            self.start_time = time.monotonic()
 
-            # Start receive thread
-            self.receive_thread = threading.Thread(target=self._receive_loop, daemon=True)
-            self.receive_thread.start()
+            # Batched recvmmsg() straight off the selector where the platform
+            # supports it, otherwise a regular asyncio datagram endpoint
+            if not self._start_batched_reader():
+                self._transport, _ = await self._loop.create_datagram_endpoint(
+                    lambda: _ReceiverProtocol(self), sock=self.socket)
 
             logger.info(f"UDP receiver bound to {self.host}:{self.port}")
             return True
 
         except OSError as e:
             logger.error(f"Error starting UDP receiver: {e}")
+            self.running = False
             return False
 
-    def _receive_loop(self):
-        """Main receive loop."""
-        while self.running:
-            try:
-                data, addr = self.socket.recvfrom(UDP_BUFFER_SIZE)
-                if data:
-                    decoded_message = data.decode('utf-8', errors='ignore')
-                    self.messages_received += 1
-                    self.bytes_received += len(data)
-                    self.last_received_time = time.time()
-
-                    if self.data_callback:
-                        try:
-                            self.data_callback(decoded_message)
-                        except Exception as e:
-                            logger.error(f"Error in callback: {e}")
-                            self.error_count += 1
-
-            except socket.timeout:
-                continue
-            except OSError as e:
-                if self.running:
-                    logger.error(f"UDP receive error: {e}")
-                    self.error_count += 1
-                break
-            except UnicodeDecodeError as e:
-                logger.error(f"Error decoding UDP message: {e}")
+    def _start_batched_reader(self) -> bool:
+        """Register a recvmmsg() reader callback on the event loop, if possible."""
+        if not HAVE_RECVMMSG:
+            return False
+
+        fd = self.socket.fileno()
+        try:
+            self._loop.add_reader(fd, self._read_batch)
+        except NotImplementedError:
+            # Proactor-style loops have no add_reader()
+            return False
+
+        self._fd = fd
+        self._batch = RecvMmsgBatch(RECV_BATCH_SIZE, RECV_BATCH_BUFFER_SIZE)
+        return True
+
+    def _read_batch(self) -> None:
+        """Reader callback pulling up to RECV_BATCH_SIZE datagrams per recvmmsg() call."""
+        batch = self._batch
+        try:
+            count = batch.receive(self._fd, MSG_DONTWAIT)
+        except (OSError, ValueError) as e:
+            self._on_error(e)
+            return
+
+        # Locals for the per-datagram loop; counters are flushed once per batch
+        truncated = batch.truncated
+        view = batch.view
+        dispatch = self._dispatch
+        received = 0
+        received_bytes = 0
+
+        for i in range(count):
+            if truncated(i):
+                logger.warning(f"Dropped UDP message larger than {RECV_BATCH_BUFFER_SIZE} bytes")
                 self.error_count += 1
-            except (ValueError, AttributeError) as e:
-                logger.error(f"Error processing received data: {e}")
+                continue
+            data = bytes(view(i))
+            received += 1
+            received_bytes += len(data)
+            dispatch(data)
+
+        if received:
+            self.messages_received += received
+            self.bytes_received += received_bytes
+            self.last_received_time = time.monotonic()
+
+    def _on_datagram(self, data) -> None:
+        """Account for one received datagram and hand a copy to the data callback."""
+        self.messages_received += 1
+        self.bytes_received += len(data)
+        self.last_received_time = time.monotonic()
+        self._dispatch(bytes(data))
+
+    def _on_error(self, exc: Exception) -> None:
+        """Record a socket-level receive error."""
+        if self.running:
+            logger.error(f"UDP receive error: {exc}")
+            self.error_count += 1
+
+    def _dispatch(self, message: bytes) -> None:
+        """Hand a raw message to the data callback."""
+        if self.data_callback:
+            try:
+                self.data_callback(message)
+            except Exception as e:
+                logger.error(f"Error in callback: {e}")
                 self.error_count += 1
 
     def close(self):
         """Close the UDP receiver."""
         self.running = False
-        if self.receive_thread and self.receive_thread.is_alive():
-            self.receive_thread.join(timeout=THREAD_JOIN_TIMEOUT)
-        if self.socket:
+        if self._batch is not None:
+            self._loop.remove_reader(self._fd)
+            self._batch = None
+            self._fd = -1
+        if self._transport is not None:
+            # The transport owns the socket and closes it
+            self._transport.close()
+            self._transport = None
+        elif self.socket:
             try:
                 self.socket.close()
             except OSError as e:
@@ -115,7 +242,7 @@ class MiddlewareUDPReceiver:
 
     def get_status(self) -> Dict[str, Any]:
         """Get receiver status."""
-        now = time.time()
+        now = time.monotonic()
         uptime = now - self.start_time if self.start_time > 0 else 0
 
         return {
@@ -138,8 +265,16 @@ class MiddlewareUDPSender:
     def __init__(self, target_host: str = '127.0.0.1', target_port: int = 55300):
         self.target_host = target_host
         self.target_port = target_port
+        self.target_key = (target_host, target_port)
         self.socket = None
+        self.source_port = None
         self.connected = False
+        self.active = False
+        self._mmsg = None
+        self._fd = -1  # Socket descriptor, cached for sendmmsg()
+
+        # Per-packet debug logging is only formatted when enabled (rechecked on each start)
+        self._debug = logger.isEnabledFor(logging.DEBUG)
 
         # Statistics
         self.messages_sent = 0
@@ -150,20 +285,42 @@ class MiddlewareUDPSender:
 
     def start_sending(self) -> bool:
         """Initialize the UDP sender."""
+        # The sender is reused across restarts; pick up logging level changes
+        self._debug = logger.isEnabledFor(logging.DEBUG)
+
+        if self.socket is not None:
+            # The connected socket outlives stop/start; only reactivate it
+            self.active = True
+            self.start_time = time.monotonic()
+            return True
+
         try:
             self.socket = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
             self.socket.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+            _set_socket_buffer(self.socket, socket.SO_SNDBUF, 'SO_SNDBUF')
+
+            # Bind once so the source port (and the flow seen by the receiver
+            # and any stateful firewall) stays fixed for the socket's lifetime
+            self.socket.bind(('0.0.0.0', 0))
+            self.source_port = self.socket.getsockname()[1]
+            logger.info(f"UDP sender using source port {self.source_port}")
 
             # Test connectivity
             try:
                 self.socket.connect((self.target_host, self.target_port))
                 self.connected = True
                 logger.info(f"UDP sender initialized for {self.target_host}:{self.target_port}")
+
+                # sendmmsg() relies on the connected peer (no per-message address)
+                if HAVE_SENDMMSG:
+                    self._mmsg = SendMmsgBatch(SEND_BATCH_SIZE)
+                    self._fd = self.socket.fileno()
             except OSError as e:
                 logger.warning(f"Could not validate target address {self.target_host}:{self.target_port}: {e}")
                 self.connected = False
 
-            self.start_time = time.time()
+            self.active = True
+            self.start_time = time.monotonic()
             return True
 
         except OSError as e:
@@ -171,32 +328,167 @@ class MiddlewareUDPSender:
             self.error_count += 1
             return False
 
-    def send_message(self, message: str) -> bool:
-        """Send a UDP message."""
+    def send_message(self, message: Union[bytes, bytearray, memoryview, str]) -> bool:
+        """
+        Send a UDP message.
+
+        Args:
+            message: Encoded message, or text to send as UTF-8
+
+        Returns:
+            bool: True if the message was sent
+        """
+        if not isinstance(message, str):
+            return self.send_bytes(message)
+
+        try:
+            message_bytes = message.encode('utf-8')
+        except UnicodeEncodeError as e:
+            logger.error(f"Error encoding message: {e}")
+            self.error_count += 1
+            return False
+
+        return self.send_bytes(message_bytes)
+
+    def send_bytes(self, message_bytes: Union[bytes, bytearray, memoryview]) -> bool:
+        """Send an already encoded UDP message."""
         if not self.socket:
             logger.error("UDP socket not initialized")
             return False
 
         try:
-            message_bytes = message.encode('utf-8')
-            bytes_sent = self.socket.sendto(message_bytes, (self.target_host, self.target_port))
+            if self.connected:
+                # Kernel already knows the peer; skip the per-call address
+                bytes_sent = self.socket.send(message_bytes)
+            else:
+                # Unvalidated target: reuse the prebuilt address tuple
+                bytes_sent = self.socket.sendto(message_bytes, self.target_key)
 
             self.messages_sent += 1
             self.bytes_sent += bytes_sent
-            self.last_sent_time = time.time()
+            self.last_sent_time = time.monotonic()
 
-            logger.debug(f"Sent {bytes_sent} bytes to {self.target_host}:{self.target_port}")
+            if self._debug:
+                logger.debug(f"Sent {bytes_sent} bytes to {self.target_host}:{self.target_port}")
             return True
 
         except OSError as e:
             logger.error(f"Error sending UDP message: {e}")
             self.error_count += 1
             return False
-        except (UnicodeEncodeError, TypeError) as e:
-            logger.error(f"Error encoding message: {e}")
+
+    def send_iov(self, parts: Sequence[Union[bytes, bytearray, memoryview]]) -> bool:
+        """
+        Send one UDP message assembled from several buffers.
+
+        The parts are handed to sendmsg() as an iovec, so a message built
+        piecewise (e.g. header + payload) is sent without joining it first.
+        Where sendmsg() is unavailable the parts are joined and sent.
+
+        Args:
+            parts: Buffers making up the message, in order
+
+        Returns:
+            bool: True if the message was sent
+        """
+        if not HAVE_SENDMSG:
+            return self.send_bytes(b''.join(parts))
+
+        if not self.socket:
+            logger.error("UDP socket not initialized")
+            return False
+
+        try:
+            if self.connected:
+                bytes_sent = self.socket.sendmsg(parts)
+            else:
+                bytes_sent = self.socket.sendmsg(parts, (), 0, self.target_key)
+
+            self.messages_sent += 1
+            self.bytes_sent += bytes_sent
+            self.last_sent_time = time.monotonic()
+
+            if self._debug:
+                logger.debug(f"Sent {bytes_sent} bytes in {len(parts)} parts to {self.target_host}:{self.target_port}")
+            return True
+
+        except OSError as e:
+            logger.error(f"Error sending UDP message: {e}")
             self.error_count += 1
             return False
 
+    def send_batch(self, payloads: List[bytes]) -> int:
+        """
+        Send several encoded UDP messages, using sendmmsg() where available.
+
+        Args:
+            payloads: Messages to send, in order
+
+        Returns:
+            int: Number of messages sent
+        """
+        if not payloads:
+            return 0
+
+        if self._mmsg is None:
+            return self._send_each(payloads)
+
+        try:
+            sent = self._mmsg.send(self._fd, payloads)
+        except OSError as e:
+            logger.error(f"Error sending UDP messages: {e}")
+            self.error_count += 1
+            return 0
+
+        self.messages_sent += sent
+        self.bytes_sent += sum(len(payload) for payload in payloads[:sent])
+        self.last_sent_time = time.monotonic()
+        return sent
+
+    def _send_each(self, payloads: List[bytes]) -> int:
+        """
+        Send several encoded UDP messages one syscall at a time.
+
+        Fallback for send_batch() without sendmmsg(); statistics are
+        updated once for the whole batch.
+
+        Args:
+            payloads: Messages to send, in order
+
+        Returns:
+            int: Number of messages sent
+        """
+        if not self.socket:
+            logger.error("UDP socket not initialized")
+            return 0
+
+        sock = self.socket
+        connected = self.connected
+        target = self.target_key
+        sent = 0
+        sent_bytes = 0
+
+        for payload in payloads:
+            try:
+                if connected:
+                    sent_bytes += sock.send(payload)
+                else:
+                    sent_bytes += sock.sendto(payload, target)
+                sent += 1
+            except OSError as e:
+                logger.error(f"Error sending UDP message: {e}")
+                self.error_count += 1
+
+        if sent:
+            self.messages_sent += sent
+            self.bytes_sent += sent_bytes
+            self.last_sent_time = time.monotonic()
+        return sent
+
+    def stop_sending(self):
+        """Deactivate the sender, keeping its socket for a later restart."""
+        self.active = False
+
     def close(self):
         """Close the UDP sender."""
         if self.socket:
@@ -205,18 +497,24 @@ class MiddlewareUDPSender:
                 logger.info("UDP sender closed")
             except OSError as e:
                 logger.error(f"Error closing UDP socket: {e}")
+        self.socket = None
+        self.source_port = None
         self.connected = False
+        self.active = False
+        self._mmsg = None
+        self._fd = -1
 
     def get_status(self) -> Dict[str, Any]:
         """Get sender status."""
-        now = time.time()
+        now = time.monotonic()
         uptime = now - self.start_time if self.start_time > 0 else 0
 
         return {
             "target_host": self.target_host,
             "target_port": self.target_port,
+            "source_port": self.source_port,
             "connected": self.connected,
-            "active": bool(self.socket),
+            "active": self.active,
             "messages_sent": self.messages_sent,
             "bytes_sent": self.bytes_sent,
             "error_count": self.error_count,
@@ -236,13 +534,18 @@ class UDPMiddlewareBridge:
     - MiddlewareUDPSender: Sends converted data to target application
     """
 
-    def __init__(self, settings_file: Optional[str] = None):
+    def __init__(self, settings_file: Optional[str] = None,
+                 status_callback: Optional[Callable[[Dict[str, Any]], None]] = None):
         """
         Initialize the middleware bridge.
 
         Args:
             settings_file: Path to settings file (optional)
+            status_callback: Called from the bridge's event loop with get_status()
+                each MAIN_LOOP_INTERVAL while running, and once after start and stop
         """
+        self.status_callback = status_callback
+
         # Load settings
         self.settings = MiddlewareSettings(settings_file)
 
@@ -257,14 +560,35 @@ class UDPMiddlewareBridge:
         self.startup_time = 0
         self.error_count = 0
         self.main_task = None
+        self._loop = None
+
+        # Set when the bridge stops, cleared by start(); created on the loop by the first start()
+        self.stopped_event: Optional[asyncio.Event] = None
+
+        # Receive -> forward ring, drained by a dedicated task
+        self._ring = collections.deque(maxlen=RING_SIZE)
+        self._ring_ready = None
+        self.drain_task = None
+
+        # Conversion runs off the event loop so receiving overlaps with it
+        self._executor = concurrent.futures.ThreadPoolExecutor(
+            max_workers=CONVERT_WORKERS, thread_name_prefix='convert')
 
         # Statistics
         self.messages_processed = 0
         self.messages_converted = 0
         self.messages_forwarded = 0
+        self.messages_dropped = 0
+
+        # Per-section status versions, bumped whenever a section's content changes
+        self._status_versions: Dict[str, int] = {}
+        self._status_sections: Dict[str, Any] = {}
 
     def _init_components(self) -> None:
         """Initialize all components based on settings."""
+        # Cache the debug level check for the per-message path
+        self._debug = logger.isEnabledFor(logging.DEBUG)
+
         # Initialize UDP receiver
         network_settings = self.settings.get('network')
         self.udp_receiver = MiddlewareUDPReceiver(
@@ -274,50 +598,152 @@ class UDPMiddlewareBridge:
         )
 
         # Initialize unit converter
-        conversion_settings = {
-            'enabled': self.settings.get('conversions', 'enabled'),
-            'altitude': self.settings.get('conversions', 'altitude'),
-            'speed': self.settings.get('conversions', 'speed'),
-            'vario': self.settings.get('conversions', 'vario'),
-            'acceleration': self.settings.get('conversions', 'acceleration')
-        }
-        self.unit_converter = UnitConverter(conversion_settings)
-
-        # Initialize UDP sender
-        self.udp_sender = MiddlewareUDPSender(
-            target_host=network_settings.output_host,
-            target_port=network_settings.output_port
-        )
-
-    def _handle_udp_data(self, data: str) -> None:
+        self.unit_converter = UnitConverter(self.settings.get_section_dict('conversions'))
+        self._update_passthrough()
+
+        # Initialize UDP sender, keeping the existing socket if the target is unchanged
+        target_key = (network_settings.output_host, network_settings.output_port)
+        old_sender = getattr(self, 'udp_sender', None)
+        if old_sender is None or old_sender.target_key != target_key:
+            if old_sender is not None:
+                old_sender.close()
+            self.udp_sender = MiddlewareUDPSender(
+                target_host=network_settings.output_host,
+                target_port=network_settings.output_port
+            )
+
+    def _update_passthrough(self) -> None:
+        """Select the passthrough forwarding path when conversions are disabled."""
+        self._passthrough = not self.unit_converter.conversion_settings.get('enabled', True)
+
+    def _handle_udp_data(self, data: bytes) -> None:
         """
-        Process incoming UDP data.
+        Queue incoming UDP data for forwarding.
 
         Args:
             data: Raw UDP message from Condor
         """
+        ring = self._ring
+        if len(ring) == RING_SIZE:
+            # deque(maxlen) evicts the oldest entry on append
+            self.messages_dropped += 1
+        ring.append(data)
+        self._ring_ready.set()
+
+    async def _drain_loop(self) -> None:
+        """Forward queued messages whenever the receiver signals new data."""
+        loop = asyncio.get_running_loop()
+        ring = self._ring
+        ready = self._ring_ready
+        popleft = ring.popleft
+        executor = self._executor
+        convert_batch = self._convert_batch
+        record = self._record_conversions
+        forward = self._forward_batch
         try:
-            # Update statistics
-            self.messages_processed += 1
+            # stop() clears running and sets the event, so the loop exits
+            # once the batch in flight has been forwarded
+            while self.running:
+                await ready.wait()
+                ready.clear()
+
+                # Whatever is queued when we wake up is flushed in batches of
+                # up to SEND_BATCH_SIZE, so batching adds no extra latency.
+                # Larger batches are converted on the worker while the loop
+                # keeps receiving.
+                while ring and self.running:
+                    raw_batch = [popleft() for _ in range(min(len(ring), SEND_BATCH_SIZE))]
+                    try:
+                        if self._passthrough:
+                            # Conversions disabled: forward untouched, no worker hop
+                            self.messages_processed += len(raw_batch)
+                            forward(raw_batch)
+                        elif len(raw_batch) <= INLINE_CONVERT_MAX:
+                            # The usual steady-state case of one message per wakeup:
+                            # converting it here is cheaper than the thread handoff
+                            forward(record(len(raw_batch), convert_batch(raw_batch)))
+                        else:
+                            result = await loop.run_in_executor(executor, convert_batch, raw_batch)
+                            forward(record(len(raw_batch), result))
+                    except Exception as e:
+                        # Anything unexpected costs this batch only; ending the
+                        # task here would silently stop all forwarding
+                        logger.error(f"Error forwarding batch of {len(raw_batch)} messages: {e!r}")
+                        self.error_count += 1
+        except asyncio.CancelledError:
+            logger.info("Drain loop cancelled")
+            raise
 
-            # Convert units
-            converted_message, conversion_info = self.unit_converter.process_message(data)
+    def _convert_batch(self, raw_batch: List[bytes]) -> Tuple[List[bytes], int, int, int, int]:
+        """
+        Convert a batch of UDP messages (may run on the conversion worker).
 
-            # Check if any conversions were applied
-            if conversion_info.get("conversions_applied", 0) > 0:
-                self.messages_converted += 1
-                logger.debug(f"Applied {conversion_info['conversions_applied']} conversions")
+        No shared counters are touched here; the counts are returned and
+        added on the event loop by _record_conversions().
 
-            # Forward converted message
-            if self.udp_sender.send_message(converted_message):
-                self.messages_forwarded += 1
-            else:
-                logger.warning("Failed to forward converted message")
-                self.error_count += 1
+        Args:
+            raw_batch: Raw UDP messages from Condor, in arrival order
 
-        except (KeyError, TypeError, AttributeError) as e:
-            logger.error(f"Error processing UDP data: {e}")
-            self.error_count += 1
+        Returns:
+            Tuple of (messages to forward with failed ones left out, messages
+            converted, conversions applied, converted-variables mask, errors)
+        """
+        convert = self.unit_converter.convert_message
+        messages = []
+        append = messages.append
+        converted = conversions = converted_mask = errors = 0
+        for data in raw_batch:
+            try:
+                message, applied, mask = convert(data)
+            except (KeyError, TypeError, AttributeError) as e:
+                logger.error(f"Error processing UDP data: {e}")
+                errors += 1
+                continue
+
+            if applied > 0:
+                converted += 1
+                conversions += applied
+                converted_mask |= mask
+                if self._debug:
+                    logger.debug(f"Applied {applied} conversions")
+            append(message)
+
+        return messages, converted, conversions, converted_mask, errors
+
+    def _record_conversions(self, processed: int,
+                            result: Tuple[List[bytes], int, int, int, int]) -> List[bytes]:
+        """
+        Add a converted batch's counts to the statistics (on the event loop).
+
+        Args:
+            processed: Number of raw messages in the batch
+            result: Return value of _convert_batch()
+
+        Returns:
+            list: Messages to forward
+        """
+        messages, converted, conversions, converted_mask, errors = result
+        self.messages_processed += processed
+        self.messages_converted += converted
+        self.error_count += errors
+        self.unit_converter.record_statistics(conversions, converted_mask)
+        return messages
+
+    def _forward_batch(self, batch: List[bytes]) -> None:
+        """
+        Forward a batch of converted messages.
+
+        Args:
+            batch: Converted messages, in arrival order
+        """
+        if not batch:
+            return
+
+        sent = self.udp_sender.send_batch(batch)
+        self.messages_forwarded += sent
+        if sent < len(batch):
+            logger.warning(f"Failed to forward {len(batch) - sent} converted messages")
+            self.error_count += len(batch) - sent
 
     async def start(self) -> None:
         """Start the middleware bridge and all components."""
@@ -326,17 +752,25 @@ class UDPMiddlewareBridge:
             return
 
         logger.info("Starting Condor UDP Middleware Bridge...")
-        self.startup_time = time.time()
+        self._loop = asyncio.get_running_loop()
+        self.startup_time = time.monotonic()
         self.running = True
         self.error_count = 0
+        self._debug = logger.isEnabledFor(logging.DEBUG)
 
         # Reset statistics
         self.messages_processed = 0
         self.messages_converted = 0
         self.messages_forwarded = 0
+        self.messages_dropped = 0
+        self._ring.clear()
+        self._ring_ready = asyncio.Event()
+        if self.stopped_event is None:
+            self.stopped_event = asyncio.Event()
+        self.stopped_event.clear()
 
         # Start UDP receiver
-        if not self.udp_receiver.start_receiving():
+        if not await self.udp_receiver.start_receiving():
             logger.error("Failed to start UDP receiver")
             self.error_count += 1
             await self.stop()
@@ -349,7 +783,8 @@ class UDPMiddlewareBridge:
             await self.stop()
             return
 
-        # Start main monitoring loop
+        # Start forwarding and main monitoring loops
+        self.drain_task = asyncio.create_task(self._drain_loop())
         self.main_task = asyncio.create_task(self._main_loop())
 
         logger.info("Bridge started successfully")
@@ -367,6 +802,8 @@ class UDPMiddlewareBridge:
         else:
             logger.info("Unit conversions disabled - passing through original data")
 
+        self._publish_status()
+
     async def stop(self) -> None:
         """Stop the bridge and all components."""
         if not self.running:
@@ -376,7 +813,7 @@ class UDPMiddlewareBridge:
         logger.info("Stopping Condor UDP Middleware Bridge...")
         self.running = False
 
-        # Cancel main task
+        # Cancel the main task
         if self.main_task:
             self.main_task.cancel()
             try:
@@ -384,9 +821,20 @@ class UDPMiddlewareBridge:
             except asyncio.CancelledError:
                 pass
 
-        # Stop UDP sender
+        # Wake the drain task so it forwards the batch in flight and exits;
+        # it is only cancelled if that takes longer than DRAIN_STOP_TIMEOUT
+        if self.drain_task:
+            self._ring_ready.set()
+            try:
+                await asyncio.wait_for(self.drain_task, DRAIN_STOP_TIMEOUT)
+            except asyncio.TimeoutError:
+                logger.warning(f"Drain loop did not finish within {DRAIN_STOP_TIMEOUT}s")
+            except asyncio.CancelledError:
+                pass
+
+        # Stop UDP sender (its socket is kept for the next start)
         try:
-            self.udp_sender.close()
+            self.udp_sender.stop_sending()
             logger.info("UDP sender stopped")
         except (OSError, AttributeError) as e:
             logger.error(f"Error stopping UDP sender: {e}")
@@ -399,6 +847,33 @@ class UDPMiddlewareBridge:
             logger.error(f"Error stopping UDP receiver: {e}")
 
         logger.info("Bridge stopped successfully")
+        self.stopped_event.set()
+        self._publish_status()
+
+    def close(self) -> None:
+        """
+        Release the bridge's sockets and conversion worker once it is no longer needed.
+
+        stop() keeps the sender socket for a later start(); call this once
+        after the final stop().
+        """
+        if self.running:
+            logger.warning("Closing a running bridge; call stop() first")
+
+        self._executor.shutdown()
+
+        try:
+            self.udp_sender.close()
+        except (OSError, AttributeError) as e:
+            logger.error(f"Error closing UDP sender: {e}")
+
+    def _publish_status(self) -> None:
+        """Push the current status to the status callback, if one is set."""
+        if self.status_callback:
+            try:
+                self.status_callback(self.get_status())
+            except Exception as e:
+                logger.error(f"Error in status callback: {e}")
 
     async def _main_loop(self) -> None:
         """Main monitoring loop that checks component status."""
@@ -408,9 +883,10 @@ class UDPMiddlewareBridge:
             while self.running:
                 await self._check_components()
                 await asyncio.sleep(MAIN_LOOP_INTERVAL)
+                self._publish_status()
 
                 # Log status periodically
-                now = time.time()
+                now = time.monotonic()
                 if now - last_status_log > STATUS_LOG_INTERVAL:
                     self._log_status()
                     last_status_log = now
@@ -424,19 +900,17 @@ class UDPMiddlewareBridge:
 
     async def _check_components(self) -> None:
         """Check the status of all components and handle issues."""
-        # Check UDP receiver
-        receiver_status = self.udp_receiver.get_status()
-        if not receiver_status["running"]:
+        # Read component state directly; get_status() builds full dicts and is
+        # kept for the external status API and the periodic status log
+        if not self.udp_receiver.running:
             logger.warning("UDP receiver not running")
 
-        # Check UDP sender
-        sender_status = self.udp_sender.get_status()
-        if not sender_status["active"]:
+        if not self.udp_sender.active:
             logger.warning("UDP sender not active")
 
         # Check if we're processing data
         if self.messages_processed > 0:
-            data_age = time.time() - self.udp_receiver.last_received_time
+            data_age = time.monotonic() - self.udp_receiver.last_received_time
             if data_age > 10.0:
                 logger.warning(f"No data received for {data_age:.1f} seconds")
 
@@ -448,7 +922,7 @@ class UDPMiddlewareBridge:
 
         logger.info("Bridge Status:")
         logger.info(f"  Running: {self.running}")
-        logger.info(f"  Uptime: {time.time() - self.startup_time:.1f} seconds")
+        logger.info(f"  Uptime: {time.monotonic() - self.startup_time:.1f} seconds")
         logger.info(f"  Errors: {self.error_count}")
 
         logger.info("UDP Receiver:")
@@ -465,6 +939,7 @@ class UDPMiddlewareBridge:
         logger.info(f"  Processed: {self.messages_processed}")
         logger.info(f"  Converted: {self.messages_converted}")
         logger.info(f"  Forwarded: {self.messages_forwarded}")
+        logger.info(f"  Dropped: {self.messages_dropped}")
         logger.info(f"  Total conversions: {converter_stats['total_conversions_applied']}")
 
     def get_status(self) -> Dict[str, Any]:
@@ -482,10 +957,10 @@ class UDPMiddlewareBridge:
         # Build status dictionary
         result = {
             "running": self.running,
-            "uptime": time.time() - self.startup_time if self.startup_time > 0 else 0,
+            "uptime": time.monotonic() - self.startup_time if self.startup_time > 0 else 0,
             "error_count": self.error_count,
             "data_active": receiver_status['running'] and (
-                        receiver_status.get('last_received_ago') or float('inf')) < 5.0,
+                        receiver_status.get('last_received_ago') or float('inf')) < DATA_ACTIVE_TIMEOUT,
 
             # Component status
             "input_udp": receiver_status,
@@ -495,21 +970,74 @@ class UDPMiddlewareBridge:
             "messages_processed": self.messages_processed,
             "messages_converted": self.messages_converted,
             "messages_forwarded": self.messages_forwarded,
+            "messages_dropped": self.messages_dropped,
 
             # Conversion statistics
             "conversion_stats": converter_stats,
 
             # Current settings
-            "conversion_settings": self.settings.get('conversions').__dict__,
-            "network_settings": self.settings.get('network').__dict__
+            "conversion_settings": self.settings.get_section_dict('conversions'),
+            "network_settings": self.settings.get_section_dict('network')
         }
 
+        result["_versions"] = self._section_versions(result)
         return result
 
+    def _section_versions(self, status: Dict[str, Any]) -> Dict[str, int]:
+        """
+        Work out the version of each VERSIONED_STATUS_SECTIONS entry.
+
+        A section's version goes up by one each time its content, apart from
+        per-tick fields (see _version_key()), differs from the previous
+        get_status() call, so consumers can skip sections whose version they
+        have already seen.
+
+        Args:
+            status: Status dictionary being built
+
+        Returns:
+            dict: Section name -> version (a new dict on every call)
+        """
+        for name in VERSIONED_STATUS_SECTIONS:
+            section = _version_key(status.get(name))
+            if name not in self._status_versions or section != self._status_sections[name]:
+                self._status_sections[name] = section
+                self._status_versions[name] = self._status_versions.get(name, 0) + 1
+
+        return dict(self._status_versions)
+
     def update_settings(self, new_settings_file: Optional[str] = None) -> bool:
         """
         Update settings and reconfigure components.
 
+        Safe to call from any thread other than the bridge's event loop; a
+        running bridge is restarted on its own loop, waiting at most
+        SETTINGS_RELOAD_TIMEOUT seconds. Coroutines already on that loop
+        should await update_settings_async() instead.
+
+        Args:
+            new_settings_file: Path to new settings file (optional)
+
+        Returns:
+            bool: True if settings were updated successfully
+        """
+        loop = self._loop
+        if self.running and loop is not None and loop.is_running():
+            future = asyncio.run_coroutine_threadsafe(self.update_settings_async(new_settings_file), loop)
+            try:
+                return future.result(SETTINGS_RELOAD_TIMEOUT)
+            except concurrent.futures.TimeoutError:
+                # The loop stopped or stalled; don't leave the caller blocked on it
+                future.cancel()
+                logger.error(f"Timed out after {SETTINGS_RELOAD_TIMEOUT}s waiting for the bridge to apply new settings")
+                return False
+
+        return self._reload_settings(new_settings_file)
+
+    async def update_settings_async(self, new_settings_file: Optional[str] = None) -> bool:
+        """
+        Update settings and reconfigure components from the bridge's event loop.
+
         Args:
             new_settings_file: Path to new settings file (optional)
 
@@ -519,12 +1047,27 @@ class UDPMiddlewareBridge:
         # Stop if running
         was_running = self.running
         if was_running:
-            # Use asyncio to stop properly
-            loop = asyncio.new_event_loop()
-            asyncio.set_event_loop(loop)
-            loop.run_until_complete(self.stop())
-            loop.close()
+            await self.stop()
 
+        if not self._reload_settings(new_settings_file):
+            return False
+
+        # Restart if was running
+        if was_running:
+            await self.start()
+
+        return True
+
+    def _reload_settings(self, new_settings_file: Optional[str] = None) -> bool:
+        """
+        Load settings and rebuild components (bridge must not be running).
+
+        Args:
+            new_settings_file: Path to new settings file (optional)
+
+        Returns:
+            bool: True if settings were loaded successfully
+        """
         # Load new settings
         if new_settings_file:
             success = self.settings.load(new_settings_file)
@@ -541,13 +1084,6 @@ class UDPMiddlewareBridge:
         # Reinitialize components
         self._init_components()
 
-        # Restart if was running
-        if was_running:
-            loop = asyncio.new_event_loop()
-            asyncio.set_event_loop(loop)
-            loop.run_until_complete(self.start())
-            loop.close()
-
         logger.info("Settings updated successfully")
         return True
 
@@ -559,18 +1095,28 @@ class UDPMiddlewareBridge:
             new_conversion_settings: New conversion settings
         """
         # Update settings object
-        for key, value in new_conversion_settings.items():
-            self.settings.set('conversions', key, value)
-
-        # Update converter
-        conversion_dict = {
-            'enabled': self.settings.get('conversions', 'enabled'),
-            'altitude': self.settings.get('conversions', 'altitude'),
-            'speed': self.settings.get('conversions', 'speed'),
-            'vario': self.settings.get('conversions', 'vario'),
-            'acceleration': self.settings.get('conversions', 'acceleration')
-        }
+        self.settings.update('conversions', new_conversion_settings)
+
+        # Update converter, unless nothing actually changed
+        conversion_dict = self.settings.get_section_dict('conversions')
+        if conversion_dict == self.unit_converter.conversion_settings:
+            logger.debug("Conversion settings unchanged")
+            return
+
         self.unit_converter.update_settings(conversion_dict)
+        self._update_passthrough()
 
         logger.info(f"Conversion settings updated: {new_conversion_settings}")
 
+    async def update_conversion_settings_async(self, new_conversion_settings: Dict[str, Any]) -> None:
+        """
+        Update conversion settings from the bridge's event loop.
+
+        Lets other threads apply the change in order with message forwarding,
+        via asyncio.run_coroutine_threadsafe().
+
+        Args:
+            new_conversion_settings: New conversion settings
+        """
+        self.update_conversion_settings(new_conversion_settings)
+
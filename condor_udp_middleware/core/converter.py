@@ -7,20 +7,93 @@ Handles conversion of units for different variables based on user preferences.
 Part of the Condor UDP Middleware project.
 """
 
-import re
 import logging
 import string
+from types import MappingProxyType
 from typing import Dict, Any, Optional, List, Tuple
 
 # Configure logging
 logger = logging.getLogger('converter')
 
+# Validation constants
+MAX_MESSAGE_SIZE = 65535  # Maximum UDP packet size
+MIN_MESSAGE_SIZE = 5  # Minimum reasonable message size (e.g., "a=1")
+# Allow alphanumeric, underscore, equals, dot, minus, plus, newline, space, scientific notation
+VALID_MESSAGE_BYTES = (string.ascii_letters + string.digits + '_=.-+\n\r\t eE').encode('ascii')
+
+# Variable mappings and their conversion types
+VARIABLE_MAPPINGS = MappingProxyType({
+    # Altitude variables (meters by default in Condor)
+    "altitude": "altitude",
+    "height": "altitude",
+    "wheelheight": "altitude",
+
+    # Speed variables (m/s by default in Condor)
+    "airspeed": "speed",
+    "vx": "speed",
+    "vy": "speed",
+    "vz": "speed",
+
+    # Vario variables (m/s by default in Condor)
+    "vario": "vario",
+    "evario": "vario",
+    "nettovario": "vario",
+
+    # Acceleration variables (m/s² by default in Condor)
+    "ax": "acceleration",
+    "ay": "acceleration",
+    "az": "acceleration"
+})
+
+# Bit per convertible variable, used to track which variables were ever converted
+VARIABLE_BITS = MappingProxyType({name: 1 << i for i, name in enumerate(VARIABLE_MAPPINGS)})
+
+# Conversion factors
+CONVERSION_FACTORS = MappingProxyType({
+    "altitude": MappingProxyType({
+        "meters_to_feet": 3.28084,
+        "feet_to_meters": 0.3048
+    }),
+    "speed": MappingProxyType({
+        "mps_to_kmh": 3.6,
+        "mps_to_knots": 1.94384,
+        "kmh_to_mps": 0.277778,
+        "kmh_to_knots": 0.539957,
+        "knots_to_mps": 0.514444,
+        "knots_to_kmh": 1.852
+    }),
+    "vario": MappingProxyType({
+        "mps_to_fpm": 196.85,
+        "fpm_to_mps": 0.00508
+    }),
+    "acceleration": MappingProxyType({
+        "mps2_to_fps2": 3.28084,
+        "fps2_to_mps2": 0.3048
+    })
+})
+
+# Conversion factor to apply for each supported target unit
+# (None means the unit is Condor's native unit and needs no conversion)
+UNIT_FACTOR_KEYS = MappingProxyType({
+    "altitude": MappingProxyType({"meters": None, "feet": "meters_to_feet"}),
+    "speed": MappingProxyType({"mps": None, "kmh": "mps_to_kmh", "knots": "mps_to_knots"}),
+    "vario": MappingProxyType({"mps": None, "fpm": "mps_to_fpm"}),
+    "acceleration": MappingProxyType({"mps2": None, "fps2": "mps2_to_fps2"})
+})
+
 
 class UnitConverter:
     """
     Handles unit conversions for Condor simulator data.
     Converts between different unit systems based on user preferences.
     """
+
+    __slots__ = (
+        'conversion_settings',
+        '_factor_by_variable',
+        'conversions_applied',
+        '_converted_mask'
+    )
     
     def __init__(self, conversion_settings: Dict[str, str]):
         """
@@ -32,66 +105,14 @@ class UnitConverter:
         """
         self.conversion_settings = conversion_settings
         
-        # Compiled regex for key=value pairs (reused from original parser)
-        self.kv_pattern = re.compile(r'([a-zA-Z_]+)=([-+]?[0-9]*\.?[0-9]+(?:[eE][-+]?[0-9]+)?)')
-        
-        # Define variable mappings and their conversion types
-        self.variable_mappings = {
-            # Altitude variables (meters by default in Condor)
-            "altitude": "altitude",
-            "height": "altitude", 
-            "wheelheight": "altitude",
-            
-            # Speed variables (m/s by default in Condor)
-            "airspeed": "speed",
-            "vx": "speed",
-            "vy": "speed", 
-            "vz": "speed",
-            
-            # Vario variables (m/s by default in Condor)
-            "vario": "vario",
-            "evario": "vario",
-            "nettovario": "vario",
-            
-            # Acceleration variables (m/s² by default in Condor)
-            "ax": "acceleration",
-            "ay": "acceleration",
-            "az": "acceleration"
-        }
-        
-        # Conversion factors
-        self.conversion_factors = {
-            "altitude": {
-                "meters_to_feet": 3.28084,
-                "feet_to_meters": 0.3048
-            },
-            "speed": {
-                "mps_to_kmh": 3.6,
-                "mps_to_knots": 1.94384,
-                "kmh_to_mps": 0.277778,
-                "kmh_to_knots": 0.539957,
-                "knots_to_mps": 0.514444,
-                "knots_to_kmh": 1.852
-            },
-            "vario": {
-                "mps_to_fpm": 196.85,
-                "fpm_to_mps": 0.00508
-            },
-            "acceleration": {
-                "mps2_to_fps2": 3.28084,
-                "fps2_to_mps2": 0.3048
-            }
-        }
+        # Variable (as bytes) -> factor for the current settings (identity conversions omitted)
+        self._factor_by_variable = self._build_factor_table()
         
         # Statistics
         self.conversions_applied = 0
-        self.variables_converted = set()
-
-        # Validation constants
-        self.max_message_size = 65535  # Maximum UDP packet size
-        self.min_message_size = 5  # Minimum reasonable message size (e.g., "a=1")
+        self._converted_mask = 0  # OR of VARIABLE_BITS for every variable converted so far
 
-    def _validate_message(self, message: str) -> Tuple[bool, str]:
+    def _validate_message(self, message: bytes) -> Tuple[bool, str]:
         """
         Validate UDP message format and content.
 
@@ -106,30 +127,29 @@ class UnitConverter:
             return False, "Message is empty or None"
 
         # Check message size bounds
-        if len(message) < self.min_message_size:
-            return False, f"Message too short (min {self.min_message_size} chars)"
+        if len(message) < MIN_MESSAGE_SIZE:
+            return False, f"Message too short (min {MIN_MESSAGE_SIZE} chars)"
 
-        if len(message) > self.max_message_size:
-            return False, f"Message too large (max {self.max_message_size} chars)"
+        if len(message) > MAX_MESSAGE_SIZE:
+            return False, f"Message too large (max {MAX_MESSAGE_SIZE} chars)"
 
-        # Check if message contains only valid characters
-        # Allow alphanumeric, underscore, equals, dot, minus, plus, newline, space, scientific notation
-        valid_chars = set(string.ascii_letters + string.digits + '_=.-+\n\r\t eE')
-        if not all(c in valid_chars for c in message):
+        # Check if message contains only valid characters (anything left after
+        # deleting the valid bytes is invalid)
+        if message.translate(None, VALID_MESSAGE_BYTES):
             return False, "Message contains invalid characters"
 
         # Check if message has at least one key=value pair
-        if '=' not in message:
+        if b'=' not in message:
             return False, "Message has no key=value pairs"
 
         return True, ""
 
-    def process_message(self, original_message: str) -> Tuple[str, Dict[str, Any]]:
+    def process_message(self, original_message: bytes) -> Tuple[bytes, Dict[str, Any]]:
         """
         Process a UDP message, applying unit conversions.
 
         Args:
-            original_message: Original UDP message from Condor
+            original_message: Original UDP message from Condor (raw bytes)
 
         Returns:
             Tuple of (converted_message, conversion_info)
@@ -141,183 +161,195 @@ class UnitConverter:
                 logger.warning(f"Invalid message format: {error_msg}")
                 return original_message, {"error": error_msg, "validation_failed": True}
 
-            # Extract all key=value pairs
-            pairs = self.kv_pattern.findall(original_message)
-            if not pairs:
+            conversion_info = {
+                "conversions_applied": 0,
+                "variables_converted": [],
+                "conversions_detail": {}
+            }
+
+            converted_message, conversions, converted_mask = self._convert_message(original_message, conversion_info)
+            if converted_message is None:
                 return original_message, {"error": "No key=value pairs found"}
-            
-            # Convert to dictionary for processing
-            data_dict = {key: self._convert_value(value) for key, value in pairs}
-            
-            # Apply conversions
-            converted_dict, conversion_info = self._apply_conversions(data_dict)
-            
-            # Rebuild message in original format
-            converted_message = self._rebuild_message(converted_dict)
-            
-            # Update statistics
-            if conversion_info["conversions_applied"] > 0:
-                self.conversions_applied += conversion_info["conversions_applied"]
-                self.variables_converted.update(conversion_info["variables_converted"])
+
+            self.record_statistics(conversions, converted_mask)
 
             return converted_message, conversion_info
 
         except (AttributeError, KeyError, TypeError, ValueError) as e:
             logger.error(f"Error processing message: {e}")
             return original_message, {"error": str(e)}
-    
-    def _convert_value(self, value_str: str) -> float:
-        """Convert string value to float."""
+
+    def process_message_fast(self, original_message: bytes) -> Tuple[bytes, int]:
+        """
+        Process a UDP message without building per-conversion details.
+
+        For forwarding at line rate; statistics are still updated.
+
+        Args:
+            original_message: Original UDP message from Condor (raw bytes)
+
+        Returns:
+            Tuple of (converted_message, conversions_applied)
+        """
+        converted_message, conversions, converted_mask = self.convert_message(original_message)
+        self.record_statistics(conversions, converted_mask)
+        return converted_message, conversions
+
+    def convert_message(self, original_message: bytes) -> Tuple[bytes, int, int]:
+        """
+        Convert a UDP message without touching statistics.
+
+        A message with nothing to convert is returned as the same bytes
+        object, unchanged. Safe to run on a worker thread; the caller passes
+        the counts to record_statistics() on the thread that owns the converter.
+
+        Args:
+            original_message: Original UDP message from Condor (raw bytes)
+
+        Returns:
+            Tuple of (converted_message, conversions_applied, converted_mask)
+        """
         try:
-            return float(value_str)
-        except ValueError:
-            logger.warning(f"Could not convert value to float: {value_str}")
-            return 0.0
-    
-    def _apply_conversions(self, data: Dict[str, float]) -> Tuple[Dict[str, float], Dict[str, Any]]:
+            is_valid, error_msg = self._validate_message(original_message)
+            if not is_valid:
+                logger.warning(f"Invalid message format: {error_msg}")
+                return original_message, 0, 0
+
+            converted_message, conversions, converted_mask = self._convert_message(original_message, None)
+            if converted_message is None or not conversions:
+                # Nothing converted: forward the raw bytes untouched
+                return original_message, 0, 0
+
+            return converted_message, conversions, converted_mask
+
+        except (AttributeError, KeyError, TypeError, ValueError) as e:
+            logger.error(f"Error processing message: {e}")
+            return original_message, 0, 0
+
+    def record_statistics(self, conversions: int, converted_mask: int) -> None:
         """
-        Apply unit conversions to data dictionary.
-        
+        Add conversions to the statistics.
+
         Args:
-            data: Dictionary of variable names to values
-            
+            conversions: Number of conversions applied
+            converted_mask: OR of VARIABLE_BITS for the variables converted
+        """
+        if conversions:
+            self.conversions_applied += conversions
+            self._converted_mask |= converted_mask
+
+    def _convert_message(self, message: bytes,
+                         conversion_info: Optional[Dict[str, Any]]) -> Tuple[Optional[bytes], int, int]:
+        """
+        Convert a validated message.
+
+        Args:
+            message: Validated UDP message
+            conversion_info: Conversion info to fill in, or None to skip the details
+
         Returns:
-            Tuple of (converted_data, conversion_info)
+            Tuple of (converted_message or None if no pairs were found,
+            conversions_applied, converted_mask)
         """
-        converted_data = data.copy()
-        conversion_info = {
-            "conversions_applied": 0,
-            "variables_converted": [],
-            "conversions_detail": {}
-        }
-        
-        # Skip if conversions are disabled
-        if not self.conversion_settings.get("enabled", True):
-            return converted_data, conversion_info
-        
-        for variable, value in data.items():
-            # Check if this variable needs conversion
-            if variable not in self.variable_mappings:
-                continue
-            
-            conversion_type = self.variable_mappings[variable]
-            target_unit = self.conversion_settings.get(conversion_type)
-            
-            if not target_unit:
+        # Bound methods as locals: one lookup per key, no attribute access in the loop
+        factor_for = self._factor_by_variable.get
+        debug = logger.isEnabledFor(logging.DEBUG)
+
+        # Single pass: Condor sends one key=value pair per line, so each
+        # line is split, converted if needed and written straight back out.
+        # Lines are re-serialized as key=value\r\n, so convert_message()
+        # returns the original bytes when nothing was converted.
+        output = []
+        append = output.append
+        conversions = 0
+        converted_mask = 0
+        for line in message.split(b'\n'):
+            key, sep, value = line.partition(b'=')
+            if not sep:
                 continue
-            
-            # Apply conversion based on type
-            converted_value, conversion_applied = self._convert_variable(
-                variable, value, conversion_type, target_unit
-            )
-            
-            if conversion_applied:
-                converted_data[variable] = converted_value
-                conversion_info["conversions_applied"] += 1
-                conversion_info["variables_converted"].append(variable)
-                conversion_info["conversions_detail"][variable] = {
-                    "original_value": value,
-                    "converted_value": converted_value,
-                    "conversion_type": conversion_type,
-                    "target_unit": target_unit
-                }
-                
-                logger.debug(f"Converted {variable}: {value} → {converted_value} ({target_unit})")
-        
-        return converted_data, conversion_info
-    
-    def _convert_variable(self, variable: str, value: float, conversion_type: str, target_unit: str) -> Tuple[float, bool]:
+
+            key = key.strip()
+            value = value.strip()
+            factor = factor_for(key)
+            if factor is not None:
+                try:
+                    original_value = float(value)
+                except ValueError:
+                    logger.warning("Could not convert value to float: %r", value)
+                else:
+                    converted_value = original_value * factor
+                    # Up to 15 significant digits like original Condor
+                    value = b'%.15g' % converted_value
+                    variable = key.decode('ascii')  # Validated as ASCII
+                    conversions += 1
+                    converted_mask |= VARIABLE_BITS[variable]
+                    if conversion_info is not None:
+                        self._record_conversion(conversion_info, variable, original_value, converted_value)
+                    if debug:
+                        logger.debug("Converted %s: %s → %s (%s)", variable, original_value, converted_value,
+                                     self.conversion_settings[VARIABLE_MAPPINGS[variable]])
+
+            append(b'%s=%s\r\n' % (key, value))
+
+        if not output:
+            return None, 0, 0
+
+        return b''.join(output), conversions, converted_mask
+
+    def _record_conversion(self, conversion_info: Dict[str, Any], variable: str,
+                           original_value: float, converted_value: float) -> None:
         """
-        Convert a single variable to target unit.
-        
+        Add one applied conversion to a message's conversion info.
+
         Args:
+            conversion_info: Conversion info being built for the message
             variable: Variable name
-            value: Original value
-            conversion_type: Type of conversion (altitude, speed, vario, acceleration)
-            target_unit: Target unit
-            
-        Returns:
-            Tuple of (converted_value, was_converted)
+            original_value: Value as received from Condor
+            converted_value: Value after conversion
         """
-        try:
-            if conversion_type == "altitude":
-                return self._convert_altitude(value, target_unit)
-            elif conversion_type == "speed":
-                return self._convert_speed(value, target_unit)
-            elif conversion_type == "vario":
-                return self._convert_vario(value, target_unit)
-            elif conversion_type == "acceleration":
-                return self._convert_acceleration(value, target_unit)
-            else:
-                logger.warning(f"Unknown conversion type: {conversion_type}")
-                return value, False
-
-        except (KeyError, ValueError, TypeError) as e:
-            logger.error(f"Error converting {variable}: {e}")
-            return value, False
-    
-    def _convert_altitude(self, value: float, target_unit: str) -> Tuple[float, bool]:
-        """Convert altitude from meters to target unit."""
-        if target_unit == "meters":
-            return value, False  # No conversion needed
-        elif target_unit == "feet":
-            factor = self.conversion_factors["altitude"]["meters_to_feet"]
-            return value * factor, True
-        else:
-            logger.warning(f"Unknown altitude unit: {target_unit}")
-            return value, False
-    
-    def _convert_speed(self, value: float, target_unit: str) -> Tuple[float, bool]:
-        """Convert speed from m/s to target unit."""
-        if target_unit == "mps":
-            return value, False  # No conversion needed
-        elif target_unit == "kmh":
-            factor = self.conversion_factors["speed"]["mps_to_kmh"]
-            return value * factor, True
-        elif target_unit == "knots":
-            factor = self.conversion_factors["speed"]["mps_to_knots"]
-            return value * factor, True
-        else:
-            logger.warning(f"Unknown speed unit: {target_unit}")
-            return value, False
-    
-    def _convert_vario(self, value: float, target_unit: str) -> Tuple[float, bool]:
-        """Convert vario from m/s to target unit."""
-        if target_unit == "mps":
-            return value, False  # No conversion needed
-        elif target_unit == "fpm":
-            factor = self.conversion_factors["vario"]["mps_to_fpm"]
-            return value * factor, True
-        else:
-            logger.warning(f"Unknown vario unit: {target_unit}")
-            return value, False
-    
-    def _convert_acceleration(self, value: float, target_unit: str) -> Tuple[float, bool]:
-        """Convert acceleration from m/s² to target unit."""
-        if target_unit == "mps2":
-            return value, False  # No conversion needed
-        elif target_unit == "fps2":
-            factor = self.conversion_factors["acceleration"]["mps2_to_fps2"]
-            return value * factor, True
-        else:
-            logger.warning(f"Unknown acceleration unit: {target_unit}")
-            return value, False
-
-    def _rebuild_message(self, data: Dict[str, float]) -> str:
+        conversion_type = VARIABLE_MAPPINGS[variable]
+        target_unit = self.conversion_settings[conversion_type]
+        conversion_info["conversions_applied"] += 1
+        conversion_info["variables_converted"].append(variable)
+        conversion_info["conversions_detail"][variable] = {
+            "original_value": original_value,
+            "converted_value": converted_value,
+            "conversion_type": conversion_type,
+            "target_unit": target_unit
+        }
+
+    def _build_factor_table(self) -> Dict[bytes, float]:
         """
-        Rebuild UDP message in original key=value format.
-        Maintain high precision like Condor original.
+        Resolve the multiplication factor for each variable under the current settings.
+
+        Returns:
+            Dictionary of variable name (as bytes, matching raw messages) to factor,
+            for variables that need converting
         """
-        pairs = []
-        for key, value in data.items():
-            if isinstance(value, float):
-                # Use high precision like original Condor
-                pairs.append(f"{key}={value:.15g}")  # Up to 15 significant digits
-            else:
-                pairs.append(f"{key}={value}")
-
-        return '\r\n'.join(pairs) + '\r\n'
-    
+        factors = {}
+        if not self.conversion_settings.get("enabled", True):
+            return factors
+
+        for conversion_type, units in UNIT_FACTOR_KEYS.items():
+            target_unit = self.conversion_settings.get(conversion_type)
+            if not target_unit:
+                continue
+
+            if target_unit not in units:
+                logger.warning(f"Unknown {conversion_type} unit: {target_unit}")
+                continue
+
+            factor_key = units[target_unit]
+            if factor_key is None:
+                continue  # No conversion needed
+
+            factor = CONVERSION_FACTORS[conversion_type][factor_key]
+            for variable, variable_type in VARIABLE_MAPPINGS.items():
+                if variable_type == conversion_type:
+                    factors[variable.encode('ascii')] = factor
+
+        return factors
+
     def update_settings(self, new_settings: Dict[str, str]) -> None:
         """
         Update conversion settings.
@@ -326,8 +358,14 @@ class UnitConverter:
             new_settings: New conversion settings
         """
         self.conversion_settings = new_settings.copy()
+        self._factor_by_variable = self._build_factor_table()
         logger.info(f"Conversion settings updated: {new_settings}")
     
+    def _converted_variables(self) -> List[str]:
+        """Decode the converted-variables bitmask back to variable names."""
+        mask = self._converted_mask
+        return [name for name, bit in VARIABLE_BITS.items() if mask & bit]
+
     def get_statistics(self) -> Dict[str, Any]:
         """
         Get conversion statistics.
@@ -337,33 +375,33 @@ class UnitConverter:
         """
         return {
             "total_conversions_applied": self.conversions_applied,
-            "unique_variables_converted": len(self.variables_converted),
-            "variables_converted": list(self.variables_converted),
+            "unique_variables_converted": bin(self._converted_mask).count('1'),
+            "variables_converted": self._converted_variables(),
             "current_settings": self.conversion_settings.copy(),
-            "supported_variables": list(self.variable_mappings.keys())
+            "supported_variables": list(VARIABLE_MAPPINGS.keys())
         }
     
     def reset_statistics(self) -> None:
         """Reset conversion statistics."""
         self.conversions_applied = 0
-        self.variables_converted.clear()
+        self._converted_mask = 0
         logger.info("Conversion statistics reset")
     
-    def get_convertible_variables(self, message: str) -> List[str]:
+    def get_convertible_variables(self, message: bytes) -> List[str]:
         """
         Get list of variables in message that can be converted.
         
         Args:
-            message: UDP message to analyze
+            message: UDP message to analyze (raw bytes)
             
         Returns:
             List of convertible variable names
         """
         try:
-            pairs = self.kv_pattern.findall(message)
-            variables = [key for key, _ in pairs]
-            convertible = [var for var in variables if var in self.variable_mappings]
-            return convertible
+            # Same partition-based parse as the converter, keys only
+            keys = (line.partition(b'=')[0].strip().decode('ascii', 'replace')
+                    for line in message.split(b'\n') if b'=' in line)
+            return [key for key in keys if key in VARIABLE_MAPPINGS]
         except (AttributeError, TypeError) as e:
             logger.error(f"Error analyzing message: {e}")
             return []
@@ -403,11 +441,12 @@ wheelheight=0.5"""
     print(test_message)
     print()
     
-    # Process message
-    converted_message, info = converter.process_message(test_message)
+    # Process message (messages travel as raw bytes, as received from the socket)
+    test_bytes = test_message.encode('ascii')
+    converted_message, info = converter.process_message(test_bytes)
     
     print("Converted message:")
-    print(converted_message)
+    print(converted_message.decode('ascii'))
     print()
     
     print("Conversion info:")
@@ -423,5 +462,5 @@ wheelheight=0.5"""
     print()
     
     # Test convertible variables detection
-    convertible = converter.get_convertible_variables(test_message)
+    convertible = converter.get_convertible_variables(test_bytes)
     print(f"Convertible variables found: {convertible}")
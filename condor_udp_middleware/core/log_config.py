@@ -8,14 +8,50 @@ throughout the application, including GUI visualization.
 Part of the Condor UDP Middleware project.
 """
 
+import collections
 import logging
 import os
+import time
 from typing import Optional
 
+# Format shared by all handlers
+LOG_FORMAT = '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+TEXT_FLUSH_INTERVAL_MS = 50  # How often the GUI log view picks up queued records
+TEXT_MAX_LINES = 1000  # Lines kept in the GUI log view; older lines are trimmed
+
 # Global variable to track GUI text handler
 text_handler = None
 
 
+class CachedFormatter(logging.Formatter):
+    """Formatter that reuses the formatted timestamp for records in the same second."""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._time_cache = (None, '')  # (whole second, formatted date/time)
+
+    def formatTime(self, record, datefmt=None):
+        if datefmt:
+            return super().formatTime(record, datefmt)
+
+        second = int(record.created)
+        cached_second, text = self._time_cache
+        if second != cached_second:
+            text = time.strftime(self.default_time_format, self.converter(record.created))
+            self._time_cache = (second, text)
+
+        if self.default_msec_format:
+            return self.default_msec_format % (text, record.msecs)
+        return text
+
+
+# Handlers owned by configure_logging, reused across calls
+_formatter = CachedFormatter(LOG_FORMAT)
+_console_handler = None
+_file_handler = None
+_file_handler_config = None  # (path, max_bytes, backup_count) _file_handler was built with
+
+
 def configure_logging(
         level: int = logging.DEBUG,
         log_to_file: bool = False,
@@ -26,6 +62,9 @@ def configure_logging(
     """
     Configure the logging system for the entire application.
 
+    Handlers are created on first use and only adjusted on later calls;
+    the file handler is rebuilt only when its path or rotation changes.
+
     Args:
         level: Logging level for console (default DEBUG)
         log_to_file: Whether to save logs to a file
@@ -33,67 +72,77 @@ def configure_logging(
         max_log_files: Maximum number of log files for rotation
         max_log_size_mb: Maximum size of log file in MB
     """
+    global _console_handler, _file_handler, _file_handler_config
+
     # Get root logger
     root_logger = logging.getLogger()
 
-    # Save existing text handlers to restore them later
-    text_handlers = []
+    # Remove handlers installed elsewhere; ours and GUI text handlers stay
     for handler in root_logger.handlers[:]:
-        if hasattr(handler, 'text_widget'):
-            text_handlers.append(handler)
-            root_logger.removeHandler(handler)
-        else:
-            # Remove other handlers
+        if handler is not _console_handler and handler is not _file_handler \
+                and not hasattr(handler, 'text_widget'):
             root_logger.removeHandler(handler)
 
     # Configure root logger level to allow all needed messages
     root_logger.setLevel(min(level, logging.INFO))
 
-    # Create standard formatter
-    formatter = logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
-
-    # Add console handler with requested level (usually DEBUG)
-    console_handler = logging.StreamHandler()
-    console_handler.setLevel(level)
-    console_handler.setFormatter(formatter)
-    root_logger.addHandler(console_handler)
+    # Console handler with requested level (usually DEBUG)
+    if _console_handler is None:
+        _console_handler = logging.StreamHandler()
+        _console_handler.setFormatter(_formatter)
+    _console_handler.setLevel(level)
+    root_logger.addHandler(_console_handler)  # No-op if already attached
 
-    # Add file handler if enabled
+    # File handler, rebuilt only when its configuration changes
+    file_config = None
     if log_to_file and log_file_path:
-        try:
-            # Ensure directory exists
-            os.makedirs(os.path.dirname(log_file_path), exist_ok=True)
-
-            # Create rotating file handler
-            from logging.handlers import RotatingFileHandler
-            file_handler = RotatingFileHandler(
-                log_file_path,
-                maxBytes=max_log_size_mb * 1024 * 1024,
-                backupCount=max_log_files
-            )
-            file_handler.setLevel(level)
-            file_handler.setFormatter(formatter)
-            root_logger.addHandler(file_handler)
-
-            logging.info(f"Logging to file: {log_file_path}")
-        except Exception as e:
-            logging.error(f"Error setting up file logging: {e}")
-
-    # Restore text handlers with fixed INFO level
-    for handler in text_handlers:
-        # Ensure level is INFO for GUI
-        handler.setLevel(logging.INFO)
-        root_logger.addHandler(handler)
+        file_config = (log_file_path, max_log_size_mb * 1024 * 1024, max_log_files)
+
+    if file_config != _file_handler_config:
+        if _file_handler is not None:
+            root_logger.removeHandler(_file_handler)
+            _file_handler.close()
+            _file_handler = None
+        _file_handler_config = None
+
+        if file_config:
+            try:
+                # Ensure directory exists
+                os.makedirs(os.path.dirname(log_file_path), exist_ok=True)
+
+                # Create rotating file handler
+                from logging.handlers import RotatingFileHandler
+                _file_handler = RotatingFileHandler(
+                    log_file_path,
+                    maxBytes=file_config[1],
+                    backupCount=file_config[2]
+                )
+                _file_handler.setFormatter(_formatter)
+                root_logger.addHandler(_file_handler)
+                _file_handler_config = file_config
+
+                logging.info(f"Logging to file: {log_file_path}")
+            except Exception as e:
+                logging.error(f"Error setting up file logging: {e}")
+
+    if _file_handler is not None:
+        _file_handler.setLevel(level)
+
+    # Text handlers keep a fixed INFO level
+    for handler in root_logger.handlers:
+        if hasattr(handler, 'text_widget'):
+            handler.setLevel(logging.INFO)
 
     logging.info(f"Logging system initialized: console={logging.getLevelName(level)}, GUI=INFO")
 
 
-def add_text_handler(text_widget) -> logging.Handler:
+def add_text_handler(text_widget, max_lines: int = TEXT_MAX_LINES) -> logging.Handler:
     """
     Add a text handler for GUI that shows only INFO, WARNING and ERROR.
 
     Args:
         text_widget: Tkinter text widget where logs will be displayed
+        max_lines: Maximum number of lines kept in the widget
 
     Returns:
         The created handler
@@ -101,45 +150,67 @@ def add_text_handler(text_widget) -> logging.Handler:
     global text_handler
 
     class TextHandler(logging.Handler):
-        def __init__(self, text_widget):
+        def __init__(self, text_widget, max_lines):
             logging.Handler.__init__(self)
             self.text_widget = text_widget
             self.setLevel(logging.INFO)  # Fixed level at INFO
-            self.setFormatter(logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s'))
-            self.max_lines = 1000  # Limit to avoid memory overload
+            self.setFormatter(_formatter)
+            self.max_lines = max_lines  # Limit to avoid memory overload
+
+            # Records waiting for the next widget update (oldest dropped in a flood)
+            self._queue = collections.deque(maxlen=self.max_lines)
+            self._closed = False
+
+            # Widget updates happen only in _drain, polled on the Tk thread
+            self.text_widget.after(TEXT_FLUSH_INTERVAL_MS, self._drain)
 
         def emit(self, record):
-            msg = self.format(record)
-
-            def append():
-                if not self.text_widget.winfo_exists():
-                    return
-
-                try:
-                    self.text_widget.configure(state='normal')
-
-                    # Color based on level
-                    if record.levelno >= logging.ERROR:
-                        self.text_widget.insert('end', msg + '\n', 'error')
-                    elif record.levelno >= logging.WARNING:
-                        self.text_widget.insert('end', msg + '\n', 'warning')
-                    else:
-                        self.text_widget.insert('end', msg + '\n', 'info')
-
-                    # Limit number of lines
-                    line_count = int(self.text_widget.index('end-1c').split('.')[0])
-                    if line_count > self.max_lines:
-                        to_delete = line_count - self.max_lines
-                        self.text_widget.delete('1.0', f'{to_delete + 1}.0')
-
-                    self.text_widget.configure(state='disabled')
-                    self.text_widget.see('end')
-                except Exception as e:
-                    print(f"Error updating log widget: {e}")
-
-            # Add to main thread
-            if self.text_widget.winfo_exists():
-                self.text_widget.after(0, append)
+            # May run on any thread, so only queue the record; Tk is never touched here
+            if record.levelno >= logging.ERROR:
+                tag = 'error'
+            elif record.levelno >= logging.WARNING:
+                tag = 'warning'
+            else:
+                tag = 'info'
+
+            self._queue.append((self.format(record) + '\n', tag))
+
+        def close(self):
+            self._closed = True
+            self._queue.clear()
+            logging.Handler.close(self)
+
+        def _drain(self):
+            if self._closed or not self.text_widget.winfo_exists():
+                self._queue.clear()
+                return
+
+            # Keep polling; records keep arriving from other threads
+            self.text_widget.after(TEXT_FLUSH_INTERVAL_MS, self._drain)
+
+            # Text.insert() takes alternating text/tag arguments, so the whole
+            # batch goes to Tk in a single call
+            chunks = []
+            queue = self._queue
+            while queue:
+                chunks.extend(queue.popleft())
+            if not chunks:
+                return
+
+            try:
+                self.text_widget.configure(state='normal')
+                self.text_widget.insert('end', *chunks)
+
+                # Limit number of lines
+                line_count = int(self.text_widget.index('end-1c').split('.')[0])
+                if line_count > self.max_lines:
+                    to_delete = line_count - self.max_lines
+                    self.text_widget.delete('1.0', f'{to_delete + 1}.0')
+
+                self.text_widget.configure(state='disabled')
+                self.text_widget.see('end')
+            except Exception as e:
+                print(f"Error updating log widget: {e}")
 
     try:
         # Configure tags for coloring messages
@@ -150,7 +221,7 @@ def add_text_handler(text_widget) -> logging.Handler:
         print(f"Error configuring text tags: {e}")
 
     # Create and configure handler
-    handler = TextHandler(text_widget)
+    handler = TextHandler(text_widget, max_lines)
 
     # Add to root logger
     root_logger = logging.getLogger()
@@ -159,6 +230,7 @@ def add_text_handler(text_widget) -> logging.Handler:
     for h in list(root_logger.handlers):
         if hasattr(h, 'text_widget'):
             root_logger.removeHandler(h)
+            h.close()
 
     root_logger.addHandler(handler)
     text_handler = handler
@@ -178,9 +250,11 @@ def remove_text_handler() -> None:
     # Remove handler if it exists
     if text_handler:
         root_logger.removeHandler(text_handler)
+        text_handler.close()
         text_handler = None
 
     # Search and remove other text handlers
     for handler in root_logger.handlers[:]:
         if hasattr(handler, 'text_widget'):
-            root_logger.removeHandler(handler)
\ No newline at end of file
+            root_logger.removeHandler(handler)
+            handler.close()
@@ -0,0 +1,219 @@
+#!/usr/bin/env python3
+
+"""
+Batched datagram syscalls for Condor UDP Middleware
+Thin ctypes bindings for Linux recvmmsg(2) and sendmmsg(2), used to
+move several datagrams per system call on high-rate telemetry streams.
+
+Part of the Condor UDP Middleware project.
+"""
+
+import ctypes
+import errno
+import logging
+import os
+import sys
+from typing import List
+
+# Configure logging
+logger = logging.getLogger('mmsg')
+
+# Flags from <sys/socket.h>
+MSG_TRUNC = 0x20
+MSG_DONTWAIT = 0x40
+MSG_WAITFORONE = 0x10000
+
+
+class _IOVec(ctypes.Structure):
+    """struct iovec"""
+    _fields_ = [
+        ("iov_base", ctypes.c_void_p),
+        ("iov_len", ctypes.c_size_t),
+    ]
+
+
+class _MsgHdr(ctypes.Structure):
+    """struct msghdr"""
+    _fields_ = [
+        ("msg_name", ctypes.c_void_p),
+        ("msg_namelen", ctypes.c_uint32),
+        ("msg_iov", ctypes.POINTER(_IOVec)),
+        ("msg_iovlen", ctypes.c_size_t),
+        ("msg_control", ctypes.c_void_p),
+        ("msg_controllen", ctypes.c_size_t),
+        ("msg_flags", ctypes.c_int),
+    ]
+
+
+class _MMsgHdr(ctypes.Structure):
+    """struct mmsghdr"""
+    _fields_ = [
+        ("msg_hdr", _MsgHdr),
+        ("msg_len", ctypes.c_uint),
+    ]
+
+
+def _load_libc():
+    """Load libc on Linux, or return None if unavailable."""
+    if not sys.platform.startswith('linux'):
+        return None
+
+    try:
+        return ctypes.CDLL(None, use_errno=True)
+    except OSError as e:
+        logger.debug(f"libc not available: {e}")
+        return None
+
+
+def _bind_mmsg(libc, name: str):
+    """Bind recvmmsg/sendmmsg from libc, or return None if unavailable."""
+    if libc is None:
+        return None
+
+    try:
+        func = getattr(libc, name)
+    except AttributeError as e:
+        logger.debug(f"{name} not available: {e}")
+        return None
+
+    argtypes = [
+        ctypes.c_int,
+        ctypes.POINTER(_MMsgHdr),
+        ctypes.c_uint,
+        ctypes.c_int
+    ]
+    if name == 'recvmmsg':
+        argtypes.append(ctypes.c_void_p)  # struct timespec *timeout
+    # Assigned once complete: ctypes stores a copy, so appending afterwards has no effect
+    func.argtypes = argtypes
+    func.restype = ctypes.c_int
+    return func
+
+
+_libc = _load_libc()
+_recvmmsg = _bind_mmsg(_libc, 'recvmmsg')
+_sendmmsg = _bind_mmsg(_libc, 'sendmmsg')
+
+# True when batched receive/send can be used on this platform
+HAVE_RECVMMSG = _recvmmsg is not None
+HAVE_SENDMMSG = _sendmmsg is not None
+
+
+class RecvMmsgBatch:
+    """
+    Preallocated recvmmsg(2) state.
+
+    Holds batch_size message headers, each pointing at its own persistent
+    bytearray, so a receive loop can pull up to batch_size datagrams per
+    syscall without allocating anything per packet.
+    """
+
+    def __init__(self, batch_size: int, buffer_size: int):
+        """
+        Initialize the batch.
+
+        Args:
+            batch_size: Maximum number of datagrams per recvmmsg() call
+            buffer_size: Size of each per-datagram buffer in bytes
+        """
+        self.batch_size = batch_size
+        self.buffer_size = buffer_size
+        self.buffers = [bytearray(buffer_size) for _ in range(batch_size)]
+
+        self._views = [memoryview(buf) for buf in self.buffers]
+        self._c_buffers = [(ctypes.c_char * buffer_size).from_buffer(buf) for buf in self.buffers]
+        self._iovecs = (_IOVec * batch_size)()
+        self._msgs = (_MMsgHdr * batch_size)()
+
+        for i, c_buf in enumerate(self._c_buffers):
+            self._iovecs[i].iov_base = ctypes.addressof(c_buf)
+            self._iovecs[i].iov_len = buffer_size
+            self._msgs[i].msg_hdr.msg_iov = ctypes.pointer(self._iovecs[i])
+            self._msgs[i].msg_hdr.msg_iovlen = 1
+
+    def receive(self, fd: int, flags: int = MSG_WAITFORONE) -> int:
+        """
+        Receive up to batch_size datagrams from a socket.
+
+        Args:
+            fd: Socket file descriptor
+            flags: recvmmsg() flags
+
+        Returns:
+            int: Number of datagrams received (0 if none were ready)
+        """
+        count = _recvmmsg(fd, self._msgs, self.batch_size, flags, None)
+        if count < 0:
+            err = ctypes.get_errno()
+            if err in (errno.EAGAIN, errno.EWOULDBLOCK, errno.EINTR):
+                return 0
+            raise OSError(err, os.strerror(err))
+        return count
+
+    def view(self, index: int) -> memoryview:
+        """Get a view of the datagram received into slot index."""
+        return self._views[index][:self._msgs[index].msg_len]
+
+    def truncated(self, index: int) -> bool:
+        """Check whether the datagram in slot index was larger than its buffer."""
+        return bool(self._msgs[index].msg_hdr.msg_flags & MSG_TRUNC)
+
+
+class SendMmsgBatch:
+    """
+    Preallocated sendmmsg(2) state.
+
+    Message headers and iovecs are allocated once; each send() only points
+    the iovecs at the payloads being sent. The socket must be connected,
+    since msg_name is left NULL.
+    """
+
+    def __init__(self, batch_size: int):
+        """
+        Initialize the batch.
+
+        Args:
+            batch_size: Maximum number of datagrams per sendmmsg() call
+        """
+        self.batch_size = batch_size
+
+        self._iovecs = (_IOVec * batch_size)()
+        self._msgs = (_MMsgHdr * batch_size)()
+
+        for i in range(batch_size):
+            self._msgs[i].msg_hdr.msg_iov = ctypes.pointer(self._iovecs[i])
+            self._msgs[i].msg_hdr.msg_iovlen = 1
+
+    def send(self, fd: int, payloads: List[bytes]) -> int:
+        """
+        Send payloads on a connected socket, batch_size datagrams per call.
+
+        Args:
+            fd: Socket file descriptor
+            payloads: Datagrams to send
+
+        Returns:
+            int: Number of datagrams sent (raises OSError if none could be sent)
+        """
+        total = 0
+        pending = len(payloads)
+
+        while total < pending:
+            n = min(pending - total, self.batch_size)
+            # c_char_p keeps a reference to each bytes object for the call
+            keep = [ctypes.c_char_p(payload) for payload in payloads[total:total + n]]
+            for i, c_payload in enumerate(keep):
+                self._iovecs[i].iov_base = ctypes.cast(c_payload, ctypes.c_void_p)
+                self._iovecs[i].iov_len = len(payloads[total + i])
+
+            count = _sendmmsg(fd, self._msgs, n, 0)
+            if count < 0:
+                err = ctypes.get_errno()
+                if err == errno.EINTR:
+                    continue
+                if total:
+                    break
+                raise OSError(err, os.strerror(err))
+            total += count
+
+        return total
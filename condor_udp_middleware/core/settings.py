@@ -9,17 +9,232 @@ Part of the Condor UDP Middleware project.
 
 import json
 import os
+import sys
 import logging
-from typing import Dict, Any, Optional, List
+import threading
+from types import MappingProxyType
+import typing
+from typing import Dict, Any, Callable, Optional, List, Mapping, Tuple, Union
 from pathlib import Path
 import dataclasses
 from dataclasses import dataclass, field
 
+try:
+    import orjson  # Optional, faster JSON encoding
+except ImportError:
+    orjson = None
+
 # Configure logging
 logger = logging.getLogger('settings')
 
+SAVE_DEBOUNCE_DELAY = 0.5  # Seconds to collect further changes before an autosave
+MAX_RECENT_CONFIGS = 10  # Entries kept in the recent configurations list
+
+# Settings dataclasses use __slots__ where supported (Python 3.10+)
+_DATACLASS_OPTIONS = {'slots': True} if sys.version_info >= (3, 10) else {}
+
+# Logging level names accepted in settings
+LOG_LEVELS = MappingProxyType({
+    "DEBUG": logging.DEBUG,
+    "INFO": logging.INFO,
+    "WARNING": logging.WARNING,
+    "ERROR": logging.ERROR,
+    "CRITICAL": logging.CRITICAL
+})
+
+# Available units for each conversion type
+CONVERSION_UNITS = MappingProxyType({
+    "altitude": ("meters", "feet"),
+    "speed": ("mps", "kmh", "knots"),
+    "vario": ("mps", "fpm"),
+    "acceleration": ("mps2", "fps2")
+})
+CONVERSION_UNIT_SETS = MappingProxyType({name: frozenset(units) for name, units in CONVERSION_UNITS.items()})
+
+# Conversion factors between units
+CONVERSION_FACTORS = MappingProxyType({
+    "altitude": MappingProxyType({
+        "meters_to_feet": 3.28084,
+        "feet_to_meters": 0.3048
+    }),
+    "speed": MappingProxyType({
+        "mps_to_kmh": 3.6,
+        "mps_to_knots": 1.94384,
+        "kmh_to_mps": 0.277778,
+        "kmh_to_knots": 0.539957,
+        "knots_to_mps": 0.514444,
+        "knots_to_kmh": 1.852
+    }),
+    "vario": MappingProxyType({
+        "mps_to_fpm": 196.85,
+        "fpm_to_mps": 0.00508
+    }),
+    "acceleration": MappingProxyType({
+        "mps2_to_fps2": 3.28084,
+        "fps2_to_mps2": 0.3048
+    })
+})
+
+
+def _runtime_type(field_type) -> type:
+    """
+    Get the class values of a field are checked against.
+
+    Optional[X] unwraps to X and generic aliases such as List[str] to the
+    bare container.
+    """
+    if typing.get_origin(field_type) is Union:
+        field_type = next((t for t in typing.get_args(field_type) if t is not type(None)), str)
+    return typing.get_origin(field_type) or field_type
+
+
+def _make_coercer(field_type: type) -> Callable[[Any], Any]:
+    """
+    Build a function converting values to a field's runtime type.
+
+    Args:
+        field_type: Class returned by _runtime_type()
+
+    Returns:
+        Callable returning the converted value; None is passed through and
+        ValueError/TypeError propagate when conversion is impossible
+    """
+    def coerce(value):
+        if value is None or isinstance(value, field_type):
+            return value
+        return field_type(value)
+
+    return coerce
+
+
+def _cache_fields(cls):
+    """
+    Record field metadata on a settings dataclass.
+
+    Stores the field names as a frozenset for membership checks, the
+    (name, nested settings class or None) layout used to build plain dicts,
+    and the runtime type and coercer of each plain field, so loading, saving
+    and set() never go through dataclasses.fields() or the annotations again.
+    """
+    fields = dataclasses.fields(cls)
+    cls.__field_names__ = frozenset(f.name for f in fields)
+    cls.__field_layout__ = tuple(
+        (f.name, f.type if dataclasses.is_dataclass(f.type) else None) for f in fields
+    )
+    cls.__nested_dc_fields__ = tuple(name for name, nested in cls.__field_layout__ if nested)
+    cls.__field_types__ = {
+        f.name: _runtime_type(f.type) for f in fields if not dataclasses.is_dataclass(f.type)
+    }
+    cls.__field_coercers__ = {name: _make_coercer(t) for name, t in cls.__field_types__.items()}
+    return cls
+
+
+def _from_trusted_dict(cls, data: Dict[str, Any]):
+    """
+    Build a settings dataclass directly from data that needs no conversion.
+
+    Used for files written by save(): every field must be present, no
+    unknown keys may appear and every value must already have its field's
+    type.
+
+    Args:
+        cls: Settings dataclass to build
+        data: Parsed section data
+
+    Returns:
+        New instance, or None if data does not match exactly
+    """
+    if data.keys() != cls.__field_names__:
+        return None
+
+    field_types = cls.__field_types__
+    values = {}
+    for name, nested in cls.__field_layout__:
+        value = data[name]
+        if nested:
+            if not isinstance(value, dict):
+                return None
+            value = _from_trusted_dict(nested, value)
+            if value is None:
+                return None
+        elif value is not None and not isinstance(value, field_types[name]):
+            return None
+        values[name] = value
+    return cls(**values)
+
+
+def _assign_in_place(target, source) -> None:
+    """
+    Copy every field of a settings dataclass onto another instance of it.
+
+    Nested sections are updated rather than replaced, so references held
+    to them (settings.settings.network and so on) see the new values.
+
+    Args:
+        target: Settings dataclass instance to update
+        source: Instance of the same class to copy from
+    """
+    for name, nested in target.__field_layout__:
+        if nested:
+            _assign_in_place(getattr(target, name), getattr(source, name))
+        else:
+            setattr(target, name, getattr(source, name))
+
+
+def _settings_to_dict(obj) -> Dict[str, Any]:
+    """
+    Convert a settings dataclass to a plain dict in a single pass.
+
+    Args:
+        obj: Settings dataclass instance
+
+    Returns:
+        dict: Field values, with nested settings converted recursively
+    """
+    result = {}
+    for name, nested in obj.__field_layout__:
+        value = getattr(obj, name)
+        if nested:
+            value = _settings_to_dict(value)
+        elif isinstance(value, list):
+            value = list(value)
+        result[name] = value
+    return result
+
+
+def _encode_settings(settings) -> bytes:
+    """
+    Serialize settings to indented JSON.
+
+    Args:
+        settings: Settings dataclass instance
+
+    Returns:
+        bytes: UTF-8 encoded JSON document
+    """
+    data = _settings_to_dict(settings)
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2)
+    return json.dumps(data, indent=2).encode('utf-8')
+
+
+def _decode_settings(raw: bytes) -> Dict[str, Any]:
+    """
+    Parse a JSON settings document.
+
+    Args:
+        raw: File contents
 
-@dataclass
+    Returns:
+        dict: Parsed settings data
+    """
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+
+@_cache_fields
+@dataclass(**_DATACLASS_OPTIONS)
 class NetworkSettings:
     """Network configuration settings"""
     input_port: int = 55278  # Port to receive data from Condor
@@ -28,7 +243,8 @@ class NetworkSettings:
     buffer_size: int = 65535  # UDP buffer size
 
 
-@dataclass
+@_cache_fields
+@dataclass(**_DATACLASS_OPTIONS)
 class UnitConversionSettings:
     """Unit conversion preferences"""
     altitude: str = "meters"     # "meters", "feet"
@@ -38,7 +254,8 @@ class UnitConversionSettings:
     enabled: bool = True         # Master enable/disable for conversions
 
 
-@dataclass
+@_cache_fields
+@dataclass(**_DATACLASS_OPTIONS)
 class LogSettings:
     """Logging settings"""
     level: str = "INFO"
@@ -48,7 +265,8 @@ class LogSettings:
     max_log_size_mb: int = 10
 
 
-@dataclass
+@_cache_fields
+@dataclass(**_DATACLASS_OPTIONS)
 class UISettings:
     """User interface settings"""
     theme: str = "system"  # "system", "light", "dark"
@@ -57,7 +275,8 @@ class UISettings:
     recent_configs: List[str] = field(default_factory=list)
 
 
-@dataclass
+@_cache_fields
+@dataclass(**_DATACLASS_OPTIONS)
 class MiddlewareAppSettings:
     """Main application settings container"""
     network: NetworkSettings = field(default_factory=NetworkSettings)
@@ -68,29 +287,31 @@ class MiddlewareAppSettings:
     first_run: bool = True
 
 
-class SettingsEncoder(json.JSONEncoder):
-    """Custom JSON encoder for dataclasses"""
-    def default(self, obj):
-        if dataclasses.is_dataclass(obj):
-            return dataclasses.asdict(obj)
-        return super().default(obj)
-
-
 class MiddlewareSettings:
     """
     Settings manager for Condor UDP Middleware.
     Handles loading, saving, and accessing application settings.
     """
-    def __init__(self, config_file: Optional[str] = None):
+    def __init__(self, config_file: Optional[str] = None, autosave: bool = False):
         """
         Initialize settings manager.
         
         Args:
             config_file: Path to configuration file (optional)
+            autosave: Save automatically shortly after changes made through set()
         """
         # Default settings
         self.settings = MiddlewareAppSettings()
         
+        # Set once the config directory is known to exist
+        self._dir_ensured = False
+        
+        # Unsaved-change tracking for debounced autosave
+        self.autosave = autosave
+        self._dirty = False
+        self._save_timer: Optional[threading.Timer] = None
+        self._save_lock = threading.RLock()
+        
         # Configuration file path
         if config_file:
             self.config_file = config_file
@@ -101,6 +322,7 @@ class MiddlewareSettings:
                 '.condor_udp_middleware', 
                 'config.json'
             )
+        self._config_dir = os.path.dirname(self.config_file)
             
         # Load settings
         self.load()
@@ -116,24 +338,34 @@ class MiddlewareSettings:
             bool: True if settings were loaded successfully
         """
         if config_file:
-            self.config_file = config_file
+            self._set_config_file(config_file)
             
         try:
-            # Ensure directory exists
-            os.makedirs(os.path.dirname(self.config_file), exist_ok=True)
-            
-            # Check if file exists
-            if not os.path.exists(self.config_file):
+            # Load from file in a single read; a missing file gets defaults
+            try:
+                raw = Path(self.config_file).read_bytes()
+            except FileNotFoundError:
                 logger.info(f"Configuration file not found at {self.config_file}")
                 self._create_default_config()
                 return True
             
-            # Load from file
-            with open(self.config_file, 'r') as f:
-                data = json.load(f)
+            data = _decode_settings(raw)
                 
-            # Update settings with loaded data
-            self._update_from_dict(data)
+            # Files written by this version load directly; anything else
+            # (older versions, hand edits) goes through per-field conversion
+            if not isinstance(data, dict):
+                logger.error(f"Config file {self.config_file} does not contain a JSON object")
+                return False
+
+            loaded = None
+            if data.get('version') == self.settings.version:
+                loaded = _from_trusted_dict(MiddlewareAppSettings, data)
+            if loaded is not None:
+                loaded.first_run = False
+                _assign_in_place(self.settings, loaded)
+            else:
+                self._update_from_dict(data)
+            self._dirty = False
             
             logger.info(f"Settings loaded from {self.config_file}")
             return True
@@ -160,38 +392,93 @@ class MiddlewareSettings:
         Returns:
             bool: True if settings were saved successfully
         """
-        if config_file:
-            self.config_file = config_file
-            
-        try:
-            # Ensure directory exists
-            os.makedirs(os.path.dirname(self.config_file), exist_ok=True)
-            
-            # Save to file
-            with open(self.config_file, 'w') as f:
-                json.dump(self.settings, f, indent=2, cls=SettingsEncoder)
-                
-            logger.info(f"Settings saved to {self.config_file}")
-            return True
-            
-        except IOError as e:
-            logger.error(f"Error writing config file: {e}")
-            return False
+        with self._save_lock:
+            if config_file:
+                self._set_config_file(config_file)
 
-        except (TypeError, ValueError, OSError) as e:
-            logger.error(f"Error saving config: {e}")
-            return False
+            try:
+                self._ensure_config_dir()
+
+                # Save to file
+                Path(self.config_file).write_bytes(_encode_settings(self.settings))
+                self._dirty = False
+
+                logger.info(f"Settings saved to {self.config_file}")
+                return True
+
+            except IOError as e:
+                logger.error(f"Error writing config file: {e}")
+                self._dir_ensured = False  # Directory may have been removed
+                return False
+
+            except (TypeError, ValueError, OSError) as e:
+                logger.error(f"Error saving config: {e}")
+                return False
+    
+    @property
+    def is_dirty(self) -> bool:
+        """Whether there are changes that have not been saved yet."""
+        return self._dirty
+    
+    def mark_dirty(self) -> None:
+        """
+        Record an unsaved change.
+        
+        With autosave enabled, a save is scheduled SAVE_DEBOUNCE_DELAY seconds
+        later on a background timer; changes made in the meantime are written
+        by that same save.
+        """
+        with self._save_lock:
+            self._dirty = True
+            if self.autosave and self._save_timer is None:
+                timer = threading.Timer(SAVE_DEBOUNCE_DELAY, self._flush)
+                timer.daemon = True
+                self._save_timer = timer
+                timer.start()
+    
+    def _flush(self) -> None:
+        """Timer callback: save pending changes."""
+        with self._save_lock:
+            self._save_timer = None
+            if self._dirty:
+                self.save()
+    
+    def flush_now(self) -> bool:
+        """
+        Cancel any scheduled autosave and save pending changes immediately.
+        
+        Returns:
+            bool: True if there was nothing to save or the save succeeded
+        """
+        with self._save_lock:
+            if self._save_timer is not None:
+                self._save_timer.cancel()
+                self._save_timer = None
+            if not self._dirty:
+                return True
+            return self.save()
+    
+    def _set_config_file(self, config_file: str) -> None:
+        """Switch to another configuration file path."""
+        if config_file != self.config_file:
+            self.config_file = config_file
+            self._config_dir = os.path.dirname(config_file)
+            self._dir_ensured = False
+    
+    def _ensure_config_dir(self) -> None:
+        """Create the configuration directory, once per config file path."""
+        if not self._dir_ensured:
+            if self._config_dir:
+                os.makedirs(self._config_dir, exist_ok=True)
+            self._dir_ensured = True
     
     def _create_default_config(self) -> None:
         """Create default configuration file."""
         try:
-            # Ensure directory exists
-            os.makedirs(os.path.dirname(self.config_file), exist_ok=True)
+            self._ensure_config_dir()
             
             # Save default settings
-            with open(self.config_file, 'w') as f:
-                json.dump(self.settings, f, indent=2, cls=SettingsEncoder)
-    
+            Path(self.config_file).write_bytes(_encode_settings(self.settings))
 
             logger.info(f"Default configuration created at {self.config_file}")
 
@@ -207,31 +494,23 @@ class MiddlewareSettings:
         """
         # Helper function to recursively update dataclasses
         def update_dataclass(obj, data_dict):
-            for key, value in data_dict.items():
-                if hasattr(obj, key):
-                    current_value = getattr(obj, key)
-                    # If it's a dataclass and value is a dict, update recursively
-                    if dataclasses.is_dataclass(current_value) and isinstance(value, dict):
-                        update_dataclass(current_value, value)
-                    # For lists with default factory, handle specially
-                    elif isinstance(current_value, list) and isinstance(value, list):
-                        setattr(obj, key, value)
-                    # Direct value assignment for everything else
+            nested_fields = obj.__nested_dc_fields__
+            coercers = obj.__field_coercers__
+            for key in data_dict.keys() & obj.__field_names__:
+                value = data_dict[key]
+                # If it's a dataclass and value is a dict, update recursively
+                if key in nested_fields:
+                    if isinstance(value, dict):
+                        update_dataclass(getattr(obj, key), value)
                     else:
-                        # Only set if types are compatible
-                        target_type = type(current_value)
-                        try:
-                            if target_type is bool and isinstance(value, int):
-                                # Convert int to bool (0=False, non-zero=True)
-                                setattr(obj, key, bool(value))
-                            elif value is None or isinstance(value, target_type):
-                                # Direct assignment for same type or None
-                                setattr(obj, key, value)
-                            else:
-                                # Try to convert to target type
-                                setattr(obj, key, target_type(value))
-                        except (ValueError, TypeError):
-                            logger.warning(f"Could not convert {key}={value} to {target_type}")
+                        logger.warning(f"Ignoring non-object value for section {key}")
+                    continue
+
+                # Convert to the declared field type, skipping incompatible values
+                try:
+                    setattr(obj, key, coercers[key](value))
+                except (ValueError, TypeError):
+                    logger.warning(f"Could not convert {key}={value}")
         
         # Update main settings object
         update_dataclass(self.settings, data)
@@ -262,6 +541,21 @@ class MiddlewareSettings:
 
         return None
 
+    def get_section_dict(self, section: str) -> Optional[Dict[str, Any]]:
+        """
+        Get a copy of a settings section as a plain dict.
+        
+        Args:
+            section: Section name (network, conversions, logging, ui)
+            
+        Returns:
+            dict: Field values of the section, or None if not found
+        """
+        section_obj = getattr(self.settings, section, None)
+        if section_obj is None or not hasattr(section_obj, '__field_layout__'):
+            return None
+        return _settings_to_dict(section_obj)
+
     def set(self, section: str, key: str, value: Any) -> bool:
         """
         Set a setting value.
@@ -274,112 +568,114 @@ class MiddlewareSettings:
         Returns:
             bool: True if setting was changed
         """
+        stored, modified = self._set_value(section, key, value)
+        if modified:
+            self.mark_dirty()
+        return stored
+    
+    def _set_value(self, section: str, key: str, value: Any) -> Tuple[bool, bool]:
+        """
+        Convert and store one setting value without marking the settings dirty.
+
+        Args:
+            section: Section name (network, conversions, logging, ui)
+            key: Setting key
+            value: New value
+
+        Returns:
+            Tuple of (True if the setting was stored, True if its value differs from before)
+        """
         try:
-            if hasattr(self.settings, section):
-                section_obj = getattr(self.settings, section)
-                if hasattr(section_obj, key):
-                    # Handle special cases for Optional fields
-                    if section == 'logging' and key == 'log_file_path':
-                        if value is None:
-                            setattr(section_obj, key, None)
-                        else:
-                            setattr(section_obj, key, str(value))
-                        return True
-
-                    # Get current value and handle type conversion
-                    current_value = getattr(section_obj, key)
-                    
-                    if current_value is None:
-                        # For None fields, handle type hints
-                        try:
-                            annotations = section_obj.__class__.__annotations__
-                            if key in annotations:
-                                type_hint = annotations[key]
-                                import typing
-                                origin = getattr(type_hint, "__origin__", None)
-                                args = getattr(type_hint, "__args__", None)
-
-                                if origin is typing.Union and type(None) in args:
-                                    # It's Optional[type]
-                                    real_type = next((t for t in args if t is not type(None)), str)
-                                    if real_type is str and value is not None:
-                                        setattr(section_obj, key, str(value))
-                                        return True
-                        except (AttributeError, KeyError, TypeError, StopIteration):
-                            pass
-                        
-                        # Fallback: set as-is
-                        setattr(section_obj, key, value)
-                        return True
-
-                    # For non-None values, do type conversion
-                    target_type = type(current_value)
-                    
-                    if target_type is bool and isinstance(value, int):
-                        typed_value = bool(value)
-                    elif value is None:
-                        typed_value = None
-                    elif isinstance(value, target_type):
-                        typed_value = value
-                    else:
-                        try:
-                            typed_value = target_type(value)
-                        except (ValueError, TypeError):
-                            logger.warning(f"Cannot convert {key}={value} to {target_type}")
-                            typed_value = value
+            section_obj = getattr(self.settings, section, None)
+            coercers = getattr(section_obj, '__field_coercers__', None)
+            coerce = coercers.get(key) if coercers else None
+            if coerce is None:
+                return False, False
 
-                    setattr(section_obj, key, typed_value)
-                    return True
+            try:
+                typed_value = coerce(value)
+            except (ValueError, TypeError):
+                logger.warning(f"Cannot convert {section}.{key}={value}")
+                typed_value = value
 
-            return False
+            if getattr(section_obj, key) == typed_value:
+                return True, False
+
+            setattr(section_obj, key, typed_value)
+            return True, True
 
         except (AttributeError, KeyError, ValueError, TypeError) as e:
             logger.error(f"Error setting {section}.{key}: {e}")
-            return False
+            return False, False
     
-    def get_conversion_units(self) -> Dict[str, List[str]]:
+    def update(self, section: str, values: Dict[str, Any]) -> bool:
+        """
+        Set several values of one section.
+        
+        Args:
+            section: Section name (network, conversions, logging, ui)
+            values: Mapping of setting key to new value
+            
+        Returns:
+            bool: True if every setting was changed
+        """
+        return self.update_sections({section: values})
+    
+    def update_sections(self, sections: Dict[str, Dict[str, Any]]) -> bool:
+        """
+        Set values across several sections as one change.
+        
+        All values are stored first and the settings are marked dirty once,
+        and only if a value actually changed, so at most one autosave is
+        scheduled for the whole batch.
+        
+        Args:
+            sections: Mapping of section name to {setting key: new value}
+            
+        Returns:
+            bool: True if every setting was changed
+        """
+        changed = True
+        any_modified = False
+        for section, values in sections.items():
+            for key, value in values.items():
+                stored, modified = self._set_value(section, key, value)
+                changed = changed and stored
+                any_modified = any_modified or modified
+        
+        if any_modified:
+            self.mark_dirty()
+        return changed
+    
+    def add_recent_config(self, path: str) -> None:
+        """
+        Move a configuration file to the top of the recent configurations list.
+        
+        Args:
+            path: Path to the configuration file
+        """
+        recent = [p for p in self.settings.ui.recent_configs if p != path]
+        recent.insert(0, path)
+        self.settings.ui.recent_configs = recent[:MAX_RECENT_CONFIGS]
+        self.mark_dirty()
+    
+    def get_conversion_units(self) -> Mapping[str, Tuple[str, ...]]:
         """
         Get available units for each conversion type.
         
         Returns:
-            dict: Dictionary mapping conversion types to available units
-        """
-        return {
-            "altitude": ["meters", "feet"],
-            "speed": ["mps", "kmh", "knots"],
-            "vario": ["mps", "fpm"],
-            "acceleration": ["mps2", "fps2"]
-        }
+            Read-only mapping of conversion types to available units
+        """
+        return CONVERSION_UNITS
     
-    def get_conversion_factors(self) -> Dict[str, Dict[str, float]]:
+    def get_conversion_factors(self) -> Mapping[str, Mapping[str, float]]:
         """
         Get conversion factors for unit conversions.
         
         Returns:
-            dict: Nested dictionary with conversion factors
-        """
-        return {
-            "altitude": {
-                "meters_to_feet": 3.28084,
-                "feet_to_meters": 0.3048
-            },
-            "speed": {
-                "mps_to_kmh": 3.6,
-                "mps_to_knots": 1.94384,
-                "kmh_to_mps": 0.277778,
-                "kmh_to_knots": 0.539957,
-                "knots_to_mps": 0.514444,
-                "knots_to_kmh": 1.852
-            },
-            "vario": {
-                "mps_to_fpm": 196.85,
-                "fpm_to_mps": 0.00508
-            },
-            "acceleration": {
-                "mps2_to_fps2": 3.28084,
-                "fps2_to_mps2": 0.3048
-            }
-        }
+            Read-only nested mapping with conversion factors
+        """
+        return CONVERSION_FACTORS
     
     def apply_logging_settings(self) -> None:
         """Apply logging settings to the Python logging system."""
@@ -390,14 +686,7 @@ class MiddlewareSettings:
             log_file_path = self.settings.logging.log_file_path
 
             # Convert level string to logging level
-            level_map = {
-                "DEBUG": logging.DEBUG,
-                "INFO": logging.INFO,
-                "WARNING": logging.WARNING,
-                "ERROR": logging.ERROR,
-                "CRITICAL": logging.CRITICAL
-            }
-            level = level_map.get(log_level, logging.INFO)
+            level = LOG_LEVELS.get(log_level, logging.INFO)
 
             # Use centralized logging configuration
             from condor_udp_middleware.core.log_config import configure_logging
@@ -439,16 +728,11 @@ class MiddlewareSettings:
         
         # Validate conversion settings
         conversion_errors = []
-        available_units = self.get_conversion_units()
-        
-        if self.settings.conversions.altitude not in available_units["altitude"]:
-            conversion_errors.append(f"Invalid altitude unit: {self.settings.conversions.altitude}")
-        if self.settings.conversions.speed not in available_units["speed"]:
-            conversion_errors.append(f"Invalid speed unit: {self.settings.conversions.speed}")
-        if self.settings.conversions.vario not in available_units["vario"]:
-            conversion_errors.append(f"Invalid vario unit: {self.settings.conversions.vario}")
-        if self.settings.conversions.acceleration not in available_units["acceleration"]:
-            conversion_errors.append(f"Invalid acceleration unit: {self.settings.conversions.acceleration}")
+        conversions = self.settings.conversions
+        for unit_type, allowed in CONVERSION_UNIT_SETS.items():
+            unit = getattr(conversions, unit_type)
+            if unit not in allowed:
+                conversion_errors.append(f"Invalid {unit_type} unit: {unit}")
             
         if conversion_errors:
             errors["conversions"] = conversion_errors
@@ -474,7 +758,7 @@ if __name__ == "__main__":
     
     # Print current settings
     print("Current Settings:")
-    settings_dict = dataclasses.asdict(settings.settings)
+    settings_dict = _settings_to_dict(settings.settings)
     for section, section_settings in settings_dict.items():
         if isinstance(section_settings, dict):
             print(f"\n[{section}]")
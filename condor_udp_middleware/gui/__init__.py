@@ -3,10 +3,32 @@
 """
 Package initialization for condor_udp_middleware.gui
 GUI components for the Condor UDP Middleware application.
+
+Submodules are imported on first attribute access (PEP 562), so importing
+the package does not pull in tkinter until a GUI class is actually used.
 """
 
-from .main_window import MiddlewareMainWindow
-from .status_panel import MiddlewareStatusPanel
-from .settings_dialog import MiddlewareSettingsDialog
+import importlib
+
+# Public name -> submodule that defines it
+_LAZY_IMPORTS = {
+    'MiddlewareMainWindow': '.main_window',
+    'MiddlewareStatusPanel': '.status_panel',
+    'MiddlewareSettingsDialog': '.settings_dialog',
+}
+
+__all__ = ['MiddlewareMainWindow', 'MiddlewareStatusPanel', 'MiddlewareSettingsDialog']
+
+
+def __getattr__(name):
+    module_name = _LAZY_IMPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value  # Cache so later lookups bypass __getattr__
+    return value
+
 
-__all__ = ['MiddlewareMainWindow', 'MiddlewareStatusPanel', 'MiddlewareSettingsDialog']
\ No newline at end of file
+def __dir__():
+    return sorted(list(globals()) + __all__)
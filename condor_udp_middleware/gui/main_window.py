@@ -14,12 +14,15 @@ import tkinter as tk
 from tkinter import ttk, messagebox, filedialog
 import threading
 import asyncio
+import concurrent.futures
 import logging
+import queue
 from typing import Optional, Dict, Any
 import webbrowser
 
 # Import our modules
 from condor_udp_middleware.core.bridge import UDPMiddlewareBridge
+from condor_udp_middleware.core.log_config import add_text_handler, remove_text_handler
 from condor_udp_middleware.core.settings import MiddlewareSettings
 from condor_udp_middleware.gui.status_panel import MiddlewareStatusPanel
 from condor_udp_middleware.gui.settings_dialog import MiddlewareSettingsDialog
@@ -27,6 +30,58 @@ from condor_udp_middleware.gui.settings_dialog import MiddlewareSettingsDialog
 # Configure logging
 logger = logging.getLogger('gui.main_window')
 
+UI_QUEUE_EVENT = '<<UIQueueReady>>'  # Generated once per batch of pushes to wake the Tk thread
+BRIDGE_STOP_TIMEOUT = 5.0  # Seconds to wait for the bridge to stop when closing
+
+
+class _BridgeLoopThread(threading.Thread):
+    """
+    Background thread running the bridge's asyncio event loop.
+    
+    One loop serves the whole application lifetime; starting and stopping
+    the bridge only schedules coroutines on it.
+    """
+    
+    def __init__(self):
+        super().__init__(name='bridge-loop', daemon=True)
+        self._loop_future: concurrent.futures.Future = concurrent.futures.Future()
+    
+    @property
+    def loop(self) -> asyncio.AbstractEventLoop:
+        """The event loop, waiting for the thread to create it if needed."""
+        return self._loop_future.result()
+    
+    def run(self) -> None:
+        loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(loop)
+        self._loop_future.set_result(loop)
+        try:
+            loop.run_forever()
+        finally:
+            loop.close()
+    
+    def submit(self, coro) -> concurrent.futures.Future:
+        """
+        Schedule a coroutine on the loop from another thread.
+        
+        Args:
+            coro: Coroutine to run
+            
+        Returns:
+            Future resolved with the coroutine's result
+        """
+        return asyncio.run_coroutine_threadsafe(coro, self.loop)
+    
+    def stop(self) -> None:
+        """Ask the loop to stop, without waiting for the thread to finish."""
+        loop = self.loop
+        loop.call_soon_threadsafe(loop.stop)
+    
+    def shutdown(self, timeout: Optional[float] = None) -> None:
+        """Stop the loop and wait for the thread to finish."""
+        self.stop()
+        self.join(timeout)
+
 
 class MiddlewareMainWindow:
     """
@@ -48,19 +103,46 @@ class MiddlewareMainWindow:
         """
         self.master = master
         self.bridge: Optional[UDPMiddlewareBridge] = None
-        self.settings = MiddlewareSettings()
+        self.settings = MiddlewareSettings(autosave=True)
+        
+        # Asyncio event loop for the bridge, kept for the lifetime of the window
+        self._loop_thread = _BridgeLoopThread()
+        self._loop_thread.start()
         
-        # Asyncio event loop for the bridge
-        self.loop: Optional[asyncio.AbstractEventLoop] = None
-        self.bridge_thread: Optional[threading.Thread] = None
+        # Worker for opening and saving configuration files away from the Tk thread
+        self._io_pool = concurrent.futures.ThreadPoolExecutor(max_workers=1, thread_name_prefix='config-io')
+        
+        # (callback, args) posted by the bridge loop and worker threads; only the
+        # Tk thread runs them. The event is set while a drain is pending, so a
+        # burst of pushes wakes Tk only once and an idle queue costs nothing
+        self._ui_queue: queue.SimpleQueue = queue.SimpleQueue()
+        self._drain_scheduled = threading.Event()
+        
+        # Options last applied per widget, so unchanged updates skip Tk entirely
+        self._widget_state: Dict[str, Dict[str, Any]] = {}
+        
+        # Recent-configurations menu is rebuilt only when the list changes
+        self._recent_snapshot: Optional[tuple] = None  # recent_configs the menu was built from
+        
+        # "Running" status bar text and the network endpoints it was built for
+        self._running_text = ""
+        self._running_key: Optional[tuple] = None
+        
+        # Set once closing has started / finished, so a second close request is ignored
+        self._closing = False
+        self._closed = False
+        
+        # Shared ttk style object, reused when the theme changes
+        self._style = ttk.Style(self.master)
         
         # Setup UI
         self._setup_window()
         self._create_menu()
         self._create_widgets()
         
-        # Update status periodically
-        self._update_status()
+        # Start from the disconnected state, then apply bridge status as it arrives
+        self._apply_status({'running': False})
+        self.master.bind(UI_QUEUE_EVENT, lambda event: self._drain_ui_queue())
         
         # Initialize Bridge (but don't start it yet)
         self._init_bridge()
@@ -97,7 +179,7 @@ class MiddlewareMainWindow:
         """Apply the selected theme from settings."""
         theme = self.settings.get('ui', 'theme')
         
-        style = ttk.Style()
+        style = self._style
         if theme == 'system':
             # Use system theme (default)
             if sys.platform == 'win32':
@@ -120,7 +202,8 @@ class MiddlewareMainWindow:
         self.menu_bar = tk.Menu(self.master)
         
         # File menu
-        self.file_menu = tk.Menu(self.menu_bar, tearoff=0)
+        # The recent configurations submenu is filled in when the menu opens
+        self.file_menu = tk.Menu(self.menu_bar, tearoff=0, postcommand=self._update_recent_menu)
         self.file_menu.add_command(label="Open Configuration...", command=self._open_config)
         self.file_menu.add_command(label="Save Configuration", command=self._save_config)
         self.file_menu.add_command(label="Save Configuration As...", command=self._save_config_as)
@@ -128,7 +211,6 @@ class MiddlewareMainWindow:
         
         # Recent configs submenu
         self.recent_menu = tk.Menu(self.file_menu, tearoff=0)
-        self._update_recent_menu()
         self.file_menu.add_cascade(label="Recent Configurations", menu=self.recent_menu)
         
         self.file_menu.add_separator()
@@ -156,12 +238,17 @@ class MiddlewareMainWindow:
         self.master.config(menu=self.menu_bar)
     
     def _update_recent_menu(self) -> None:
-        """Update the recent configurations menu."""
+        """Update the recent configurations menu if the list has changed."""
+        recent_configs = self.settings.settings.ui.recent_configs
+        snapshot = tuple(recent_configs)
+        if snapshot == self._recent_snapshot:
+            return
+        self._recent_snapshot = snapshot
+        
         # Clear existing items
         self.recent_menu.delete(0, tk.END)
         
         # Add recent configs
-        recent_configs = self.settings.settings.ui.recent_configs
         if recent_configs:
             for path in recent_configs:
                 self.recent_menu.add_command(
@@ -171,9 +258,8 @@ class MiddlewareMainWindow:
         else:
             self.recent_menu.add_command(label="No recent configurations", state=tk.DISABLED)
     
-    def _setup_log_handler(self, add_text_handler=None) -> None:
+    def _setup_log_handler(self) -> None:
         """Set up a custom log handler to show logs in the UI."""
-        from condor_udp_middleware.core.log_config import add_text_handler
         add_text_handler(self.log_text)
 
     def _create_widgets(self) -> None:
@@ -207,9 +293,11 @@ class MiddlewareMainWindow:
         self.conversion_frame = ttk.LabelFrame(self.controls_left, text="Quick Conversions", padding="5")
         self.conversion_frame.pack(side="left", padx=10, fill="y")
         
+        conversions = self.settings.get('conversions')
+        
         # Conversion enable/disable
         self.conversions_enabled_var = tk.BooleanVar()
-        self.conversions_enabled_var.set(self.settings.get('conversions', 'enabled'))
+        self.conversions_enabled_var.set(conversions.enabled)
         self.conversions_enabled_check = ttk.Checkbutton(
             self.conversion_frame,
             text="Enable Conversions",
@@ -225,7 +313,7 @@ class MiddlewareMainWindow:
         # Altitude unit
         ttk.Label(self.units_frame, text="Altitude:").grid(row=0, column=0, sticky="w", padx=2)
         self.altitude_unit_var = tk.StringVar()
-        self.altitude_unit_var.set(self.settings.get('conversions', 'altitude'))
+        self.altitude_unit_var.set(conversions.altitude)
         self.altitude_combo = ttk.Combobox(
             self.units_frame, 
             textvariable=self.altitude_unit_var,
@@ -234,12 +322,11 @@ class MiddlewareMainWindow:
             state="readonly"
         )
         self.altitude_combo.grid(row=0, column=1, padx=2)
-        self.altitude_combo.bind("<<ComboboxSelected>>", self._on_unit_change)
         
         # Speed unit
         ttk.Label(self.units_frame, text="Speed:").grid(row=0, column=2, sticky="w", padx=2)
         self.speed_unit_var = tk.StringVar()
-        self.speed_unit_var.set(self.settings.get('conversions', 'speed'))
+        self.speed_unit_var.set(conversions.speed)
         self.speed_combo = ttk.Combobox(
             self.units_frame,
             textvariable=self.speed_unit_var,
@@ -248,12 +335,11 @@ class MiddlewareMainWindow:
             state="readonly"
         )
         self.speed_combo.grid(row=0, column=3, padx=2)
-        self.speed_combo.bind("<<ComboboxSelected>>", self._on_unit_change)
         
         # Vario unit
         ttk.Label(self.units_frame, text="Vario:").grid(row=1, column=0, sticky="w", padx=2)
         self.vario_unit_var = tk.StringVar()
-        self.vario_unit_var.set(self.settings.get('conversions', 'vario'))
+        self.vario_unit_var.set(conversions.vario)
         self.vario_combo = ttk.Combobox(
             self.units_frame,
             textvariable=self.vario_unit_var,
@@ -262,7 +348,16 @@ class MiddlewareMainWindow:
             state="readonly"
         )
         self.vario_combo.grid(row=1, column=1, padx=2)
-        self.vario_combo.bind("<<ComboboxSelected>>", self._on_unit_change)
+        
+        # Each unit variable reports its own writes; _last_units filters out no-op selections
+        self._unit_vars = {
+            'altitude': self.altitude_unit_var,
+            'speed': self.speed_unit_var,
+            'vario': self.vario_unit_var
+        }
+        self._last_units = {key: var.get() for key, var in self._unit_vars.items()}
+        for key, var in self._unit_vars.items():
+            var.trace_add('write', lambda *args, key=key: self._on_unit_change(key))
         
         # Right side - status indicators
         self.indicators_frame = ttk.Frame(self.control_frame)
@@ -366,16 +461,16 @@ class MiddlewareMainWindow:
     def _init_bridge(self) -> None:
         """Initialize the bridge instance."""
         try:
-            self.bridge = UDPMiddlewareBridge()
+            self.bridge = UDPMiddlewareBridge(status_callback=self._push_status)
             logger.info("Bridge initialized")
-            self.status_bar.config(text="Bridge initialized - Ready to start")
+            self._update_widget(self.status_bar, text="Bridge initialized - Ready to start")
         except (OSError, ValueError, TypeError, AttributeError) as e:
             logger.error(f"Error initializing bridge: {e}")
             messagebox.showerror(
                 "Initialization Error",
                 f"Failed to initialize bridge: {e}"
             )
-            self.status_bar.config(text="Bridge initialization failed")
+            self._update_widget(self.status_bar, text="Bridge initialization failed")
     
     def _toggle_bridge(self) -> None:
         """Start or stop the bridge."""
@@ -386,7 +481,7 @@ class MiddlewareMainWindow:
             )
             return
             
-        if self.bridge_thread and self.bridge_thread.is_alive():
+        if self.bridge.running:
             # Bridge is running, stop it
             self._stop_bridge()
         else:
@@ -394,61 +489,46 @@ class MiddlewareMainWindow:
             self._start_bridge()
     
     def _start_bridge(self) -> None:
-        """Start the bridge in a separate thread."""
-        # Disable the button while starting
-        self.start_stop_button.config(state=tk.DISABLED)
-        self.status_bar.config(text="Starting middleware...")
-        
-        # Function to run the bridge in a background thread
-        def run_bridge():
-            try:
-                # Create a new event loop for this thread
-                self.loop = asyncio.new_event_loop()
-                asyncio.set_event_loop(self.loop)
-                
-                # Start the bridge
-                self.loop.run_until_complete(self.bridge.start())
-                
-                # Update UI in main thread
-                self.master.after(0, lambda: self._on_bridge_started())
-                
-                # Run the event loop
-                self.loop.run_forever()
-                
-            except Exception as e:
-                logger.error(f"Error in bridge thread: {e}")
-                # Update UI in main thread
-                self.master.after(0, lambda: self._on_bridge_error(str(e)))
-                
-            finally:
-                # Clean up
-                if self.loop and self.loop.is_running():
-                    self.loop.close()
-                
-                # Update UI in main thread
-                self.master.after(0, lambda: self._on_bridge_stopped())
+        """Start the bridge on the background event loop."""
+        if not self.bridge:
+            return
         
-        # Start the bridge in a background thread
-        self.bridge_thread = threading.Thread(target=run_bridge, daemon=True)
-        self.bridge_thread.start()
+        # Disable the button while starting
+        self._update_widget(self.start_stop_button, state=tk.DISABLED)
+        self._update_widget(self.status_bar, text="Starting middleware...")
+        
+        future = self._loop_thread.submit(self.bridge.start())
+        # Done callbacks run on the loop thread; hand the result to the Tk thread
+        future.add_done_callback(lambda f: self._call_on_tk(self._on_bridge_start_done, f))
+    
+    def _on_bridge_start_done(self, future: concurrent.futures.Future) -> None:
+        """Called on the Tk thread once bridge.start() has finished."""
+        error = future.exception()
+        if error is not None:
+            logger.error(f"Error starting bridge: {error}")
+            self._on_bridge_error(str(error))
+        elif not self.bridge.running:
+            # start() already stopped the bridge again and logged why
+            self._on_bridge_error("Could not open the UDP ports (see log for details)")
+        else:
+            self._on_bridge_started()
     
     def _on_bridge_started(self) -> None:
         """Called when the bridge has started."""
-        self.start_stop_button.config(text="Stop Middleware", state=tk.NORMAL)
+        self._update_widget(self.start_stop_button, text="Stop Middleware", state=tk.NORMAL)
         
-        # Get current settings for status
+        # Get current settings for status; the text is only rebuilt when the endpoints change
         network = self.settings.get('network')
-        self.status_bar.config(
-            text=f"Middleware running - Listening on :{network.input_port}, forwarding to {network.output_host}:{network.output_port}"
-        )
-        
-        # Save settings for next time
-        self.settings.save()
+        key = (network.input_port, network.output_host, network.output_port)
+        if key != self._running_key:
+            self._running_key = key
+            self._running_text = f"Middleware running - Listening on :{key[0]}, forwarding to {key[1]}:{key[2]}"
+        self._update_widget(self.status_bar, text=self._running_text)
     
     def _on_bridge_error(self, error_msg: str) -> None:
         """Called when there's an error starting the bridge."""
-        self.start_stop_button.config(text="Start Middleware", state=tk.NORMAL)
-        self.status_bar.config(text=f"Bridge error: {error_msg}")
+        self._update_widget(self.start_stop_button, text="Start Middleware", state=tk.NORMAL)
+        self._update_widget(self.status_bar, text=f"Bridge error: {error_msg}")
         
         messagebox.showerror(
             "Bridge Error",
@@ -457,102 +537,144 @@ class MiddlewareMainWindow:
     
     def _stop_bridge(self) -> None:
         """Stop the bridge."""
-        if not self.bridge or not self.loop:
+        if not self.bridge:
             return
 
         # Disable the button while stopping
-        self.start_stop_button.config(state=tk.DISABLED)
-        self.status_bar.config(text="Stopping middleware...")
-
-        # Stop the bridge asynchronously
-        def stop_async():
-            try:
-                asyncio.run_coroutine_threadsafe(self.bridge.stop(), self.loop)
-            except Exception as e:
-                logger.error(f"Error stopping bridge: {e}")
-                self.master.after(0, self._on_bridge_stopped)
+        self._update_widget(self.start_stop_button, state=tk.DISABLED)
+        self._update_widget(self.status_bar, text="Stopping middleware...")
 
-        # Run in a thread to avoid blocking the GUI
-        thread = threading.Thread(target=stop_async, daemon=True)
-        thread.start()
-
-        # Start polling to check if the bridge has stopped
-        self._poll_bridge_stopped()
-    
-    def _poll_bridge_stopped(self) -> None:
-        """Poll to check if the bridge has stopped."""
-        if self.bridge and not self.bridge.running:
-            self._on_bridge_stopped()
-        elif self.bridge_thread and not self.bridge_thread.is_alive():
-            self._on_bridge_stopped()
-        else:
-            # Continue polling every 100ms
-            self.master.after(100, self._poll_bridge_stopped)
+        # Stop the bridge on its event loop; the UI updates once stop() returns
+        future = self._loop_thread.submit(self.bridge.stop())
+        future.add_done_callback(lambda f: self._call_on_tk(self._on_bridge_stop_done, f))
+    
+    def _on_bridge_stop_done(self, future: concurrent.futures.Future) -> None:
+        """Called on the Tk thread once bridge.stop() has finished."""
+        error = future.exception()
+        if error is not None:
+            logger.error(f"Error stopping bridge: {error}")
+        self._on_bridge_stopped()
     
     def _on_bridge_stopped(self) -> None:
         """Called when the bridge has stopped."""
-        self.start_stop_button.config(text="Start Middleware", state=tk.NORMAL)
-        self.status_bar.config(text="Middleware stopped")
+        self._update_widget(self.start_stop_button, text="Start Middleware", state=tk.NORMAL)
+        self._update_widget(self.status_bar, text="Middleware stopped")
     
-    def _update_status(self) -> None:
-        """Update status displays periodically."""
-        if self.bridge and self.bridge.running:
+    def _call_on_tk(self, callback, *args) -> None:
+        """
+        Run a callback on the Tk thread; safe to call from any thread.
+        
+        Args:
+            callback: Function to call
+            *args: Arguments for the callback
+        """
+        self._ui_queue.put_nowait((callback, args))
+        self._wake_tk()
+    
+    def _push_status(self, status: Dict[str, Any]) -> None:
+        """
+        Queue a status snapshot from the bridge thread.
+        
+        Args:
+            status: Bridge status dictionary
+        """
+        self._ui_queue.put_nowait((self._apply_status, (status,)))
+        self._wake_tk()
+    
+    def _wake_tk(self) -> None:
+        """Ask the Tk thread to drain the UI queue, unless a drain is already pending."""
+        if self._drain_scheduled.is_set():
+            return
+        self._drain_scheduled.set()
+        try:
+            self.master.event_generate(UI_QUEUE_EVENT, when='tail')
+        except (tk.TclError, RuntimeError):
+            pass  # Window closed or mainloop gone; nothing is left to update
+    
+    def _drain_ui_queue(self) -> None:
+        """Run the callbacks posted by background threads since the last drain."""
+        # Cleared before draining, so a push racing with the drain wakes Tk again
+        self._drain_scheduled.clear()
+        
+        items = []
+        try:
+            while True:
+                items.append(self._ui_queue.get_nowait())
+        except queue.Empty:
+            pass
+        
+        # Only the latest status snapshot matters; older ones are skipped
+        apply_status = self._apply_status
+        last_status = max((i for i, (callback, _) in enumerate(items) if callback == apply_status), default=-1)
+        
+        for i, (callback, args) in enumerate(items):
+            if callback == apply_status and i != last_status:
+                continue
             try:
-                # Get bridge status
-                status = self.bridge.get_status()
-
-                # Validate status before updating UI
-                if status and isinstance(status, dict):
-                    # Update status panel
-                    self.status_panel.update_status(status)
-
-                    # Update connection indicators
-                    self._update_connection_indicators(status)
-                else:
-                    logger.warning("Invalid status received from bridge")
-                    self._update_connection_indicators(None)
-                    self.status_panel.reset_status()
-
+                callback(*args)
             except Exception as e:
-                logger.error(f"Error updating status: {e}")
-                # On error, show disconnected status
+                logger.error(f"Error in UI callback: {e}")
+    
+    def _apply_status(self, status: Dict[str, Any]) -> None:
+        """Update status displays from a bridge status snapshot."""
+        try:
+            if not isinstance(status, dict):
+                logger.warning("Invalid status received from bridge")
+                status = None
+            
+            if status and status.get('running'):
+                # Update status panel
+                self.status_panel.update_status(status)
+                
+                # Update connection indicators
+                self._update_connection_indicators(status)
+            else:
+                # Bridge not running, show disconnected status
                 self._update_connection_indicators(None)
                 self.status_panel.reset_status()
-        else:
-            # Bridge not running, show disconnected status
+        
+        except Exception as e:
+            logger.error(f"Error updating status: {e}")
+            # On error, show disconnected status
             self._update_connection_indicators(None)
             self.status_panel.reset_status()
-        
-        # Schedule next update
-        self.master.after(1000, self._update_status)
     
     def _update_connection_indicators(self, status: Optional[Dict[str, Any]]) -> None:
         """Update the connection status indicators."""
         if not status:
             # Not running, all disconnected
-            self.input_status.config(text="Stopped", foreground="red")
-            self.output_status.config(text="Stopped", foreground="red")
-            return
-        
-        # Input UDP status
-        if 'input_udp' in status and status['input_udp']:
-            input_udp = status['input_udp']
-            if input_udp['running']:
-                self.input_status.config(text="Active", foreground="green")
-            else:
-                self.input_status.config(text="Error", foreground="orange")
+            input_state = output_state = ("Stopped", "red")
         else:
-            self.input_status.config(text="Stopped", foreground="red")
-        
-        # Output UDP status
-        if 'output_udp' in status and status['output_udp']:
-            output_udp = status['output_udp']
-            if output_udp['active']:
-                self.output_status.config(text="Active", foreground="green")
+            # Input UDP status
+            input_udp = status.get('input_udp')
+            if input_udp:
+                input_state = ("Active", "green") if input_udp['running'] else ("Error", "orange")
             else:
-                self.output_status.config(text="Error", foreground="orange")
-        else:
-            self.output_status.config(text="Stopped", foreground="red")
+                input_state = ("Stopped", "red")
+            
+            # Output UDP status
+            output_udp = status.get('output_udp')
+            if output_udp:
+                output_state = ("Active", "green") if output_udp['active'] else ("Error", "orange")
+            else:
+                output_state = ("Stopped", "red")
+        
+        self._update_widget(self.input_status, text=input_state[0], foreground=input_state[1])
+        self._update_widget(self.output_status, text=output_state[0], foreground=output_state[1])
+    
+    def _update_widget(self, widget: tk.Widget, **options) -> None:
+        """
+        Configure widget options, skipping the Tk call when nothing changed.
+        
+        Args:
+            widget: Widget to configure
+            **options: Options for widget.config()
+        """
+        applied = self._widget_state.setdefault(str(widget), {})
+        changed = {key: value for key, value in options.items() if applied.get(key) != value}
+        if changed:
+            widget.config(**changed)
+            applied.update(changed)
     
     def _on_conversions_toggle(self) -> None:
         """Handle conversion enable/disable toggle."""
@@ -561,33 +683,51 @@ class MiddlewareMainWindow:
         # Update settings
         self.settings.set('conversions', 'enabled', enabled)
         
-        # Update bridge if running
-        if self.bridge:
-            self.bridge.update_conversion_settings({'enabled': enabled})
+        # Update bridge
+        self._update_bridge_conversions({'enabled': enabled})
         
         # Update UI
         self._update_conversion_controls()
         
         logger.info(f"Conversions {'enabled' if enabled else 'disabled'}")
     
-    def _on_unit_change(self, event=None) -> None:
-        """Handle unit dropdown changes."""
+    def _on_unit_change(self, key: str) -> None:
+        """
+        Handle a unit dropdown change.
+        
+        Args:
+            key: Which unit changed ('altitude', 'speed' or 'vario')
+        """
+        new = self._unit_vars[key].get()
+        if new == self._last_units[key]:
+            return
+        self._last_units[key] = new
+        
         # Update settings
-        self.settings.set('conversions', 'altitude', self.altitude_unit_var.get())
-        self.settings.set('conversions', 'speed', self.speed_unit_var.get())
-        self.settings.set('conversions', 'vario', self.vario_unit_var.get())
+        self.settings.set('conversions', key, new)
         
-        # Update bridge if running
-        if self.bridge:
-            conversion_settings = {
-                'altitude': self.altitude_unit_var.get(),
-                'speed': self.speed_unit_var.get(),
-                'vario': self.vario_unit_var.get()
-            }
-            self.bridge.update_conversion_settings(conversion_settings)
+        # Update bridge
+        self._update_bridge_conversions({key: new})
         
-        logger.info(f"Unit settings updated: altitude={self.altitude_unit_var.get()}, "
-                   f"speed={self.speed_unit_var.get()}, vario={self.vario_unit_var.get()}")
+        logger.info(f"Unit settings updated: {key}={new}")
+    
+    def _update_bridge_conversions(self, conversion_settings: Dict[str, Any]) -> None:
+        """
+        Pass changed conversion settings to the bridge.
+        
+        A running bridge is updated on its own event loop, without waiting
+        for the result, so the Tk thread never blocks on it.
+        
+        Args:
+            conversion_settings: Changed conversion settings
+        """
+        if not self.bridge:
+            return
+        
+        if self.bridge.running:
+            self._loop_thread.submit(self.bridge.update_conversion_settings_async(conversion_settings))
+        else:
+            self.bridge.update_conversion_settings(conversion_settings)
     
     def _update_conversion_controls(self) -> None:
         """Update the state of conversion controls."""
@@ -607,22 +747,33 @@ class MiddlewareMainWindow:
             )
             
         if path:
-            if self.bridge.update_settings(path):
-                self.settings = self.bridge.settings
-                self._refresh_ui_from_settings()
-                self.settings.add_recent_config(path)
-                self._update_recent_menu()
-                self.status_bar.config(text=f"Loaded configuration from {path}")
-            else:
-                messagebox.showerror(
-                    "Configuration Error",
-                    f"Failed to load configuration from {path}"
-                )
+            self._update_widget(self.status_bar, text=f"Loading configuration from {path}...")
+            future = self._io_pool.submit(self.bridge.update_settings, path)
+            future.add_done_callback(lambda f: self._call_on_tk(self._after_open_config, path, f))
+    
+    def _after_open_config(self, path: str, future: concurrent.futures.Future) -> None:
+        """Called on the Tk thread once a configuration file has been loaded."""
+        error = future.exception()
+        if error is not None:
+            logger.error(f"Error loading configuration: {error}")
+        
+        if error is None and future.result():
+            self.settings = self.bridge.settings
+            self.settings.autosave = True
+            self._refresh_ui_from_settings()
+            self.settings.add_recent_config(path)
+            self._update_recent_menu()
+            self._update_widget(self.status_bar, text=f"Loaded configuration from {path}")
+        else:
+            messagebox.showerror(
+                "Configuration Error",
+                f"Failed to load configuration from {path}"
+            )
     
     def _save_config(self) -> None:
         """Save the current configuration."""
         if self.settings.save():
-            self.status_bar.config(text=f"Configuration saved to {self.settings.config_file}")
+            self._update_widget(self.status_bar, text=f"Configuration saved to {self.settings.config_file}")
         else:
             messagebox.showerror("Configuration Error", "Failed to save configuration")
     
@@ -635,17 +786,26 @@ class MiddlewareMainWindow:
         )
         
         if path:
-            if self.settings.save(path):
-                self.settings.add_recent_config(path)
-                self._update_recent_menu()
-                self.status_bar.config(text=f"Configuration saved to {path}")
-            else:
-                messagebox.showerror("Configuration Error", f"Failed to save configuration to {path}")
+            future = self._io_pool.submit(self.settings.save, path)
+            future.add_done_callback(lambda f: self._call_on_tk(self._after_save_config_as, path, f))
+    
+    def _after_save_config_as(self, path: str, future: concurrent.futures.Future) -> None:
+        """Called on the Tk thread once the configuration has been saved to a new file."""
+        error = future.exception()
+        if error is not None:
+            logger.error(f"Error saving configuration: {error}")
+        
+        if error is None and future.result():
+            self.settings.add_recent_config(path)
+            self._update_recent_menu()
+            self._update_widget(self.status_bar, text=f"Configuration saved to {path}")
+        else:
+            messagebox.showerror("Configuration Error", f"Failed to save configuration to {path}")
     
     def _open_settings(self) -> None:
         """Open the settings dialog."""
-        dialog = MiddlewareSettingsDialog(self.master, self.settings)
-        
+        # The dialog is built on first open and hidden, not destroyed, on close
+        dialog = MiddlewareSettingsDialog.show(self.master, self.settings)
         if dialog.result:
             self._apply_settings_changes()
     
@@ -668,25 +828,33 @@ class MiddlewareMainWindow:
             ):
                 self._stop_bridge()
                 self.master.after(1000, self._start_bridge)
-            else:
-                self.settings.save()
-        else:
-            self.settings.save()
     
     def _refresh_ui_from_settings(self) -> None:
         """Refresh UI controls from current settings."""
         # Update conversion controls
-        self.conversions_enabled_var.set(self.settings.get('conversions', 'enabled'))
-        self.altitude_unit_var.set(self.settings.get('conversions', 'altitude'))
-        self.speed_unit_var.set(self.settings.get('conversions', 'speed'))
-        self.vario_unit_var.set(self.settings.get('conversions', 'vario'))
+        conversions = self.settings.get('conversions')
+        self.conversions_enabled_var.set(conversions.enabled)
+        
+        # Values coming from settings are not changes to write back
+        self._last_units.update(
+            altitude=conversions.altitude,
+            speed=conversions.speed,
+            vario=conversions.vario
+        )
+        self.altitude_unit_var.set(conversions.altitude)
+        self.speed_unit_var.set(conversions.speed)
+        self.vario_unit_var.set(conversions.vario)
         
         self._update_conversion_controls()
     
     def _reset_stats(self) -> None:
         """Reset conversion statistics."""
         if self.bridge and hasattr(self.bridge, 'unit_converter'):
-            self.bridge.unit_converter.reset_statistics()
+            if self.bridge.running:
+                # Statistics are updated on the bridge's loop; reset them there too
+                self._loop_thread.loop.call_soon_threadsafe(self.bridge.unit_converter.reset_statistics)
+            else:
+                self.bridge.unit_converter.reset_statistics()
             messagebox.showinfo("Statistics Reset", "Conversion statistics have been reset.")
         else:
             messagebox.showwarning("No Statistics", "No statistics to reset (middleware not running).")
@@ -746,6 +914,9 @@ class MiddlewareMainWindow:
     
     def _on_close(self) -> None:
         """Handle window close event."""
+        if self._closing:
+            return  # Already waiting for the bridge to stop
+
         if self.bridge and self.bridge.running:
             if not messagebox.askyesno(
                     "Quit",
@@ -753,18 +924,62 @@ class MiddlewareMainWindow:
             ):
                 return
 
-            # Stop the bridge
-            self._stop_bridge()
+            self._closing = True
 
-            # Wait a moment to let it stop cleanly
-            self.master.after(200)
+            # Stop the bridge without blocking Tk; the close finishes once stop() returns,
+            # or after BRIDGE_STOP_TIMEOUT if it never does
+            self._update_widget(self.start_stop_button, state=tk.DISABLED)
+            self._update_widget(self.status_bar, text="Stopping middleware...")
+            future = self._loop_thread.submit(self.bridge.stop())
+            future.add_done_callback(lambda f: self._call_on_tk(self._finish_close, f))
+            self.master.after(int(BRIDGE_STOP_TIMEOUT * 1000), self._finish_close)
+            return
+
+        self._finish_close()
+
+    def wait_for_shutdown(self, timeout: float = BRIDGE_STOP_TIMEOUT) -> None:
+        """
+        Wait for the bridge event loop thread to exit; call after mainloop() returns.
+        
+        Args:
+            timeout: Maximum time to wait, in seconds
+        """
+        self._loop_thread.join(timeout)
+        if self._loop_thread.is_alive():
+            logger.warning(f"Bridge event loop did not stop within {timeout}s")
+
+    def _finish_close(self, stop_future: Optional[concurrent.futures.Future] = None) -> None:
+        """
+        Release resources, save settings and destroy the window.
+
+        Args:
+            stop_future: Future of the bridge.stop() call made while closing, if any
+        """
+        if self._closed:
+            return
+        self._closed = True
+
+        if stop_future is not None and stop_future.exception() is not None:
+            logger.error(f"Error stopping bridge: {stop_future.exception()}")
+
+        # Drop queued file operations without joining the worker: one still running
+        # gives up on its own once the bridge loop is gone (SETTINGS_RELOAD_TIMEOUT)
+        try:
+            self._io_pool.shutdown(wait=False, cancel_futures=True)
+        except TypeError:
+            self._io_pool.shutdown(wait=False)  # Python 3.8 has no cancel_futures
+
+        # Release the bridge's sockets on its loop, then stop the loop; the thread is
+        # joined by wait_for_shutdown() once mainloop() returns, so Tk never blocks on it
+        if self.bridge:
+            self._loop_thread.loop.call_soon_threadsafe(self.bridge.close)
+        self._loop_thread.stop()
 
         # Remove the text handler before closing
-        from condor_udp_middleware.core.log_config import remove_text_handler
         remove_text_handler()
 
-        # Save settings
-        self.settings.save()
+        # Write changes still waiting for the autosave timer
+        self.settings.flush_now()
 
         # Destroy the window
         self.master.destroy()
@@ -774,4 +989,5 @@ class MiddlewareMainWindow:
 if __name__ == "__main__":
     root = tk.Tk()
     app = MiddlewareMainWindow(root)
-    root.mainloop()
\ No newline at end of file
+    root.mainloop()
+    app.wait_for_shutdown()
\ No newline at end of file
@@ -18,6 +18,9 @@ from condor_udp_middleware.core.settings import MiddlewareSettings
 # Configure logging
 logger = logging.getLogger('gui.settings_dialog')
 
+DIALOG_WIDTH = 650  # Initial dialog size in pixels
+DIALOG_HEIGHT = 600
+
 
 class MiddlewareSettingsDialog:
     """
@@ -27,57 +30,127 @@ class MiddlewareSettingsDialog:
     organized by category using a notebook.
     """
     
-    def __init__(self, parent, settings: MiddlewareSettings):
+    def __init__(self, parent, settings: MiddlewareSettings, keep_alive: bool = False):
         """
-        Initialize the settings dialog.
+        Initialize the settings dialog and show it modally.
         
         Args:
             parent: Parent widget
             settings: Settings instance
+            keep_alive: Hide the dialog on close instead of destroying it, so
+                it can be shown again with run()
         """
         self.parent = parent
         self.settings = settings
-        self.result = False  # True if settings were changed and OK was clicked
+        self.keep_alive = keep_alive
+        self.result = False  # True once edited settings have been saved with OK or Apply
+        
+        # Control groups toggled by the checkboxes (filled in as their tabs are built)
+        self._conversion_widgets: tuple = ()
+        self._log_widgets: tuple = ()
+        self._state_dirty = False  # True while a control state update is scheduled
+        
+        # Whether any variable was edited since the last load, and whether a load is in progress
+        self._dirty = False
+        self._loading = False
+        
+        # Set when the dialog is closed; run() waits on it
+        self._closed = tk.BooleanVar(parent, value=False)
         
         # Create the dialog
         self.dialog = tk.Toplevel(parent)
         self.dialog.title("Middleware Settings")
         self.dialog.transient(parent)
-        self.dialog.grab_set()
         
-        # Set dialog size
-        self.dialog.geometry("650x600")
-        self.dialog.minsize(600, 500)
+        # Keep the dialog unmapped until run() shows it in its final place
+        self.dialog.withdraw()
         
-        # Center on parent
+        # Size and center on parent (or on the screen) in a single geometry call
         if parent:
-            parent_x = parent.winfo_rootx()
-            parent_y = parent.winfo_rooty()
-            parent_width = parent.winfo_width()
-            parent_height = parent.winfo_height()
-            
-            dialog_width = 650
-            dialog_height = 600
-            
-            x = parent_x + (parent_width - dialog_width) // 2
-            y = parent_y + (parent_height - dialog_height) // 2
-            
-            self.dialog.geometry(f"+{x}+{y}")
+            # Settle pending layout once so the four reads below see consistent values
+            parent.update_idletasks()
+            x = parent.winfo_rootx() + (parent.winfo_width() - DIALOG_WIDTH) // 2
+            y = parent.winfo_rooty() + (parent.winfo_height() - DIALOG_HEIGHT) // 2
+        else:
+            x = (self.dialog.winfo_screenwidth() - DIALOG_WIDTH) // 2
+            y = (self.dialog.winfo_screenheight() - DIALOG_HEIGHT) // 2
         
-        # Make dialog modal
-        self.dialog.focus_set()
+        self.dialog.geometry(f"{DIALOG_WIDTH}x{DIALOG_HEIGHT}+{x}+{y}")
+        self.dialog.minsize(600, 500)
         
         # Create widgets
         self._create_widgets()
         
+        # Handle dialog close
+        self.dialog.protocol("WM_DELETE_WINDOW", self._on_cancel)
+        
+        # Show and wait for dialog to close
+        self.run()
+    
+    @classmethod
+    def show(cls, parent, settings: MiddlewareSettings) -> 'MiddlewareSettingsDialog':
+        """
+        Show the settings dialog for parent, reusing its window after the first open.
+        
+        The dialog is kept on parent and only hidden when closed, so later
+        calls just reload the values and show it again.
+        
+        Args:
+            parent: Parent widget
+            settings: Settings instance
+            
+        Returns:
+            MiddlewareSettingsDialog: The dialog, closed; check its result
+        """
+        dialog = getattr(parent, '_settings_dialog_singleton', None)
+        if dialog is not None and dialog.exists():
+            dialog.run(settings)
+        else:
+            dialog = cls(parent, settings, keep_alive=True)
+            parent._settings_dialog_singleton = dialog
+        return dialog
+    
+    def run(self, settings: Optional[MiddlewareSettings] = None) -> bool:
+        """
+        Show the dialog modally and wait until it is closed.
+        
+        Args:
+            settings: Settings instance to edit (defaults to the current one)
+            
+        Returns:
+            bool: True if settings were changed (OK or Apply clicked)
+        """
+        if settings is not None:
+            self.settings = settings
+        self.result = False
+        
         # Initialize values from settings
         self._load_settings()
         
-        # Handle dialog close
-        self.dialog.protocol("WM_DELETE_WINDOW", self._on_cancel)
+        # Make dialog modal
+        self.dialog.deiconify()
+        self.dialog.grab_set()
+        self.dialog.focus_set()
         
-        # Wait for dialog to close
-        self.dialog.wait_window()
+        self._closed.set(False)
+        self.dialog.wait_variable(self._closed)
+        return self.result
+    
+    def exists(self) -> bool:
+        """Check whether the dialog window still exists."""
+        try:
+            return bool(self.dialog.winfo_exists())
+        except tk.TclError:
+            return False
+    
+    def _close(self) -> None:
+        """Hide or destroy the dialog and release run()."""
+        self.dialog.grab_release()
+        if self.keep_alive:
+            self.dialog.withdraw()
+        else:
+            self.dialog.destroy()
+        self._closed.set(True)
     
     def _create_widgets(self) -> None:
         """Create the dialog widgets."""
@@ -89,11 +162,31 @@ class MiddlewareSettingsDialog:
         self.notebook = ttk.Notebook(main_frame)
         self.notebook.pack(fill=tk.BOTH, expand=True, pady=10)
         
-        # Create settings tabs
-        self._create_network_tab()
-        self._create_conversions_tab()
-        self._create_logging_tab()
-        self._create_ui_tab()
+        # Settings tabs start as empty frames; each is filled in when first shown
+        self._tab_builders = {
+            "Network": self._create_network_tab,
+            "Unit Conversions": self._create_conversions_tab,
+            "Logging": self._create_logging_tab,
+            "User Interface": self._create_ui_tab
+        }
+        self._tab_sections = {
+            "Network": 'network',
+            "Unit Conversions": 'conversions',
+            "Logging": 'logging',
+            "User Interface": 'ui'
+        }
+        
+        # Tk variables of the built tabs: section -> {setting key: variable}
+        self._vars: Dict[str, Dict[str, tk.Variable]] = {}
+        
+        self._tab_frames: Dict[str, ttk.Frame] = {}
+        for name in self._tab_builders:
+            frame = ttk.Frame(self.notebook, padding="10")
+            self.notebook.add(frame, text=name)
+            self._tab_frames[name] = frame
+        
+        self.notebook.bind("<<NotebookTabChanged>>", self._on_tab_shown)
+        self._on_tab_shown()
         
         # Button frame at the bottom
         button_frame = ttk.Frame(main_frame)
@@ -114,11 +207,51 @@ class MiddlewareSettingsDialog:
         self.test_button = ttk.Button(button_frame, text="Test Configuration", command=self._on_test)
         self.test_button.pack(side=tk.LEFT, padx=5)
     
-    def _create_network_tab(self) -> None:
-        """Create the Network settings tab."""
-        frame = ttk.Frame(self.notebook, padding="10")
-        self.notebook.add(frame, text="Network")
+    def _on_tab_shown(self, event=None) -> None:
+        """Build the selected tab the first time it is shown."""
+        name = self.notebook.tab(self.notebook.select(), "text")
+        builder = self._tab_builders.pop(name, None)
+        if builder is not None:
+            frame = self._tab_frames[name]
+            
+            # Don't pass size requests up to the notebook while children are added;
+            # restoring propagation afterwards lays the tab out once
+            frame.pack_propagate(False)
+            frame.grid_propagate(False)
+            try:
+                builder(frame)
+            finally:
+                frame.pack_propagate(True)
+                frame.grid_propagate(True)
+            
+            section = self._tab_sections[name]
+            for var in self._vars[section].values():
+                var.trace_add('write', self._mark_dirty)
+            self._load_section(section)
+    
+    @staticmethod
+    def _make_choice(parent, variable: tk.StringVar, values, width: int) -> ttk.OptionMenu:
+        """
+        Create a drop-down for picking one of a few fixed values.
         
+        A ttk.OptionMenu (menubutton plus menu) is lighter than a readonly
+        ttk.Combobox, which also builds an entry and a listbox popdown.
+        
+        Args:
+            parent: Parent widget
+            variable: Variable holding the selected value
+            values: Values to choose from
+            width: Button width in characters
+            
+        Returns:
+            ttk.OptionMenu: The drop-down (not yet placed)
+        """
+        choice = ttk.OptionMenu(parent, variable, None, *values)
+        choice.configure(width=width)
+        return choice
+    
+    def _create_network_tab(self, frame: ttk.Frame) -> None:
+        """Create the Network settings tab inside its notebook frame."""
         # Input UDP settings
         input_frame = ttk.LabelFrame(frame, text="Input UDP (from Condor)", padding="10")
         input_frame.pack(fill=tk.X, pady=5)
@@ -164,13 +297,16 @@ class MiddlewareSettingsDialog:
         ttk.Label(output_frame, text="Default: 127.0.0.1:55300", 
                   font=("", 8, "italic"), foreground="gray").grid(row=2, column=0, columnspan=2, sticky=tk.W)
         
+        self._vars['network'] = {
+            'input_port': self.input_port_var,
+            'output_host': self.output_host_var,
+            'output_port': self.output_port_var
+        }
+        
         # Configuration examples
         examples_frame = ttk.LabelFrame(frame, text="Configuration Examples", padding="10")
         examples_frame.pack(fill=tk.X, pady=5)
         
-        examples_text = tk.Text(examples_frame, height=6, wrap=tk.WORD, font=("", 8))
-        examples_text.pack(fill=tk.X)
-        
         example_content = """Example configurations:
 
 1. Same computer: Input=55278, Output=127.0.0.1:55300
@@ -182,14 +318,12 @@ class MiddlewareSettingsDialog:
 3. Chain setup: Input=55278, Output=127.0.0.1:55279
    Condor → Middleware → Another middleware/application"""
         
-        examples_text.insert('1.0', example_content)
-        examples_text.config(state=tk.DISABLED)
+        # Static text, so a label rather than a read-only Text widget
+        ttk.Label(examples_frame, text=example_content, justify=tk.LEFT,
+                  font=("", 8), wraplength=580).pack(anchor=tk.W, fill=tk.X)
     
-    def _create_conversions_tab(self) -> None:
-        """Create the Unit Conversions settings tab."""
-        frame = ttk.Frame(self.notebook, padding="10")
-        self.notebook.add(frame, text="Unit Conversions")
-        
+    def _create_conversions_tab(self, frame: ttk.Frame) -> None:
+        """Create the Unit Conversions settings tab inside its notebook frame."""
         # Master enable/disable
         self.conversions_enabled_var = tk.BooleanVar()
         self.conversions_enabled = ttk.Checkbutton(
@@ -207,13 +341,7 @@ class MiddlewareSettingsDialog:
         # Altitude conversion
         ttk.Label(self.conversions_frame, text="Altitude:", font=("", 9, "bold")).grid(row=0, column=0, sticky=tk.W, pady=5)
         self.altitude_unit_var = tk.StringVar()
-        self.altitude_unit = ttk.Combobox(
-            self.conversions_frame,
-            textvariable=self.altitude_unit_var,
-            values=["meters", "feet"],
-            width=15,
-            state="readonly"
-        )
+        self.altitude_unit = self._make_choice(self.conversions_frame, self.altitude_unit_var, ["meters", "feet"], width=15)
         self.altitude_unit.grid(row=0, column=1, sticky=tk.W, pady=5, padx=5)
         ttk.Label(self.conversions_frame, text="Variables: altitude, height, wheelheight", 
                   font=("", 8), foreground="gray").grid(row=0, column=2, sticky=tk.W, padx=10)
@@ -221,13 +349,7 @@ class MiddlewareSettingsDialog:
         # Speed conversion
         ttk.Label(self.conversions_frame, text="Speed:", font=("", 9, "bold")).grid(row=1, column=0, sticky=tk.W, pady=5)
         self.speed_unit_var = tk.StringVar()
-        self.speed_unit = ttk.Combobox(
-            self.conversions_frame,
-            textvariable=self.speed_unit_var,
-            values=["mps", "kmh", "knots"],
-            width=15,
-            state="readonly"
-        )
+        self.speed_unit = self._make_choice(self.conversions_frame, self.speed_unit_var, ["mps", "kmh", "knots"], width=15)
         self.speed_unit.grid(row=1, column=1, sticky=tk.W, pady=5, padx=5)
         ttk.Label(self.conversions_frame, text="Variables: airspeed, vx, vy, vz", 
                   font=("", 8), foreground="gray").grid(row=1, column=2, sticky=tk.W, padx=10)
@@ -235,13 +357,7 @@ class MiddlewareSettingsDialog:
         # Vario conversion
         ttk.Label(self.conversions_frame, text="Vario:", font=("", 9, "bold")).grid(row=2, column=0, sticky=tk.W, pady=5)
         self.vario_unit_var = tk.StringVar()
-        self.vario_unit = ttk.Combobox(
-            self.conversions_frame,
-            textvariable=self.vario_unit_var,
-            values=["mps", "fpm"],
-            width=15,
-            state="readonly"
-        )
+        self.vario_unit = self._make_choice(self.conversions_frame, self.vario_unit_var, ["mps", "fpm"], width=15)
         self.vario_unit.grid(row=2, column=1, sticky=tk.W, pady=5, padx=5)
         ttk.Label(self.conversions_frame, text="Variables: vario, evario, nettovario", 
                   font=("", 8), foreground="gray").grid(row=2, column=2, sticky=tk.W, padx=10)
@@ -249,24 +365,26 @@ class MiddlewareSettingsDialog:
         # Acceleration conversion
         ttk.Label(self.conversions_frame, text="Acceleration:", font=("", 9, "bold")).grid(row=3, column=0, sticky=tk.W, pady=5)
         self.acceleration_unit_var = tk.StringVar()
-        self.acceleration_unit = ttk.Combobox(
-            self.conversions_frame,
-            textvariable=self.acceleration_unit_var,
-            values=["mps2", "fps2"],
-            width=15,
-            state="readonly"
-        )
+        self.acceleration_unit = self._make_choice(self.conversions_frame, self.acceleration_unit_var, ["mps2", "fps2"], width=15)
         self.acceleration_unit.grid(row=3, column=1, sticky=tk.W, pady=5, padx=5)
         ttk.Label(self.conversions_frame, text="Variables: ax, ay, az", 
                   font=("", 8), foreground="gray").grid(row=3, column=2, sticky=tk.W, padx=10)
         
+        self._vars['conversions'] = {
+            'enabled': self.conversions_enabled_var,
+            'altitude': self.altitude_unit_var,
+            'speed': self.speed_unit_var,
+            'vario': self.vario_unit_var,
+            'acceleration': self.acceleration_unit_var
+        }
+        
+        # Enabled and disabled together by _update_conversion_state
+        self._conversion_widgets = (self.altitude_unit, self.speed_unit, self.vario_unit, self.acceleration_unit)
+        
         # Conversion factors info
         factors_frame = ttk.LabelFrame(frame, text="Conversion Factors Reference", padding="10")
         factors_frame.pack(fill=tk.X, pady=5)
         
-        factors_text = tk.Text(factors_frame, height=8, wrap=tk.WORD, font=("Consolas", 8))
-        factors_text.pack(fill=tk.X)
-        
         factors_content = """Conversion factors used:
 
 Altitude:  1 meter = 3.28084 feet
@@ -277,26 +395,17 @@ Accel:     1 m/s² = 3.28084 ft/s²
 Note: Condor outputs data in metric units by default.
 Variables not configured for conversion pass through unchanged."""
         
-        factors_text.insert('1.0', factors_content)
-        factors_text.config(state=tk.DISABLED)
+        ttk.Label(factors_frame, text=factors_content, justify=tk.LEFT,
+                  font=("Consolas", 8), wraplength=580).pack(anchor=tk.W, fill=tk.X)
     
-    def _create_logging_tab(self) -> None:
-        """Create the Logging settings tab."""
-        frame = ttk.Frame(self.notebook, padding="10")
-        self.notebook.add(frame, text="Logging")
-        
+    def _create_logging_tab(self, frame: ttk.Frame) -> None:
+        """Create the Logging settings tab inside its notebook frame."""
         # Log level
         ttk.Label(frame, text="Log Level:").grid(row=0, column=0, sticky=tk.W, pady=5)
         
         self.log_level_var = tk.StringVar()
         log_levels = ["DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL"]
-        self.log_level = ttk.Combobox(
-            frame,
-            textvariable=self.log_level_var,
-            values=log_levels,
-            width=10,
-            state="readonly"
-        )
+        self.log_level = self._make_choice(frame, self.log_level_var, log_levels, width=10)
         self.log_level.grid(row=0, column=1, sticky=tk.W, pady=5)
         
         ttk.Label(frame, text="Note: GUI always shows INFO level and above", 
@@ -359,24 +468,26 @@ Variables not configured for conversion pass through unchanged."""
             width=5
         )
         self.max_log_size.grid(row=4, column=1, sticky=tk.W, pady=5)
-    
-    def _create_ui_tab(self) -> None:
-        """Create the UI settings tab."""
-        frame = ttk.Frame(self.notebook, padding="10")
-        self.notebook.add(frame, text="User Interface")
         
+        self._vars['logging'] = {
+            'level': self.log_level_var,
+            'log_to_file': self.log_to_file_var,
+            'log_file_path': self.log_file_var,
+            'max_log_files': self.max_log_files_var,
+            'max_log_size_mb': self.max_log_size_var
+        }
+        
+        # Enabled and disabled together by _update_log_file_state
+        self._log_widgets = (self.log_file, self.max_log_files, self.max_log_size)
+    
+    def _create_ui_tab(self, frame: ttk.Frame) -> None:
+        """Create the UI settings tab inside its notebook frame."""
         # Theme selection
         ttk.Label(frame, text="Theme:").grid(row=0, column=0, sticky=tk.W, pady=5)
         
         self.theme_var = tk.StringVar()
         themes = ["system", "light", "dark"]
-        self.theme = ttk.Combobox(
-            frame,
-            textvariable=self.theme_var,
-            values=themes,
-            width=10,
-            state="readonly"
-        )
+        self.theme = self._make_choice(frame, self.theme_var, themes, width=10)
         self.theme.grid(row=0, column=1, sticky=tk.W, pady=5)
         
         # Auto-start option
@@ -397,6 +508,12 @@ Variables not configured for conversion pass through unchanged."""
         )
         self.start_minimized.grid(row=2, column=0, columnspan=2, sticky=tk.W, pady=5)
         
+        self._vars['ui'] = {
+            'theme': self.theme_var,
+            'auto_start': self.auto_start_var,
+            'start_minimized': self.start_minimized_var
+        }
+        
         # Clear recent configs button
         clear_button = ttk.Button(
             frame,
@@ -406,72 +523,49 @@ Variables not configured for conversion pass through unchanged."""
         clear_button.grid(row=4, column=0, columnspan=2, sticky=tk.W, pady=20)
     
     def _load_settings(self) -> None:
-        """Load settings values into the UI."""
-        # Network settings
-        network = self.settings.get('network')
-        self.input_port_var.set(network.input_port)
-        self.output_host_var.set(network.output_host)
-        self.output_port_var.set(network.output_port)
-        
-        # Conversion settings
-        conversions = self.settings.get('conversions')
-        self.conversions_enabled_var.set(conversions.enabled)
-        self.altitude_unit_var.set(conversions.altitude)
-        self.speed_unit_var.set(conversions.speed)
-        self.vario_unit_var.set(conversions.vario)
-        self.acceleration_unit_var.set(conversions.acceleration)
-        
-        # Update conversion controls state
-        self._update_conversion_state()
-        
-        # Logging settings
-        logging_settings = self.settings.get('logging')
-        self.log_level_var.set(logging_settings.level)
-        self.log_to_file_var.set(logging_settings.log_to_file)
-        self.log_file_var.set(logging_settings.log_file_path or "")
-        self.max_log_files_var.set(logging_settings.max_log_files)
-        self.max_log_size_var.set(logging_settings.max_log_size_mb)
-        
-        # Update log file controls state
-        self._update_log_file_state()
-        
-        # UI settings
-        ui_settings = self.settings.get('ui')
-        self.theme_var.set(ui_settings.theme)
-        self.auto_start_var.set(ui_settings.auto_start)
-        self.start_minimized_var.set(ui_settings.start_minimized)
+        """Load settings values into the tabs built so far."""
+        for section in self._vars:
+            self._load_section(section)
+        self._dirty = False
+    
+    def _load_section(self, section: str) -> None:
+        """
+        Load one settings section into its tab's variables.
+        
+        Args:
+            section: Section name (network, conversions, logging, ui)
+        """
+        values = self.settings.get(section)
+        self._loading = True
+        try:
+            for key, var in self._vars[section].items():
+                value = getattr(values, key)
+                var.set("" if value is None else value)
+        finally:
+            self._loading = False
+        
+        # Update dependent control states
+        if section == 'conversions':
+            self._update_conversion_state()
+        elif section == 'logging':
+            self._update_log_file_state()
     
     def _save_settings(self) -> bool:
         """
         Save UI values to settings.
         
+        Sets result when values were actually stored, so closing an
+        untouched dialog with OK reports no change.
+        
         Returns:
-            bool: True if settings were saved successfully
+            bool: True if there was nothing to save or settings were saved successfully
         """
+        # Nothing edited since the values were loaded or last saved
+        if not self._dirty:
+            return True
+        
         try:
-            # Network settings
-            self.settings.set('network', 'input_port', self.input_port_var.get())
-            self.settings.set('network', 'output_host', self.output_host_var.get())
-            self.settings.set('network', 'output_port', self.output_port_var.get())
-            
-            # Conversion settings
-            self.settings.set('conversions', 'enabled', self.conversions_enabled_var.get())
-            self.settings.set('conversions', 'altitude', self.altitude_unit_var.get())
-            self.settings.set('conversions', 'speed', self.speed_unit_var.get())
-            self.settings.set('conversions', 'vario', self.vario_unit_var.get())
-            self.settings.set('conversions', 'acceleration', self.acceleration_unit_var.get())
-            
-            # Logging settings
-            self.settings.set('logging', 'level', self.log_level_var.get())
-            self.settings.set('logging', 'log_to_file', self.log_to_file_var.get())
-            self.settings.set('logging', 'log_file_path', self.log_file_var.get())
-            self.settings.set('logging', 'max_log_files', self.max_log_files_var.get())
-            self.settings.set('logging', 'max_log_size_mb', self.max_log_size_var.get())
-            
-            # UI settings
-            self.settings.set('ui', 'theme', self.theme_var.get())
-            self.settings.set('ui', 'auto_start', self.auto_start_var.get())
-            self.settings.set('ui', 'start_minimized', self.start_minimized_var.get())
+            self._apply_values()
             
             # Validate settings
             validation_errors = self.settings.validate()
@@ -487,6 +581,8 @@ Variables not configured for conversion pass through unchanged."""
                 messagebox.showerror("Validation Error", error_message)
                 return False
             
+            self._dirty = False
+            self.result = True
             return True
             
         except Exception as e:
@@ -494,22 +590,48 @@ Variables not configured for conversion pass through unchanged."""
             messagebox.showerror("Settings Error", f"Failed to save settings: {e}")
             return False
     
+    def _mark_dirty(self, *args) -> None:
+        """Variable trace callback: note an edit, unless values are being loaded."""
+        if not self._loading:
+            self._dirty = True
+    
+    def _apply_values(self) -> None:
+        """Copy the values of the built tabs into settings as one change."""
+        # Only built tabs have variables; settings of tabs never shown stay as they are
+        payload = {
+            section: {key: var.get() for key, var in variables.items()}
+            for section, variables in self._vars.items()
+        }
+        self.settings.update_sections(payload)
+    
     def _update_conversion_state(self) -> None:
         """Update the state of conversion controls based on enabled state."""
-        state = "readonly" if self.conversions_enabled_var.get() else "disabled"
-        
-        self.altitude_unit.config(state=state)
-        self.speed_unit.config(state=state)
-        self.vario_unit.config(state=state)
-        self.acceleration_unit.config(state=state)
+        self._schedule_state_update()
     
     def _update_log_file_state(self) -> None:
         """Update the state of log file controls based on log_to_file state."""
-        state = "normal" if self.log_to_file_var.get() else "disabled"
-        
-        self.log_file.config(state=state)
-        self.max_log_files.config(state=state)
-        self.max_log_size.config(state=state)
+        self._schedule_state_update()
+    
+    def _schedule_state_update(self) -> None:
+        """Apply control states once the current event has been handled; repeated calls share one update."""
+        if not self._state_dirty:
+            self._state_dirty = True
+            self.dialog.after_idle(self._flush_states)
+    
+    def _flush_states(self) -> None:
+        """Enable or disable the control groups from their checkboxes."""
+        self._state_dirty = False
+        
+        # ttk state flags; one state() call per widget
+        if self._conversion_widgets:
+            state_spec = ['!disabled'] if self.conversions_enabled_var.get() else ['disabled']
+            for widget in self._conversion_widgets:
+                widget.state(state_spec)
+        
+        if self._log_widgets:
+            state_spec = ['!disabled'] if self.log_to_file_var.get() else ['disabled']
+            for widget in self._log_widgets:
+                widget.state(state_spec)
     
     def _browse_log_file(self) -> None:
         """Open file dialog to select log file path."""
@@ -533,6 +655,7 @@ Variables not configured for conversion pass through unchanged."""
             "Are you sure you want to clear the list of recent configurations?"
         ):
             self.settings.settings.ui.recent_configs = []
+            self.settings.mark_dirty()
             messagebox.showinfo(
                 "Recent Configurations",
                 "Recent configurations list has been cleared."
@@ -540,80 +663,104 @@ Variables not configured for conversion pass through unchanged."""
     
     def _on_test(self) -> None:
         """Handle Test Configuration button click."""
-        # Save current values temporarily for testing
-        temp_settings = self.settings.settings
-        
         try:
-            # Apply current UI values to temporary settings
-            self._save_settings()
+            # Apply current UI values to settings
+            self._apply_values()
             
-            # Validate
+            # Validate (in memory and quick, so it runs right here on the Tk thread)
             errors = self.settings.validate()
-            if errors:
-                error_msg = "Configuration errors found:\n\n"
-                for section, section_errors in errors.items():
-                    error_msg += f"[{section}]\n"
-                    for error in section_errors:
-                        error_msg += f"  - {error}\n"
-                messagebox.showerror("Configuration Test Failed", error_msg)
-            else:
-                # Show configuration summary
-                network = self.settings.get('network')
-                conversions = self.settings.get('conversions')
-                
-                summary = f"""Configuration Test Passed!
+        except Exception as e:
+            messagebox.showerror("Configuration Test Error", f"Error testing configuration: {e}")
+            return
+        
+        if errors:
+            error_msg = "Configuration errors found:\n\n"
+            for section, section_errors in errors.items():
+                error_msg += f"[{section}]\n"
+                for error in section_errors:
+                    error_msg += f"  - {error}\n"
+            messagebox.showerror("Configuration Test Failed", error_msg)
+        else:
+            # Show configuration summary
+            network = self.settings.get('network')
+            conversions = self.settings.get('conversions')
+            
+            summary = f"""Configuration Test Passed!
 
 Network Configuration:
   Input UDP: Port {network.input_port}
   Output UDP: {network.output_host}:{network.output_port}
 
 Unit Conversions: {'Enabled' if conversions.enabled else 'Disabled'}"""
-                
-                if conversions.enabled:
-                    summary += f"""
+            
+            if conversions.enabled:
+                summary += f"""
   Altitude: {conversions.altitude}
   Speed: {conversions.speed}  
   Vario: {conversions.vario}
   Acceleration: {conversions.acceleration}"""
-                
-                messagebox.showinfo("Configuration Test Passed", summary)
-                
-        except Exception as e:
-            messagebox.showerror("Configuration Test Error", f"Error testing configuration: {e}")
+            
+            messagebox.showinfo("Configuration Test Passed", summary)
     
     def _on_ok(self) -> None:
         """Handle OK button click."""
         if self._save_settings():
-            self.result = True
-            self.dialog.destroy()
+            self._close()
     
     def _on_apply(self) -> None:
         """Handle Apply button click."""
-        if self._save_settings():
-            self.result = True
+        self._save_settings()
     
     def _on_cancel(self) -> None:
         """Handle Cancel button click."""
         self.result = False
-        self.dialog.destroy()
+        self._close()
 
 
 # Example usage:
 if __name__ == "__main__":
-    root = tk.Tk()
-    root.title("Settings Dialog Test")
-    root.geometry("300x200")
-    
-    # Create a button to open the dialog
-    def open_settings():
-        settings = MiddlewareSettings()
-        dialog = MiddlewareSettingsDialog(root, settings)
+    import sys
+    
+    # One Tk root for every demo open, so repeated opens measure the dialog
+    # rather than Tcl interpreter startup
+    _root = None
+    
+    # Loaded once; every demo open edits the same settings
+    _settings = MiddlewareSettings()
+    
+    def _get_root() -> tk.Tk:
+        """Create the shared demo root on first use."""
+        global _root
+        if _root is None:
+            _root = tk.Tk()
+            _root.title("Settings Dialog Test")
+            _root.geometry("300x200")
+        return _root
+    
+    def _demo(reload: bool = False):
+        """
+        Open the dialog once against the shared root.
+        
+        Args:
+            reload: Read the settings from disk again instead of reusing them
+        """
+        global _settings
+        if reload:
+            _settings = MiddlewareSettings()
+        
+        dialog = MiddlewareSettingsDialog(_get_root(), _settings)
         if dialog.result:
             print("Settings were changed")
         else:
             print("Settings were not changed")
     
-    button = ttk.Button(root, text="Open Settings", command=open_settings)
-    button.pack(expand=True)
-    
-    root.mainloop()
\ No newline at end of file
+    if len(sys.argv) > 1:
+        # Benchmark/profiling mode: open the dialog N times in a row, no main loop
+        for _ in range(int(sys.argv[1])):
+            _demo()
+    else:
+        # Create a button to open the dialog
+        button = ttk.Button(_get_root(), text="Open Settings", command=_demo)
+        button.pack(expand=True)
+        
+        _root.mainloop()
@@ -9,13 +9,174 @@ Part of the Condor UDP Middleware project.
 
 import tkinter as tk
 from tkinter import ttk
+import contextlib
+import functools
 import logging
-from typing import Dict, Any, Optional
+import sys
+from typing import Callable, Dict, Any, Iterator, List, Optional, Tuple
 import time
 
 # Configure logging
 logger = logging.getLogger('gui.status_panel')
 
+MIN_UPDATE_INTERVAL = 0.1  # Seconds between panel refreshes; faster updates are coalesced
+DATA_ACTIVE_TIMEOUT = 5.0  # Data counts as active if seen within this many seconds
+_AGO_BUCKETS_PER_SECOND = 2  # Resolution of the "seconds since last data" buckets
+_AGO_BUCKET_MAX = 20  # Ages beyond this bucket are all equally inactive
+
+# (text, colour) shown for each state; on/off states are indexed by bool
+_BRIDGE_STATES = (("Stopped", "red"), ("Running", "green"))
+_CONVERSION_STATES = (("Disabled", "orange"), ("Enabled", "green"))
+# UDP states are indexed 0 = stopped, 1 = running without recent data, 2 = active
+_INPUT_STATES = (("Stopped", "red"), ("No Data", "orange"), ("Active", "green"))
+_OUTPUT_STATES = (("Stopped", "red"), ("No Output", "orange"), ("Active", "green"))
+
+# Label formatters, bound once so refreshes call straight into str.format
+_FMT_UPTIME = "{:02d}:{:02d}:{:02d}".format
+_FMT_RATE = "{:.1f} msg/sec".format
+_FMT_PCT = "{:.1f}%".format
+_FMT_TARGET = "{}:{}".format
+
+# Label grids: (row, column, caption, bold caption, attribute, initial text, colour);
+# the value label goes in the column right of its caption
+_CONNECTION_LAYOUT = (
+    (0, 0, "Middleware Status:", True, "bridge_status", "Stopped", "red"),
+    (0, 2, "Uptime:", True, "uptime_value", "00:00:00", None),
+    (1, 0, "Input UDP:", True, "input_udp_status", "Stopped", "red"),
+    (1, 2, "Port:", False, "input_port", "55278", None),
+    (2, 0, "Output UDP:", True, "output_udp_status", "Stopped", "red"),
+    (2, 2, "Target:", False, "output_target", "127.0.0.1:55300", None),
+)
+_CONVERSION_LAYOUT = (
+    (0, 0, "Conversions:", True, "conversions_enabled", "Disabled", "orange"),
+    (1, 0, "Altitude:", False, "altitude_unit", "meters", None),
+    (1, 2, "Speed:", False, "speed_unit", "mps", None),
+    (2, 0, "Vario:", False, "vario_unit", "mps", None),
+    (2, 2, "Acceleration:", False, "accel_unit", "mps2", None),
+)
+_DATAFLOW_LAYOUT = (
+    (0, 0, "Messages Received:", True, "messages_received", "0", None),
+    (1, 0, "Messages Processed:", True, "messages_processed", "0", None),
+    (2, 0, "Messages Forwarded:", True, "messages_forwarded", "0", None),
+    (3, 0, "Input Rate:", False, "input_rate", "0.0 msg/sec", None),
+    (4, 0, "Output Rate:", False, "output_rate", "0.0 msg/sec", None),
+)
+_CONVERSION_STATS_LAYOUT = (
+    (0, 0, "Messages Converted:", True, "messages_converted", "0", None),
+    (1, 0, "Total Conversions:", True, "total_conversions", "0", None),
+    (2, 0, "Variables Converted:", False, "variables_converted", "None", None),
+    (3, 0, "Conversion Rate:", False, "conversion_percentage", "0%", None),
+)
+_CAPTION_FONTS = (("", 9), ("", 9, "bold"))  # Indexed by the bold flag
+_RENDER_ERRORS = (AttributeError, KeyError, TypeError, ValueError, tk.TclError)  # Malformed status values
+# Sentinel for status diffing
+_MISSING = object()  # Marks status keys absent from the previous status
+# Text widget events that edit without a key press; blocked to keep the sample read-only
+_READ_ONLY_EVENTS = ("<<Paste>>", "<<PasteSelection>>", "<<Cut>>", "<<Clear>>", "<ButtonRelease-2>")
+# Keys still allowed in the sample; every other key press is blocked
+_SAMPLE_NAVIGATION_KEYS = frozenset(("Left", "Right", "Up", "Down", "Home", "End", "Prior", "Next"))
+_SAMPLE_CONTROL_KEYS = frozenset(("c", "C", "a", "A", "slash", "Insert"))  # With Control: copy, select all
+_CONTROL_MASK = 0x0004  # Tk event.state bit for the Control key
+_SHIFT_MASK = 0x0001  # Tk event.state bit for the Shift key
+
+
+def _ago_bucket(ago: Optional[float]) -> int:
+    """
+    Quantize "seconds since last data" for _data_active().
+
+    Args:
+        ago: Seconds since data was last seen, or None if never
+
+    Returns:
+        int: -1 if never seen, otherwise the half-second bucket (capped)
+    """
+    if ago is None:
+        return -1
+    return min(max(int(ago * _AGO_BUCKETS_PER_SECOND), 0), _AGO_BUCKET_MAX)
+
+
+@functools.lru_cache(maxsize=64)
+def _data_active(running: bool, ago_bucket: int) -> bool:
+    """
+    Check whether a running UDP component has seen data recently.
+
+    Args:
+        running: Whether the component is running
+        ago_bucket: Age of the last data from _ago_bucket()
+
+    Returns:
+        bool: True if running and data was seen within DATA_ACTIVE_TIMEOUT
+    """
+    return running and 0 <= ago_bucket < DATA_ACTIVE_TIMEOUT * _AGO_BUCKETS_PER_SECOND
+
+
+def _unit_name(value: Any) -> str:
+    """
+    Intern a unit name from a status dictionary.
+
+    Unit names repeat on every update; interned, the unchanged-label checks
+    on them succeed on identity instead of comparing characters.
+    """
+    return sys.intern(str(value))
+
+
+def _format_uptime(seconds: int) -> str:
+    """Format whole seconds as HH:MM:SS."""
+    hours, remainder = divmod(seconds, 3600)
+    minutes, seconds = divmod(remainder, 60)
+    return _FMT_UPTIME(hours, minutes, seconds)
+
+
+def _format_variables(variables: Tuple[str, ...]) -> str:
+    """Format converted variable names, listing at most five."""
+    if not variables:
+        return "None"
+    if len(variables) <= 5:
+        return ', '.join(variables)
+    return f"{', '.join(variables[:5])}..."
+
+
+def _snapshot(value: Any) -> Any:
+    """Copy a status value, so later changes by the producer don't leak into it."""
+    if isinstance(value, dict):
+        return {key: _snapshot(item) for key, item in value.items()}
+    if isinstance(value, list):
+        return list(value)
+    return value
+
+
+def _diff(new: Dict[str, Any], old: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Collect the entries of a status dictionary that differ from an older one.
+
+    Args:
+        new: Current status (or section)
+        old: Status (or section) it is compared with
+
+    Returns:
+        dict: Changed entries; nested dictionaries hold only their changed entries
+    """
+    delta = {}
+    for key, value in new.items():
+        previous = old.get(key, _MISSING)
+        if isinstance(value, dict) and isinstance(previous, dict):
+            changed = _diff(value, previous)
+            if changed:
+                delta[key] = changed
+        elif value != previous:
+            delta[key] = _snapshot(value)
+    return delta
+
+
+def _merge(target: Dict[str, Any], delta: Dict[str, Any]) -> None:
+    """Apply a delta from _diff() (or a producer) to a status dictionary in place."""
+    for key, value in delta.items():
+        current = target.get(key)
+        if isinstance(value, dict) and isinstance(current, dict):
+            _merge(current, value)
+        else:
+            target[key] = _snapshot(value)
+
 
 class MiddlewareStatusPanel:
     """
@@ -24,22 +185,53 @@ class MiddlewareStatusPanel:
     Shows connection status, data rates, and conversion statistics.
     """
 
-    def __init__(self, parent):
+    def __init__(self, parent, min_interval: float = MIN_UPDATE_INTERVAL):
         """
         Initialize the status panel.
 
         Args:
             parent: Parent widget
+            min_interval: Minimum seconds between refreshes of the display
         """
         self.parent = parent
+        self._min_interval = min_interval
+
+        # Status on screen, kept up to date by apply_delta()
+        self._status: Dict[str, Any] = {}
+
+        # Throttling state: when the panel last refreshed, and a deferred newer status
+        self._last_update_ts = 0.0
+        self._deferred_status: Optional[Dict[str, Any]] = None
+        self._deferred_id: Optional[str] = None
+
+        # Text/colour last shown per label, so unchanged values skip Tk entirely
+        self._last_text: Dict[int, tuple] = {}
+        self._last_sample_text: Optional[str] = None
+        self._last_sample_key: Optional[tuple] = None  # Settings the sample text was built from
+
+        # Last (value, formatted text) per formatted field, see _formatted()
+        self._format_cache: Dict[str, tuple] = {}
+
+        # Label changes collected inside _batched_update(), applied when it ends
+        self._batch_depth = 0
+        self._pending: List[Tuple[Callable, tuple]] = []
+
+        # Per value label: its interpreter's call() and its Tcl path name,
+        # so updates go straight to Tcl (filled in by _build_grid())
+        self._label_commands: Dict[int, Tuple[Callable, str]] = {}
 
         # Create the main frame
         self.frame = ttk.Frame(parent, padding="10")
 
-        # Split into sections
-        self._create_connection_section()
-        self._create_conversion_section()
-        self._create_statistics_section()
+        # Split into sections; size requests are not passed up while they
+        # are built, and restoring propagation lays the panel out once
+        self.frame.pack_propagate(False)
+        try:
+            self._create_connection_section()
+            self._create_conversion_section()
+            self._create_statistics_section()
+        finally:
+            self.frame.pack_propagate(True)
 
     def _create_connection_section(self) -> None:
         """Create the connection status section."""
@@ -51,35 +243,7 @@ class MiddlewareStatusPanel:
         conn_grid = ttk.Frame(self.conn_frame)
         conn_grid.pack(fill=tk.X)
 
-        # Bridge status
-        ttk.Label(conn_grid, text="Middleware Status:", font=("", 9, "bold")).grid(row=0, column=0, sticky="w", padx=5)
-        self.bridge_status = ttk.Label(conn_grid, text="Stopped", foreground="red")
-        self.bridge_status.grid(row=0, column=1, sticky="w", padx=5)
-
-        # Uptime
-        ttk.Label(conn_grid, text="Uptime:", font=("", 9, "bold")).grid(row=0, column=2, sticky="w", padx=5)
-        self.uptime_value = ttk.Label(conn_grid, text="00:00:00")
-        self.uptime_value.grid(row=0, column=3, sticky="w", padx=5)
-
-        # Input UDP status
-        ttk.Label(conn_grid, text="Input UDP:", font=("", 9, "bold")).grid(row=1, column=0, sticky="w", padx=5)
-        self.input_udp_status = ttk.Label(conn_grid, text="Stopped", foreground="red")
-        self.input_udp_status.grid(row=1, column=1, sticky="w", padx=5)
-
-        # Input port
-        ttk.Label(conn_grid, text="Port:", font=("", 9)).grid(row=1, column=2, sticky="w", padx=5)
-        self.input_port = ttk.Label(conn_grid, text="55278")
-        self.input_port.grid(row=1, column=3, sticky="w", padx=5)
-
-        # Output UDP status
-        ttk.Label(conn_grid, text="Output UDP:", font=("", 9, "bold")).grid(row=2, column=0, sticky="w", padx=5)
-        self.output_udp_status = ttk.Label(conn_grid, text="Stopped", foreground="red")
-        self.output_udp_status.grid(row=2, column=1, sticky="w", padx=5)
-
-        # Output target
-        ttk.Label(conn_grid, text="Target:", font=("", 9)).grid(row=2, column=2, sticky="w", padx=5)
-        self.output_target = ttk.Label(conn_grid, text="127.0.0.1:55300")
-        self.output_target.grid(row=2, column=3, sticky="w", padx=5)
+        self._build_grid(conn_grid, _CONNECTION_LAYOUT)
 
     def _create_conversion_section(self) -> None:
         """Create the conversion settings section."""
@@ -90,27 +254,7 @@ class MiddlewareStatusPanel:
         conv_grid = ttk.Frame(self.conversion_frame)
         conv_grid.pack(fill=tk.X)
 
-        # Conversions enabled status
-        ttk.Label(conv_grid, text="Conversions:", font=("", 9, "bold")).grid(row=0, column=0, sticky="w", padx=5)
-        self.conversions_enabled = ttk.Label(conv_grid, text="Disabled", foreground="orange")
-        self.conversions_enabled.grid(row=0, column=1, sticky="w", padx=5)
-
-        # Current unit settings
-        ttk.Label(conv_grid, text="Altitude:", font=("", 9)).grid(row=1, column=0, sticky="w", padx=5)
-        self.altitude_unit = ttk.Label(conv_grid, text="meters")
-        self.altitude_unit.grid(row=1, column=1, sticky="w", padx=5)
-
-        ttk.Label(conv_grid, text="Speed:", font=("", 9)).grid(row=1, column=2, sticky="w", padx=5)
-        self.speed_unit = ttk.Label(conv_grid, text="mps")
-        self.speed_unit.grid(row=1, column=3, sticky="w", padx=5)
-
-        ttk.Label(conv_grid, text="Vario:", font=("", 9)).grid(row=2, column=0, sticky="w", padx=5)
-        self.vario_unit = ttk.Label(conv_grid, text="mps")
-        self.vario_unit.grid(row=2, column=1, sticky="w", padx=5)
-
-        ttk.Label(conv_grid, text="Acceleration:", font=("", 9)).grid(row=2, column=2, sticky="w", padx=5)
-        self.accel_unit = ttk.Label(conv_grid, text="mps2")
-        self.accel_unit.grid(row=2, column=3, sticky="w", padx=5)
+        self._build_grid(conv_grid, _CONVERSION_LAYOUT)
 
     def _create_statistics_section(self) -> None:
         """Create the statistics section."""
@@ -125,32 +269,7 @@ class MiddlewareStatusPanel:
         dataflow_grid = ttk.Frame(self.dataflow_frame)
         dataflow_grid.pack(fill=tk.X)
 
-        # Messages received
-        ttk.Label(dataflow_grid, text="Messages Received:", font=("", 9, "bold")).grid(row=0, column=0, sticky="w",
-                                                                                       padx=5)
-        self.messages_received = ttk.Label(dataflow_grid, text="0")
-        self.messages_received.grid(row=0, column=1, sticky="w", padx=5)
-
-        # Messages processed
-        ttk.Label(dataflow_grid, text="Messages Processed:", font=("", 9, "bold")).grid(row=1, column=0, sticky="w",
-                                                                                        padx=5)
-        self.messages_processed = ttk.Label(dataflow_grid, text="0")
-        self.messages_processed.grid(row=1, column=1, sticky="w", padx=5)
-
-        # Messages forwarded
-        ttk.Label(dataflow_grid, text="Messages Forwarded:", font=("", 9, "bold")).grid(row=2, column=0, sticky="w",
-                                                                                        padx=5)
-        self.messages_forwarded = ttk.Label(dataflow_grid, text="0")
-        self.messages_forwarded.grid(row=2, column=1, sticky="w", padx=5)
-
-        # Data rates
-        ttk.Label(dataflow_grid, text="Input Rate:", font=("", 9)).grid(row=3, column=0, sticky="w", padx=5)
-        self.input_rate = ttk.Label(dataflow_grid, text="0.0 msg/sec")
-        self.input_rate.grid(row=3, column=1, sticky="w", padx=5)
-
-        ttk.Label(dataflow_grid, text="Output Rate:", font=("", 9)).grid(row=4, column=0, sticky="w", padx=5)
-        self.output_rate = ttk.Label(dataflow_grid, text="0.0 msg/sec")
-        self.output_rate.grid(row=4, column=1, sticky="w", padx=5)
+        self._build_grid(dataflow_grid, _DATAFLOW_LAYOUT)
 
         # Right column - Conversion Statistics
         self.conversion_stats_frame = ttk.LabelFrame(stats_container, text="Conversion Statistics", padding="10")
@@ -159,27 +278,7 @@ class MiddlewareStatusPanel:
         conv_stats_grid = ttk.Frame(self.conversion_stats_frame)
         conv_stats_grid.pack(fill=tk.X)
 
-        # Messages with conversions
-        ttk.Label(conv_stats_grid, text="Messages Converted:", font=("", 9, "bold")).grid(row=0, column=0, sticky="w",
-                                                                                          padx=5)
-        self.messages_converted = ttk.Label(conv_stats_grid, text="0")
-        self.messages_converted.grid(row=0, column=1, sticky="w", padx=5)
-
-        # Total conversions applied
-        ttk.Label(conv_stats_grid, text="Total Conversions:", font=("", 9, "bold")).grid(row=1, column=0, sticky="w",
-                                                                                         padx=5)
-        self.total_conversions = ttk.Label(conv_stats_grid, text="0")
-        self.total_conversions.grid(row=1, column=1, sticky="w", padx=5)
-
-        # Variables converted
-        ttk.Label(conv_stats_grid, text="Variables Converted:", font=("", 9)).grid(row=2, column=0, sticky="w", padx=5)
-        self.variables_converted = ttk.Label(conv_stats_grid, text="None")
-        self.variables_converted.grid(row=2, column=1, sticky="w", padx=5)
-
-        # Conversion percentage
-        ttk.Label(conv_stats_grid, text="Conversion Rate:", font=("", 9)).grid(row=3, column=0, sticky="w", padx=5)
-        self.conversion_percentage = ttk.Label(conv_stats_grid, text="0%")
-        self.conversion_percentage.grid(row=3, column=1, sticky="w", padx=5)
+        self._build_grid(conv_stats_grid, _CONVERSION_STATS_LAYOUT)
 
         # Sample conversion display
         sample_frame = ttk.LabelFrame(self.conversion_stats_frame, text="Latest Conversion Example", padding="5")
@@ -190,236 +289,455 @@ class MiddlewareStatusPanel:
             height=4,
             width=40,
             wrap=tk.WORD,
-            state=tk.DISABLED,
             font=("Consolas", 8)
         )
         self.sample_conversion.pack(fill=tk.X)
 
-    def _is_data_active(self, status_dict: Dict[str, Any]) -> bool:
+        # Left in the normal state so updates need no state toggling; user
+        # edits are swallowed by the bindings instead, while selecting,
+        # copying and Tab/Shift-Tab focus traversal keep working
+        for sequence in _READ_ONLY_EVENTS:
+            self.sample_conversion.bind(sequence, lambda event: "break")
+        self.sample_conversion.bind("<Key>", self._on_sample_key)
+        self.sample_conversion.bind("<Tab>", self._on_sample_tab)
+
+    def _build_grid(self, parent: ttk.Frame, layout: tuple) -> None:
         """
-        Helper function to determine if data is active.
+        Create caption/value label pairs from a layout table.
+
+        Each value label is stored on the panel under its attribute name.
 
         Args:
-            status_dict: Status dictionary from UDP component
+            parent: Frame to grid the labels into
+            layout: Rows of (row, column, caption, bold, attribute, text, colour)
+        """
+        parent.grid_propagate(False)
+        try:
+            for row, column, caption, bold, attr, text, foreground in layout:
+                ttk.Label(parent, text=caption, font=_CAPTION_FONTS[bold]).grid(
+                    row=row, column=column, sticky="w", padx=5)
+
+                options = {'text': text}
+                if foreground is not None:
+                    options['foreground'] = foreground
+                label = ttk.Label(parent, **options)
+                label.grid(row=row, column=column + 1, sticky="w", padx=5)
+                setattr(self, attr, label)
+                self._label_commands[id(label)] = (label.tk.call, str(label))
+        finally:
+            parent.grid_propagate(True)
+
+    def _set_label(self, label: ttk.Label, text: str, foreground: Optional[str] = None) -> None:
+        """
+        Set a label's text (and colour), skipping the Tk call if nothing changed.
 
-        Returns:
-            bool: True if data is active (received within 5 seconds)
+        Args:
+            label: Label to update
+            text: Text to show
+            foreground: Text colour (left as is if None)
+        """
+        key = id(label)
+        shown = (text, foreground)
+        if self._last_text.get(key) == shown:
+            return
+
+        call, path = self._label_commands[key]
+        if foreground is None:
+            args = (path, 'configure', '-text', text)
+        else:
+            args = (path, 'configure', '-text', text, '-foreground', foreground)
+
+        # Configure now, or at the end of the current batch
+        if self._batch_depth:
+            self._pending.append((call, args))
+        else:
+            call(*args)
+        self._last_text[key] = shown
+
+    @contextlib.contextmanager
+    def _batched_update(self) -> Iterator[None]:
         """
-        if not status_dict.get('running', False):
-            return False
+        Collect label changes and apply them together when the outermost batch ends.
 
-        last_received_ago = status_dict.get('last_received_ago')
-        if last_received_ago is None:
-            return False  # No data received yet
+        The changes are applied in one tight loop followed by a single
+        update_idletasks(), so Tk lays out and redraws the panel once.
+        """
+        self._batch_depth += 1
+        try:
+            yield
+        finally:
+            self._batch_depth -= 1
+            if not self._batch_depth and self._pending:
+                pending, self._pending = self._pending, []
+                for call, args in pending:
+                    call(*args)
+                self.flush()
+
+    def flush(self) -> None:
+        """
+        Lay out and redraw pending panel changes now.
+
+        Only idle tasks (geometry and redraw) are processed; unlike
+        update(), this never runs queued events or other callbacks.
+        """
+        self.frame.update_idletasks()
+
+    @staticmethod
+    def _on_sample_key(event) -> Optional[str]:
+        """Let navigation and copy keys through to the sample text, blocking the rest."""
+        if event.keysym in _SAMPLE_NAVIGATION_KEYS or event.keysym == "ISO_Left_Tab":
+            return None
+        if event.state & _CONTROL_MASK and event.keysym in _SAMPLE_CONTROL_KEYS:
+            return None
+        return "break"
+
+    @staticmethod
+    def _on_sample_tab(event) -> str:
+        """Move focus on Tab/Shift-Tab instead of inserting a tab character."""
+        if event.state & _SHIFT_MASK:
+            target = event.widget.tk_focusPrev()
+        else:
+            target = event.widget.tk_focusNext()
+        if target is not None:
+            target.focus_set()
+        return "break"
+
+    def _set_sample_text(self, text: str) -> None:
+        """Replace the sample conversion text, skipping the widget update if unchanged."""
+        if text == self._last_sample_text:
+            return
 
-        return last_received_ago < 5.0  # Active if received within 5 seconds
+        self.sample_conversion.delete('1.0', tk.END)
+        self.sample_conversion.insert('1.0', text)
+        self._last_sample_text = text
 
-    def _safe_get_numeric(self, data: Dict[str, Any], key: str, default: float = 0.0) -> float:
+    def _formatted(self, field: str, value, formatter) -> str:
         """
-        Safely get a numeric value from dictionary, handling None values.
+        Format a value, reusing the previous text while the value is unchanged.
+
+        Only the last value per field is kept, so the cache cannot grow;
+        callers quantize the value to what is displayed (whole seconds,
+        one decimal) so that repeats actually hit.
 
         Args:
-            data: Dictionary to get value from
-            key: Key to look up
-            default: Default value if key is missing or None
+            field: Name of the formatted field
+            value: Quantized value to format
+            formatter: Function turning the value into text
 
         Returns:
-            float: The value or default
+            str: Formatted text
         """
-        value = data.get(key, default)
-        return value if value is not None else default
+        last = self._format_cache.get(field)
+        if last is not None and last[0] == value:
+            return last[1]
+
+        text = formatter(value)
+        self._format_cache[field] = (value, text)
+        return text
 
     def update_status(self, status: Dict[str, Any]) -> None:
         """
         Update the status display with current middleware status.
 
+        Updates closer together than min_interval are coalesced: the newest
+        one is shown when the interval is up. Only the fields that differ from
+        the status on screen are passed on to apply_delta(); sections whose
+        '_versions' entry is unchanged are not even compared.
+
+        The panel redraws itself through flush(); callers should not follow
+        this with update(), which re-enters the event loop on every call.
+
         Args:
             status: Bridge status dictionary
         """
         if not status:
             return
 
+        # Too soon after the last refresh: keep the newest status for later
+        now = time.monotonic()
+        wait = self._last_update_ts + self._min_interval - now
+        if wait > 0:
+            self._deferred_status = status
+            if self._deferred_id is None:
+                self._deferred_id = self.frame.after(int(wait * 1000) + 1, self._show_deferred)
+            return
+
+        # Nothing to do if it matches what is already shown
+        delta = self._diff_status(status)
+        if not delta:
+            return
+        self._last_update_ts = now
+
+        self.apply_delta(delta)
+
+    def _show_deferred(self) -> None:
+        """Show the status held back by the update throttle."""
+        self._deferred_id = None
+        status, self._deferred_status = self._deferred_status, None
+        if status:
+            self.update_status(status)
+
+    def _cancel_deferred(self) -> None:
+        """Drop a held-back status update."""
+        if self._deferred_id is not None:
+            self.frame.after_cancel(self._deferred_id)
+            self._deferred_id = None
+        self._deferred_status = None
+
+    def _diff_status(self, status: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Work out which fields of a full status differ from the one on screen.
+
+        Args:
+            status: Bridge status dictionary
+
+        Returns:
+            dict: Delta for apply_delta() (empty if nothing changed)
+        """
+        shown = self._status
+        versions = status.get('_versions') or {}
+        shown_versions = shown.get('_versions') or {}
+
+        delta = {}
+        for key, value in status.items():
+            # A section at the version on screen needs no comparing
+            version = versions.get(key)
+            if version is not None and version == shown_versions.get(key):
+                continue
+
+            previous = shown.get(key, _MISSING)
+            if isinstance(value, dict) and isinstance(previous, dict):
+                changed = _diff(value, previous)
+                if changed:
+                    delta[key] = changed
+            elif value != previous:
+                delta[key] = _snapshot(value)
+        return delta
+
+    def apply_delta(self, delta: Dict[str, Any]) -> None:
+        """
+        Update the display with only the status fields that changed.
+
+        The delta has the shape of a bridge status but holds just the changed
+        entries, nested sections included. Only the labels those entries feed
+        are touched. Unlike update_status(), deltas are shown immediately.
+
+        Args:
+            delta: Changed status fields
+        """
+        if not delta:
+            return
+
+        # A held-back older status must not overwrite this one when its timer fires
+        self._cancel_deferred()
+
+        # Malformed values are logged rather than allowed to break the UI;
+        # _render_delta() guards each section so one bad section spares the rest
         try:
-            # Update bridge status
-            running = status.get('running', False)
-            self.bridge_status.config(
-                text="Running" if running else "Stopped",
-                foreground="green" if running else "red"
-            )
-
-            # Update uptime
-            uptime_secs = self._safe_get_numeric(status, 'uptime', 0)
-            hours, remainder = divmod(int(uptime_secs), 3600)
-            minutes, seconds = divmod(remainder, 60)
-            self.uptime_value.config(text=f"{hours:02d}:{minutes:02d}:{seconds:02d}")
+            _merge(self._status, delta)
+        except _RENDER_ERRORS as e:
+            logger.error(f"Error merging status update: {e}")
+            return
 
-            # Update input UDP status
-            if 'input_udp' in status and status['input_udp']:
-                input_udp = status['input_udp']
+        self._render_delta(delta)
 
-                # Port
-                self.input_port.config(text=str(input_udp.get('port', 'Unknown')))
+    def _render_delta(self, delta: Dict[str, Any]) -> None:
+        """
+        Show the parts of the status on screen that a delta changed.
+
+        Args:
+            delta: Changed status fields, already merged into self._status
+        """
+        with self._batched_update():
+            sget = self._status.get
+            messages_processed = sget('messages_processed', 0)
+            messages_converted = sget('messages_converted', 0)
+
+            # Update bridge status, uptime and processing statistics
+            try:
+                if 'running' in delta:
+                    self._set_label(self.bridge_status, *_BRIDGE_STATES[bool(sget('running', False))])
+                if 'uptime' in delta:
+                    uptime_secs = sget('uptime') or 0
+                    self._set_label(self.uptime_value, self._formatted('uptime', int(uptime_secs), _format_uptime))
+                if 'messages_processed' in delta:
+                    self._set_label(self.messages_processed, str(messages_processed))
+                if 'messages_forwarded' in delta:
+                    self._set_label(self.messages_forwarded, str(sget('messages_forwarded', 0)))
+                if 'messages_converted' in delta:
+                    self._set_label(self.messages_converted, str(messages_converted))
+            except _RENDER_ERRORS as e:
+                logger.error(f"Error updating bridge status: {e}")
 
-                # Status with safe data activity check
-                if input_udp.get('running', False):
-                    if self._is_data_active(input_udp):
-                        self.input_udp_status.config(text="Active", foreground="green")
+            # Update input UDP status
+            input_udp = sget('input_udp')
+            if input_udp and 'input_udp' in delta:
+                try:
+                    iget = input_udp.get
+                    running = bool(iget('running', False))
+                    input_rate = iget('data_rate_mps') or 0.0
+
+                    # Port
+                    self._set_label(self.input_port, str(iget('port', 'Unknown')))
+
+                    # Status with safe data activity check
+                    if _data_active(running, _ago_bucket(iget('last_received_ago'))):
+                        state = 2
                     else:
-                        self.input_udp_status.config(text="No Data", foreground="orange")
-                else:
-                    self.input_udp_status.config(text="Stopped", foreground="red")
+                        state = int(running)
+                    self._set_label(self.input_udp_status, *_INPUT_STATES[state])
 
-                # Update data flow statistics
-                messages_received = input_udp.get('messages_received', 0)
-                self.messages_received.config(text=str(messages_received))
+                    # Update data flow statistics
+                    self._set_label(self.messages_received, str(iget('messages_received', 0)))
 
-                # Input rate
-                input_rate = self._safe_get_numeric(input_udp, 'data_rate_mps', 0)
-                self.input_rate.config(text=f"{input_rate:.1f} msg/sec")
+                    # Input rate
+                    self._set_label(self.input_rate, self._formatted('input_rate', round(input_rate, 1), _FMT_RATE))
+                except _RENDER_ERRORS as e:
+                    logger.error(f"Error updating input UDP status: {e}")
 
             # Update output UDP status
-            if 'output_udp' in status and status['output_udp']:
-                output_udp = status['output_udp']
-
-                # Target
-                host = output_udp.get('target_host', '127.0.0.1')
-                port = output_udp.get('target_port', 55300)
-                self.output_target.config(text=f"{host}:{port}")
-
-                # Status with safe data activity check
-                if output_udp.get('active', False):
-                    last_sent_ago = output_udp.get('last_sent_ago')
-                    if last_sent_ago is not None and last_sent_ago < 5.0:
-                        self.output_udp_status.config(text="Active", foreground="green")
+            output_udp = sget('output_udp')
+            if output_udp and 'output_udp' in delta:
+                try:
+                    oget = output_udp.get
+                    active = bool(oget('active', False))
+                    output_rate = oget('send_rate_mps') or 0.0
+
+                    # Target
+                    host = oget('target_host', '127.0.0.1')
+                    port = oget('target_port', 55300)
+                    self._set_label(self.output_target, _FMT_TARGET(host, port))
+
+                    # Status with safe data activity check
+                    if _data_active(active, _ago_bucket(oget('last_sent_ago'))):
+                        state = 2
                     else:
-                        self.output_udp_status.config(text="No Output", foreground="orange")
-                else:
-                    self.output_udp_status.config(text="Stopped", foreground="red")
-
-                # Output rate
-                output_rate = self._safe_get_numeric(output_udp, 'send_rate_mps', 0)
-                self.output_rate.config(text=f"{output_rate:.1f} msg/sec")
+                        state = int(active)
+                    self._set_label(self.output_udp_status, *_OUTPUT_STATES[state])
 
-            # Update processing statistics
-            self.messages_processed.config(text=str(status.get('messages_processed', 0)))
-            self.messages_forwarded.config(text=str(status.get('messages_forwarded', 0)))
-            self.messages_converted.config(text=str(status.get('messages_converted', 0)))
+                    # Output rate
+                    self._set_label(self.output_rate, self._formatted('output_rate', round(output_rate, 1), _FMT_RATE))
+                except _RENDER_ERRORS as e:
+                    logger.error(f"Error updating output UDP status: {e}")
 
             # Update conversion settings display
-            if 'conversion_settings' in status:
-                conv_settings = status['conversion_settings']
-
-                # Conversions enabled
-                enabled = conv_settings.get('enabled', False)
-                self.conversions_enabled.config(
-                    text="Enabled" if enabled else "Disabled",
-                    foreground="green" if enabled else "orange"
-                )
-
-                # Current units
-                self.altitude_unit.config(text=conv_settings.get('altitude', 'meters'))
-                self.speed_unit.config(text=conv_settings.get('speed', 'mps'))
-                self.vario_unit.config(text=conv_settings.get('vario', 'mps'))
-                self.accel_unit.config(text=conv_settings.get('acceleration', 'mps2'))
+            conv_settings = sget('conversion_settings')
+            if conv_settings is not None and 'conversion_settings' in delta:
+                try:
+                    cget = conv_settings.get
+
+                    # Conversions enabled
+                    self._set_label(self.conversions_enabled, *_CONVERSION_STATES[bool(cget('enabled', False))])
+
+                    # Current units
+                    self._set_label(self.altitude_unit, _unit_name(cget('altitude', 'meters')))
+                    self._set_label(self.speed_unit, _unit_name(cget('speed', 'mps')))
+                    self._set_label(self.vario_unit, _unit_name(cget('vario', 'mps')))
+                    self._set_label(self.accel_unit, _unit_name(cget('acceleration', 'mps2')))
+                except _RENDER_ERRORS as e:
+                    logger.error(f"Error updating conversion settings: {e}")
 
             # Update conversion statistics
-            if 'conversion_stats' in status:
-                conv_stats = status['conversion_stats']
-
-                # Total conversions
-                total_conv = conv_stats.get('total_conversions_applied', 0)
-                self.total_conversions.config(text=str(total_conv))
-
-                # Variables converted
-                variables = conv_stats.get('variables_converted', [])
-                if variables:
-                    var_text = ', '.join(variables) if len(variables) <= 5 else f"{', '.join(variables[:5])}..."
-                    self.variables_converted.config(text=var_text)
-                else:
-                    self.variables_converted.config(text="None")
-
-                # Conversion percentage
-                messages_processed = status.get('messages_processed', 0)
-                messages_converted = status.get('messages_converted', 0)
-                if messages_processed > 0:
-                    percentage = (messages_converted / messages_processed) * 100
-                    self.conversion_percentage.config(text=f"{percentage:.1f}%")
-                else:
-                    self.conversion_percentage.config(text="0%")
-
-                # Update sample conversion (if available in detailed stats)
-                self._update_sample_conversion(conv_stats)
-
-        except Exception as e:
-            # Log the error but don't crash the UI
-            logger.error(f"Error updating status panel: {e}")
+            conv_stats = sget('conversion_stats')
+            if conv_stats is not None:
+                try:
+                    if 'conversion_stats' in delta:
+                        stats_get = conv_stats.get
+
+                        # Total conversions
+                        self._set_label(self.total_conversions, str(stats_get('total_conversions_applied', 0)))
+
+                        # Variables converted
+                        variables = tuple(stats_get('variables_converted') or ())
+                        self._set_label(self.variables_converted,
+                                        self._formatted('variables', variables, _format_variables))
+
+                        # Update sample conversion (if available in detailed stats)
+                        self._update_sample_conversion(conv_stats)
+
+                    # Conversion percentage (from the top-level message counters)
+                    if 'messages_processed' in delta or 'messages_converted' in delta or 'conversion_stats' in delta:
+                        if messages_processed > 0:
+                            percentage = (messages_converted / messages_processed) * 100
+                            self._set_label(
+                                self.conversion_percentage,
+                                self._formatted('percentage', round(percentage, 1), _FMT_PCT)
+                            )
+                        else:
+                            self._set_label(self.conversion_percentage, "0%")
+                except _RENDER_ERRORS as e:
+                    logger.error(f"Error updating conversion statistics: {e}")
 
     def _update_sample_conversion(self, conv_stats: Dict[str, Any]) -> None:
         """Update the sample conversion display."""
-        try:
-            # This would ideally show a recent conversion example
-            # For now, we'll show a summary
-            sample_text = "Recent conversions:\n"
-
-            current_settings = conv_stats.get('current_settings', {})
-            if current_settings.get('enabled', False):
-                sample_text += f"• Altitude → {current_settings.get('altitude', 'meters')}\n"
-                sample_text += f"• Speed → {current_settings.get('speed', 'mps')}\n"
-                sample_text += f"• Vario → {current_settings.get('vario', 'mps')}\n"
-            else:
-                sample_text += "Conversions disabled\n"
-                sample_text += "Data passed through unchanged"
-
-            # Update text widget
-            self.sample_conversion.config(state=tk.NORMAL)
-            self.sample_conversion.delete('1.0', tk.END)
-            self.sample_conversion.insert('1.0', sample_text)
-            self.sample_conversion.config(state=tk.DISABLED)
-
-        except Exception as e:
-            logger.error(f"Error updating sample conversion: {e}")
+        current_settings = conv_stats.get('current_settings', {})
+        get = current_settings.get
+        key = (bool(get('enabled', False)), _unit_name(get('altitude', 'meters')),
+               _unit_name(get('speed', 'mps')), _unit_name(get('vario', 'mps')))
+        if key == self._last_sample_key:
+            return
+        self._last_sample_key = key
+
+        # This would ideally show a recent conversion example
+        # For now, we'll show a summary
+        sample_text = "Recent conversions:\n"
+
+        enabled, altitude, speed, vario = key
+        if enabled:
+            sample_text += f"• Altitude → {altitude}\n"
+            sample_text += f"• Speed → {speed}\n"
+            sample_text += f"• Vario → {vario}\n"
+        else:
+            sample_text += "Conversions disabled\n"
+            sample_text += "Data passed through unchanged"
+
+        # Update text widget
+        self._set_sample_text(sample_text)
 
     def reset_status(self) -> None:
         """Reset all status indicators to initial state."""
-        try:
-            # Reset bridge status
-            self.bridge_status.config(text="Stopped", foreground="red")
-            self.uptime_value.config(text="00:00:00")
-
-            # Reset UDP status
-            self.input_udp_status.config(text="Stopped", foreground="red")
-            self.output_udp_status.config(text="Stopped", foreground="red")
-            self.input_port.config(text="55278")
-            self.output_target.config(text="127.0.0.1:55300")
-
-            # Reset conversion settings
-            self.conversions_enabled.config(text="Disabled", foreground="orange")
-            self.altitude_unit.config(text="meters")
-            self.speed_unit.config(text="mps")
-            self.vario_unit.config(text="mps")
-            self.accel_unit.config(text="mps2")
-
-            # Reset statistics
-            self.messages_received.config(text="0")
-            self.messages_processed.config(text="0")
-            self.messages_forwarded.config(text="0")
-            self.messages_converted.config(text="0")
-            self.total_conversions.config(text="0")
-            self.variables_converted.config(text="None")
-            self.conversion_percentage.config(text="0%")
-
-            # Reset rates
-            self.input_rate.config(text="0.0 msg/sec")
-            self.output_rate.config(text="0.0 msg/sec")
-
-            # Reset sample conversion
-            self.sample_conversion.config(state=tk.NORMAL)
-            self.sample_conversion.delete('1.0', tk.END)
-            self.sample_conversion.insert('1.0', "No data - middleware stopped")
-            self.sample_conversion.config(state=tk.DISABLED)
-
-        except Exception as e:
-            logger.error(f"Error resetting status: {e}")
+        # A held-back running status must not overwrite the reset
+        self._cancel_deferred()
+        self._status = {}
+
+        with self._batched_update():
+            try:
+                # Reset bridge status
+                self._set_label(self.bridge_status, *_BRIDGE_STATES[False])
+                self._set_label(self.uptime_value, "00:00:00")
+
+                # Reset UDP status
+                self._set_label(self.input_udp_status, *_INPUT_STATES[0])
+                self._set_label(self.output_udp_status, *_OUTPUT_STATES[0])
+                self._set_label(self.input_port, "55278")
+                self._set_label(self.output_target, "127.0.0.1:55300")
+
+                # Reset conversion settings
+                self._set_label(self.conversions_enabled, *_CONVERSION_STATES[False])
+                self._set_label(self.altitude_unit, "meters")
+                self._set_label(self.speed_unit, "mps")
+                self._set_label(self.vario_unit, "mps")
+                self._set_label(self.accel_unit, "mps2")
+
+                # Reset statistics
+                self._set_label(self.messages_received, "0")
+                self._set_label(self.messages_processed, "0")
+                self._set_label(self.messages_forwarded, "0")
+                self._set_label(self.messages_converted, "0")
+                self._set_label(self.total_conversions, "0")
+                self._set_label(self.variables_converted, "None")
+                self._set_label(self.conversion_percentage, "0%")
+
+                # Reset rates
+                self._set_label(self.input_rate, "0.0 msg/sec")
+                self._set_label(self.output_rate, "0.0 msg/sec")
+
+                # Reset sample conversion
+                self._last_sample_key = None
+                self._set_sample_text("No data - middleware stopped")
+
+            except Exception as e:
+                logger.error(f"Error resetting status: {e}")
 
 
 # Example usage:
@@ -436,58 +754,80 @@ if __name__ == "__main__":
     notebook.add(status_panel.frame, text="Status")
 
 
-    # Simulate status updates
-    def update_test():
-        # Create a test status dictionary
-        import math
-        status = {
+    # Test status, allocated once and updated in place on each tick
+    _TEST_STATUS = {
+        "running": True,
+        "uptime": 0.0,
+        "error_count": 0,
+        "input_udp": {
+            "port": 55278,
             "running": True,
-            "uptime": time.time() % 3600,  # Cycle through an hour
-            "error_count": 0,
-            "input_udp": {
-                "port": 55278,
-                "running": True,
-                "messages_received": int(time.time() * 10) % 1000,
-                "data_rate_mps": 10.0 + 5.0 * math.sin(time.time() * 0.5),
-                "last_received_ago": 1.0,  # Active data
-            },
-            "output_udp": {
-                "target_host": "127.0.0.1",
-                "target_port": 55300,
-                "active": True,
-                "send_rate_mps": 9.8 + 4.0 * math.sin(time.time() * 0.7),
-                "last_sent_ago": 0.5,  # Active sending
-            },
-            "messages_processed": int(time.time() * 9.8) % 1000,
-            "messages_converted": int(time.time() * 7.5) % 800,
-            "messages_forwarded": int(time.time() * 9.5) % 950,
-            "conversion_settings": {
+            "messages_received": 0,
+            "data_rate_mps": 0.0,
+            "last_received_ago": 1.0,  # Active data
+        },
+        "output_udp": {
+            "target_host": "127.0.0.1",
+            "target_port": 55300,
+            "active": True,
+            "send_rate_mps": 0.0,
+            "last_sent_ago": 0.5,  # Active sending
+        },
+        "messages_processed": 0,
+        "messages_converted": 0,
+        "messages_forwarded": 0,
+        "conversion_settings": {
+            "enabled": True,
+            "altitude": "feet",
+            "speed": "knots",
+            "vario": "fpm",
+            "acceleration": "fps2"
+        },
+        "conversion_stats": {
+            "total_conversions_applied": 0,
+            "variables_converted": ["altitude", "airspeed", "vario"],
+            "current_settings": {
                 "enabled": True,
                 "altitude": "feet",
                 "speed": "knots",
-                "vario": "fpm",
-                "acceleration": "fps2"
-            },
-            "conversion_stats": {
-                "total_conversions_applied": int(time.time() * 15) % 2000,
-                "variables_converted": ["altitude", "airspeed", "vario"],
-                "current_settings": {
-                    "enabled": True,
-                    "altitude": "feet",
-                    "speed": "knots",
-                    "vario": "fpm"
-                }
+                "vario": "fpm"
             }
         }
+    }
+    _test_after_id = None
+
+    # Simulate status updates
+    def update_test():
+        global _test_after_id
+        import math
+        now = time.time()
+
+        # Only the changing fields are written
+        _TEST_STATUS["uptime"] = now % 3600  # Cycle through an hour
+        input_udp = _TEST_STATUS["input_udp"]
+        input_udp["messages_received"] = int(now * 10) % 1000
+        input_udp["data_rate_mps"] = 10.0 + 5.0 * math.sin(now * 0.5)
+        _TEST_STATUS["output_udp"]["send_rate_mps"] = 9.8 + 4.0 * math.sin(now * 0.7)
+        _TEST_STATUS["messages_processed"] = int(now * 9.8) % 1000
+        _TEST_STATUS["messages_converted"] = int(now * 7.5) % 800
+        _TEST_STATUS["messages_forwarded"] = int(now * 9.5) % 950
+        _TEST_STATUS["conversion_stats"]["total_conversions_applied"] = int(now * 15) % 2000
 
         # Update the panel
-        status_panel.update_status(status)
+        status_panel.update_status(_TEST_STATUS)
+
+        # Schedule next update (one pending timer at a time)
+        _test_after_id = root.after(1000, update_test)
+
 
-        # Schedule next update
-        root.after(1000, update_test)
+    def close_test():
+        if _test_after_id is not None:
+            root.after_cancel(_test_after_id)
+        root.destroy()
 
 
     # Start updates
+    root.protocol("WM_DELETE_WINDOW", close_test)
     update_test()
 
-    root.mainloop()
\ No newline at end of file
+    root.mainloop()
@@ -12,7 +12,6 @@ import argparse
 import logging
 import asyncio
 import signal
-import tkinter as tk
 from typing import Optional
 
 # Add current directory to path
@@ -22,12 +21,13 @@ sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), 'cond
 from condor_udp_middleware.core.log_config import configure_logging
 from condor_udp_middleware.core.bridge import UDPMiddlewareBridge
 from condor_udp_middleware.core.settings import MiddlewareSettings
-from condor_udp_middleware.gui.main_window import MiddlewareMainWindow
 
 # Configure initial logging
 configure_logging(level=logging.INFO)
 logger = logging.getLogger('main')
 
+CLI_STATUS_INTERVAL = 30  # Seconds between status log entries in CLI mode
+
 
 def parse_arguments():
     """Parse command line arguments."""
@@ -95,8 +95,8 @@ async def run_cli(bridge: UDPMiddlewareBridge):
     
     def signal_handler():
         logger.info("Shutdown signal received")
+        # run_cli() returns once the bridge reports that it has stopped
         loop.create_task(bridge.stop())
-        loop.stop()
     
     for sig in (signal.SIGINT, signal.SIGTERM):
         loop.add_signal_handler(sig, signal_handler)
@@ -104,36 +104,53 @@ async def run_cli(bridge: UDPMiddlewareBridge):
     # Start bridge
     await bridge.start()
     
+    status_task = asyncio.create_task(_log_status_periodically(bridge))
     try:
         logger.info("Middleware running, press Ctrl+C to stop")
         
-        # Keep running until stopped
+        # Keep running until stopped (a settings reload restarts the bridge in place)
         while bridge.running:
-            await asyncio.sleep(1)
-            
-            # Log status periodically
-            if int(asyncio.get_event_loop().time()) % 30 == 0:  # Every 30 seconds
-                status = bridge.get_status()
-                
-                logger.info(f"Middleware Status:")
-                logger.info(f"- Running for {status['uptime']:.1f} seconds")
-                logger.info(f"- Input UDP: {status['input_udp']['bound'] if status['input_udp'] else 'Disabled'}")
-                logger.info(f"- Output UDP: {status['output_udp']['active'] if status['output_udp'] else 'Disabled'}")
-                logger.info(f"- Messages converted: {status.get('messages_converted', 0)}")
-                logger.info(f"- Data active: {status['data_active']}")
+            await bridge.stopped_event.wait()
     
     except asyncio.CancelledError:
         # Handle cancellation
         pass
     
     finally:
+        status_task.cancel()
+        
         # Ensure bridge is stopped
         if bridge.running:
             await bridge.stop()
+        bridge.close()
         
         logger.info("Middleware stopped, exiting")
 
 
+async def _log_status_periodically(bridge: UDPMiddlewareBridge):
+    """
+    Log the middleware status every CLI_STATUS_INTERVAL seconds.
+    
+    Args:
+        bridge: Bridge instance
+    """
+    while True:
+        await asyncio.sleep(CLI_STATUS_INTERVAL)
+        
+        # Skip building the status when it would not be logged
+        if not logger.isEnabledFor(logging.INFO):
+            continue
+        
+        status = bridge.get_status()
+        
+        logger.info(f"Middleware Status:")
+        logger.info(f"- Running for {status['uptime']:.1f} seconds")
+        logger.info(f"- Input UDP: {status['input_udp']['bound'] if status['input_udp'] else 'Disabled'}")
+        logger.info(f"- Output UDP: {status['output_udp']['active'] if status['output_udp'] else 'Disabled'}")
+        logger.info(f"- Messages converted: {status.get('messages_converted', 0)}")
+        logger.info(f"- Data active: {status['data_active']}")
+
+
 def run_gui(args):
     """
     Run the middleware in GUI mode.
@@ -143,6 +160,10 @@ def run_gui(args):
     """
     logger.info("Starting Condor UDP Middleware in GUI mode")
     
+    # GUI modules are imported here so CLI mode never loads tkinter
+    import tkinter as tk
+    from condor_udp_middleware.gui.main_window import MiddlewareMainWindow
+    
     # Create root window
     root = tk.Tk()
     
@@ -158,8 +179,9 @@ def run_gui(args):
         # Start minimized
         root.iconify()
     
-    # Run the application
+    # Run the application, then let the bridge loop wind down off the Tk thread
     root.mainloop()
+    app.wait_for_shutdown()
 
 
 def main():
@@ -0,0 +1,111 @@
+#!/usr/bin/env python3
+
+"""
+Tests for the unit converter.
+
+Part of the Condor UDP Middleware project.
+"""
+
+import unittest
+
+from condor_udp_middleware.core.converter import UnitConverter, VARIABLE_BITS
+
+
+# Conversion settings that leave every value as Condor sends it
+METRIC_SETTINGS = {
+    "enabled": True,
+    "altitude": "meters",
+    "speed": "mps",
+    "vario": "mps",
+    "acceleration": "mps2"
+}
+
+# Conversion settings that convert every variable type
+IMPERIAL_SETTINGS = {
+    "enabled": True,
+    "altitude": "feet",
+    "speed": "knots",
+    "vario": "fpm",
+    "acceleration": "fps2"
+}
+
+
+class ConvertMessageTest(unittest.TestCase):
+    """UnitConverter.convert_message()."""
+
+    def test_converts_each_variable_type(self):
+        converter = UnitConverter(IMPERIAL_SETTINGS)
+        message = b'time=17.5\naltitude=100\nairspeed=10\nvario=2\naz=1\n'
+
+        converted, conversions, converted_mask = converter.convert_message(message)
+
+        self.assertEqual(
+            converted,
+            b'time=17.5\r\naltitude=328.084\r\nairspeed=19.4384\r\nvario=393.7\r\naz=3.28084\r\n'
+        )
+        self.assertEqual(conversions, 4)
+        self.assertEqual(
+            converted_mask,
+            VARIABLE_BITS['altitude'] | VARIABLE_BITS['airspeed'] | VARIABLE_BITS['vario'] | VARIABLE_BITS['az']
+        )
+
+    def test_converted_values_round_trip(self):
+        to_feet = UnitConverter(dict(IMPERIAL_SETTINGS))
+        converted, _, _ = to_feet.convert_message(b'altitude=1234.5\r\n')
+
+        key, _, value = converted.strip().partition(b'=')
+        self.assertEqual(key, b'altitude')
+        self.assertAlmostEqual(float(value) * 0.3048, 1234.5, places=3)
+
+    def test_unconverted_message_is_forwarded_unchanged(self):
+        converter = UnitConverter(METRIC_SETTINGS)
+        message = b'time=1.5\nairspeed = 10 \n'
+
+        converted, conversions, converted_mask = converter.convert_message(message)
+
+        self.assertIs(converted, message)
+        self.assertEqual(conversions, 0)
+        self.assertEqual(converted_mask, 0)
+
+    def test_malformed_value_is_kept_and_others_converted(self):
+        converter = UnitConverter(IMPERIAL_SETTINGS)
+
+        converted, conversions, _ = converter.convert_message(b'altitude=abc\nairspeed=10\n')
+
+        self.assertEqual(converted, b'altitude=abc\r\nairspeed=19.4384\r\n')
+        self.assertEqual(conversions, 1)
+
+    def test_invalid_message_is_forwarded_unchanged(self):
+        converter = UnitConverter(IMPERIAL_SETTINGS)
+        message = b'altitude=100;drop\n'
+
+        converted, conversions, _ = converter.convert_message(message)
+
+        self.assertIs(converted, message)
+        self.assertEqual(conversions, 0)
+
+    def test_statistics_are_left_to_the_caller(self):
+        converter = UnitConverter(IMPERIAL_SETTINGS)
+
+        _, conversions, converted_mask = converter.convert_message(b'altitude=100\n')
+        self.assertEqual(converter.get_statistics()["total_conversions_applied"], 0)
+
+        converter.record_statistics(conversions, converted_mask)
+        stats = converter.get_statistics()
+        self.assertEqual(stats["total_conversions_applied"], 1)
+        self.assertEqual(stats["variables_converted"], ['altitude'])
+
+
+class ConvertibleVariablesTest(unittest.TestCase):
+    """UnitConverter.get_convertible_variables()."""
+
+    def test_lists_convertible_keys_in_order(self):
+        converter = UnitConverter(METRIC_SETTINGS)
+
+        variables = converter.get_convertible_variables(b'time=1\nvario=2\naltitude=3\n')
+
+        self.assertEqual(variables, ['vario', 'altitude'])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,65 @@
+#!/usr/bin/env python3
+
+"""
+Loopback tests for the middleware UDP receiver and sender.
+
+Part of the Condor UDP Middleware project.
+"""
+
+import asyncio
+import unittest
+from unittest import mock
+
+from condor_udp_middleware.core import bridge
+from condor_udp_middleware.core.bridge import MiddlewareUDPReceiver, MiddlewareUDPSender
+
+RECEIVE_TIMEOUT = 2.0  # Seconds to wait for looped-back datagrams
+
+
+class UDPLoopbackTest(unittest.IsolatedAsyncioTestCase):
+    """Datagrams sent by MiddlewareUDPSender arrive intact at MiddlewareUDPReceiver."""
+
+    async def _loopback(self, payloads):
+        received = []
+        arrived = asyncio.Event()
+
+        def on_data(data):
+            received.append(data)
+            if len(received) == len(payloads):
+                arrived.set()
+
+        receiver = MiddlewareUDPReceiver(host='127.0.0.1', port=0, data_callback=on_data)
+        self.assertTrue(await receiver.start_receiving())
+        self.addCleanup(receiver.close)
+
+        sender = MiddlewareUDPSender('127.0.0.1', receiver.socket.getsockname()[1])
+        self.assertTrue(sender.start_sending())
+        self.addCleanup(sender.close)
+
+        self.assertEqual(sender.send_batch(payloads[:-1]), len(payloads) - 1)
+        self.assertTrue(sender.send_message(payloads[-1]))
+
+        await asyncio.wait_for(arrived.wait(), RECEIVE_TIMEOUT)
+        self.assertEqual(receiver.messages_received, len(payloads))
+        self.assertEqual(sender.messages_sent, len(payloads))
+        return received
+
+    async def test_batched_send_and_receive(self):
+        payloads = [b'altitude=%d\r\nairspeed=10\r\n' % i for i in range(10)]
+
+        self.assertEqual(await self._loopback(payloads), payloads)
+
+    async def test_datagram_larger_than_8k(self):
+        payloads = [b'time=1\r\n' + b'x' * 20000, b'time=2\r\n']
+
+        self.assertEqual(await self._loopback(payloads), payloads)
+
+    async def test_fallback_paths(self):
+        payloads = [b'vario=%d\r\n' % i for i in range(5)]
+
+        with mock.patch.object(bridge, 'HAVE_RECVMMSG', False), mock.patch.object(bridge, 'HAVE_SENDMMSG', False):
+            self.assertEqual(await self._loopback(payloads), payloads)
+
+
+if __name__ == "__main__":
+    unittest.main()